@@ -1,9 +1,7 @@
+import importlib
 from pathlib import Path
+from typing import Any
 
-from everest_models.everest_hooks import (
-    get_forward_models_schemas,
-    parse_forward_model_schema,
-)
 from everest_models.logger import set_up_logger
 
 __all__ = [
@@ -21,3 +19,15 @@ try:
     __version__ = version
 except ImportError:
     __version__ = "0.0.0"
+
+
+def __getattr__(name: str) -> Any:
+    # The plugin hooks import pydantic and the job schemas, only load them when
+    # asked for, so the forward model jobs start quickly
+    if name in __all__:
+        return getattr(importlib.import_module("everest_models.everest_hooks"), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
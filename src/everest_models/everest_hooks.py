@@ -5,10 +5,11 @@ This project uses the plugin management library [pluggy](https://pluggy.readthed
 to expose its functions
 """
 
+import argparse
+import functools
 import logging
 from collections.abc import Sequence
 from importlib import import_module
-from importlib.resources import files
 from pathlib import Path
 from typing import Any
 
@@ -30,7 +31,41 @@ JOBS = "everest_models.jobs"
 
 
 def _get_jobs():
-    return (job.name for job in files(JOBS).iterdir() if job.name.startswith("fm_"))
+    return (f"fm_{job}" for job in get_forward_models())
+
+
+@functools.cache
+def _forward_models_schemas() -> dict[str, type[BaseModel]]:
+    res = {}
+    for job in _get_jobs():
+        schema = getattr(import_module(f"{JOBS}.{job}.parser"), "SCHEMAS", None)
+        if schema:
+            res[job.removeprefix("fm_")] = schema.get("-c/--config") or schema.get(
+                "config"
+            )
+    return res
+
+
+@functools.cache
+def _forward_model_documentations() -> dict[str, dict[str, Any]]:
+    docs: dict[str, dict[str, Any]] = {}
+    for job in _get_jobs():
+        cli = import_module(f"{JOBS}.{job}.cli")
+        docs[job.removeprefix("fm_")] = {
+            "cmd_name": job,
+            "examples": getattr(cli, "EXAMPLES", None),
+            "full_job_name": getattr(cli, "FULL_JOB_NAME", job),
+        }
+    return docs
+
+
+@functools.cache
+def _skip_type_parser(job: str) -> argparse.ArgumentParser:
+    parser = import_module(f"{JOBS}.fm_{job}.parser").build_argument_parser(
+        skip_type=True
+    )
+    parser.prog = f"fm_{job}"
+    return parser
 
 
 @hookimpl
@@ -49,15 +84,10 @@ def get_forward_models_schemas() -> dict[str, dict[str, type[BaseModel]]]:
             },
             ...
         }
+
+    The schemas are collected once per process.
     """
-    res = {}
-    for job in _get_jobs():
-        schema = getattr(import_module(f"{JOBS}.{job}.parser"), "SCHEMAS", None)
-        if schema:
-            res[job.removeprefix("fm_")] = schema.get("-c/--config") or schema.get(
-                "config"
-            )
-    return res
+    return dict(_forward_models_schemas())
 
 
 @hookimpl
@@ -97,28 +127,17 @@ def lint_forward_model(job: str, args: Sequence[str]) -> list[str]:
 
 @hookimpl
 def get_forward_model_documentations() -> dict[str, Any]:
-    docs: dict[str, Any] = {}
-    for job in _get_jobs():
-        cmd_name = job
-        full_job_name = getattr(
-            import_module(f"{JOBS}.{job}.cli"), "FULL_JOB_NAME", cmd_name
-        )
-        examples = getattr(import_module(f"{JOBS}.{job}.cli"), "EXAMPLES", None)
-        docs[job.removeprefix("fm_")] = {
-            "cmd_name": cmd_name,
-            "examples": examples,
-            "full_job_name": full_job_name,
-        }
-    return docs
+    return {
+        job: dict(documentation)
+        for job, documentation in _forward_model_documentations().items()
+    }
 
 
 @hookimpl
 def check_forward_model_arguments(forward_model_steps: list[str]) -> None:
+    forward_models = get_forward_models()
     for step in forward_model_steps:
         step_name, *args = step.split()
-        if step_name in get_forward_models():
-            parser = import_module(
-                f"{JOBS}.fm_{step_name}.parser"
-            ).build_argument_parser(skip_type=True)
-            parser.prog = f"fm_{step_name}"
-            parser.parse_args(args)
+        if step_name in forward_models:
+            # Parsers without argument types hold no state between calls
+            _skip_type_parser(step_name).parse_args(args)
@@ -1,3 +1,4 @@
+import functools
 from importlib import resources
 from importlib.util import find_spec
 from typing import Final
@@ -5,13 +6,23 @@ from typing import Final
 _HAVE_ERT: Final = find_spec("ert") is not None
 
 
+@functools.cache
+def _forward_models() -> tuple[str, ...]:
+    return tuple(
+        sorted(
+            job.name[3:]
+            for job in resources.files("everest_models.jobs").iterdir()
+            if job.name.startswith("fm_")
+        )
+    )
+
+
 def get_forward_models() -> list[str]:
-    """Return the list of forward model names."""
-    return [
-        job.name[3:]
-        for job in resources.files("everest_models.jobs").iterdir()
-        if job.name.startswith("fm_")
-    ]
+    """Return the list of forward model names.
+
+    The jobs directory is only scanned once per process.
+    """
+    return list(_forward_models())
 
 
 if _HAVE_ERT:  # The everest-models package should remain installable without ERT.
@@ -1,21 +1,5 @@
-from everest_models.jobs import (
-    fm_add_templates,
-    fm_compute_economics,
-    fm_drill_date_planner,
-    fm_drill_planner,
-    fm_extract_summary_data,
-    fm_interpret_well_drill,
-    fm_npv,
-    fm_rf,
-    fm_schmerge,
-    fm_select_wells,
-    fm_stea,
-    fm_strip_dates,
-    fm_well_constraints,
-    fm_well_filter,
-    fm_well_swapping,
-    fm_well_trajectory,
-)
+import importlib
+from typing import Any
 
 __all__ = [
     "fm_add_templates",
@@ -26,6 +10,7 @@ __all__ = [
     "fm_interpret_well_drill",
     "fm_npv",
     "fm_rf",
+    "fm_schedule_pipeline",
     "fm_schmerge",
     "fm_select_wells",
     "fm_stea",
@@ -35,3 +20,15 @@ __all__ = [
     "fm_well_trajectory",
     "fm_well_swapping",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Jobs are imported on first access, a job should not pay for the imports
+    # of all other jobs when it is started
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -3,11 +3,10 @@ import logging
 from collections.abc import Iterable
 
 from everest_models.jobs.shared.converters import path_to_str
-from everest_models.jobs.shared.models import Well
 
 from .config_model import Template
 from .parser import build_argument_parser
-from .tasks import insert_template_with_matching_well_operation
+from .tasks import add_templates_to_wells
 
 logger = logging.getLogger(__name__)
 
@@ -24,19 +23,6 @@ def _duplicate_template_msg(templates: Iterable[Template]) -> str:
     )
 
 
-def _no_template_msg(wells: Iterable[Well]) -> str:
-    return "\n".join(
-        f"Well: {well.name}\n{sub_str}"
-        for well in wells
-        if (
-            sub_str := "\n".join(
-                f"\toperation: {name}\tdate: {date}"
-                for name, date in well.missing_templates
-            )
-        )
-    )
-
-
 def main_entry_point(args=None):
     args_parser = build_argument_parser()
     options = args_parser.parse_args(args)
@@ -46,22 +32,7 @@ def main_entry_point(args=None):
     if options.lint:
         args_parser.exit()
 
-    consumed_templates = insert_template_with_matching_well_operation(
-        options.config.templates, options.input
-    )
-
-    if unutilized := ", ".join(
-        map(
-            path_to_str,
-            {template.file for template in options.config.templates}
-            - set(consumed_templates),
-        )
-    ):
-        logger.warning(
-            f"Template(s) not inserted:\n\t{unutilized}\n\tPlease, check insertion keys!"
-        )
-
-    if msg := _no_template_msg(options.input):
+    if msg := add_templates_to_wells(options.config.templates, options.input):
         args_parser.error("No template matched:\n" + msg)
 
     options.input.json_dump(options.output)
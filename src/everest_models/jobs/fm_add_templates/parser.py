@@ -2,13 +2,13 @@ from functools import partial
 
 from everest_models.jobs.fm_add_templates.config_model import TemplateConfig
 from everest_models.jobs.shared.arguments import (
-    SchemaAction,
     add_output_argument,
     add_wells_input_argument,
     bootstrap_parser,
     get_parser,
 )
 from everest_models.jobs.shared.models import Wells
+from everest_models.jobs.shared.parsers import SchemaAction
 from everest_models.jobs.shared.validators import parse_file
 
 _CONFIG_ARGUMENT = "-c/--config"
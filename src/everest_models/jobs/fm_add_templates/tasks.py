@@ -1,7 +1,10 @@
-import itertools
+import collections
+import heapq
 import logging
-from collections.abc import Iterator, Sequence
+from collections.abc import Iterable, Iterator, Sequence
+from operator import itemgetter
 from pathlib import Path
+from typing import Any
 
 from everest_models.jobs.shared.converters import path_to_str
 from everest_models.jobs.shared.models import Operation, Well
@@ -10,12 +13,50 @@ from .config_model import Template
 
 logger = logging.getLogger(__name__)
 
+_NO_PHASE = object()
+
+type TemplateIndex = dict[
+    tuple[str | None, Any], list[tuple[int, Template, dict[str, Any]]]
+]
+
+
+def _operation_keys(operation: Operation) -> dict[str, Any]:
+    return {"opname": operation.opname, **operation.tokens}
+
+
+def index_templates(templates: Sequence[Template]) -> TemplateIndex:
+    """Index templates by the operation name and phase they match.
+
+    Templates without an operation name are indexed under `None`, and match any
+    operation name. Keys besides the operation name and phase are kept as a
+    residual filter, next to the template's position in the configuration.
+
+    Args:
+        templates (Sequence[Template]): template configurations
+
+    Returns:
+        TemplateIndex: <(opname, phase), [(position, template, residual keys)]> mapping
+    """
+    index: TemplateIndex = collections.defaultdict(list)
+    for position, template in enumerate(templates):
+        residual = {
+            key: value
+            for key, value in template.keys.items()
+            if key not in {"opname", "phase"}
+        }
+        index[
+            template.keys.get("opname"), template.keys.get("phase", _NO_PHASE)
+        ].append((position, template, residual))
+    return index
+
 
 def collect_matching(
     templates: Sequence[Template], wells: Sequence[Well]
 ) -> Iterator[tuple[str, Operation, Template]]:
     """Collect data from template and well model, where template's keys and well's operation match.
 
+    Matching templates of an operation are yielded in configuration order.
+
     Args:
         templates (TemplateConfig): template configuration model
         wells (Wells): well model
@@ -23,13 +64,20 @@ def collect_matching(
     Yields:
         Iterator[Tuple[str, Operation, TemplateConfig]]: well name, matching well operations and template
     """
+    index = index_templates(templates)
     for well in wells:
-        for operation, template in (
-            (x, y)
-            for x, y in itertools.product(well.operations, templates)
-            if y.matching_keys(x)
-        ):
-            yield well.name, operation, template
+        for operation in well.operations:
+            keys = _operation_keys(operation)
+            phase = keys.get("phase", _NO_PHASE)
+            candidates = index.get((keys["opname"], phase), ())
+            if wildcards := index.get((None, phase)):
+                candidates = heapq.merge(candidates, wildcards, key=itemgetter(0))
+            for _, template, residual in candidates:
+                if all(
+                    key in keys and keys[key] == value
+                    for key, value in residual.items()
+                ):
+                    yield well.name, operation, template
 
 
 def add_templates(well_name: str, operation: Operation, template: Template) -> Path:
@@ -58,3 +106,43 @@ def insert_template_with_matching_well_operation(
         for well_name, operation, template in collect_matching(templates, wells)
         if not operation.template
     )
+
+
+def _no_template_msg(wells: Iterable[Well]) -> str:
+    return "\n".join(
+        f"Well: {well.name}\n{sub_str}"
+        for well in wells
+        if (
+            sub_str := "\n".join(
+                f"\toperation: {name}\tdate: {date}"
+                for name, date in well.missing_templates
+            )
+        )
+    )
+
+
+def add_templates_to_wells(templates: Sequence[Template], wells: Sequence[Well]) -> str:
+    """Insert matching templates for all well operations without a template.
+
+    Templates that were not inserted for any operation are logged as a warning.
+
+    Args:
+        templates (Sequence[Template]): template configurations
+        wells (Sequence[Well]): wells to insert templates into
+
+    Returns:
+        str: description of operations left without a template, empty if none
+    """
+    consumed_templates = set(
+        insert_template_with_matching_well_operation(templates, wells)
+    )
+    if unutilized := ", ".join(
+        map(
+            path_to_str,
+            {template.file for template in templates} - consumed_templates,
+        )
+    ):
+        logger.warning(
+            f"Template(s) not inserted:\n\t{unutilized}\n\tPlease, check insertion keys!"
+        )
+    return _no_template_msg(wells)
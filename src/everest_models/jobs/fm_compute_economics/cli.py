@@ -1,8 +1,14 @@
 import argparse
 import logging
 
+from everest_models.jobs.fm_compute_economics.ensemble import (
+    evaluate_ensemble,
+    find_runpaths,
+    write_ensemble_table,
+)
 from everest_models.jobs.fm_compute_economics.manager import create_indicator
 from everest_models.jobs.fm_compute_economics.parser import build_argument_parser
+from everest_models.jobs.shared.cash_flows import write_cash_flows
 from everest_models.jobs.shared.models import Wells
 from everest_models.jobs.shared.validators import parse_file
 
@@ -36,6 +42,10 @@ def _overwrite_economic_indicator_config(
             options.config.output.file = (
                 value[index] if isinstance(value, tuple) else value
             )
+        elif field == "timeseries":
+            options.config.output.timeseries = (
+                value[index] if isinstance(value, tuple) else value
+            )
         elif field == "output_currency":
             options.config.output.currency = (
                 value[index] if isinstance(value, tuple) else value
@@ -62,6 +72,22 @@ def main_entry_point(args=None):
             "must always be paired; one of the two is missing."
         )
 
+    if options.calculation != "npv" and (
+        options.timeseries or options.config.output.timeseries
+    ):
+        args_parser.error(
+            "--timeseries argument and config file key 'output.timeseries' "
+            "are only supported by the npv calculation."
+        )
+
+    if options.ensemble and (options.timeseries or options.config.output.timeseries):
+        args_parser.error(
+            "--timeseries argument and config file key 'output.timeseries' "
+            "are not supported for an --ensemble."
+        )
+    if options.ensemble and "<IENS>" not in options.ensemble:
+        args_parser.error("--ensemble runpath must contain the <IENS> placeholder.")
+
     if options.lint:
         args_parser.exit()
 
@@ -74,21 +100,42 @@ def main_entry_point(args=None):
         "ref_date",
         "output",
         "output_currency",
+        "timeseries",
     ):
         _overwrite_economic_indicator_config(options, field)
 
     logger.info(f"Initializing economic_indicator calculation with options {options}")
-    economic_indicator = create_indicator(
-        options.calculation, config=options.config
-    ).compute(
-        {
-            well.name: well.completion_date or well.readydate
-            for well in (
-                parse_file(options.config.wells_input, Wells)
-                if options.config.wells_input
-                else {}
-            )
-        }
-    )
+    well_dates = {
+        well.name: well.completion_date or well.readydate
+        for well in (
+            parse_file(options.config.wells_input, Wells)
+            if options.config.wells_input
+            else {}
+        )
+    }
+    if options.ensemble:
+        if not (runpaths := find_runpaths(options.ensemble)):
+            args_parser.error(f"No runpaths found for the ensemble: {options.ensemble}")
+        write_ensemble_table(
+            evaluate_ensemble(
+                runpaths,
+                options.calculation,
+                options.config,
+                well_dates,
+                options.workers,
+            ),
+            options.calculation,
+            options.config.output.file,
+        )
+        return
+
+    calculator = create_indicator(options.calculation, config=options.config)
+    economic_indicator = calculator.compute(well_dates)
 
     options.config.output.file.write_text(f"{economic_indicator:.2f}")
+    if options.config.output.timeseries:
+        write_cash_flows(
+            calculator.summary.keys,
+            calculator.cash_flows(),
+            options.config.output.timeseries,
+        )
@@ -24,6 +24,13 @@ class OutputConfig(ModelConfig):
     currency_rate: Annotated[
         tuple[CurrencyRate, ...], Field(default=None, description="")
     ]
+    timeseries: Annotated[
+        Path,
+        Field(
+            default=None,
+            description="CSV file for the per date contributions to the NPV",
+        ),
+    ]
 
 
 class OilEquivalentConversionConfig(ModelConfig):
@@ -0,0 +1,159 @@
+import csv
+import datetime
+import glob
+import logging
+import re
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+
+from .economic_indicator_config_model import EconomicIndicatorConfig
+from .manager import create_indicator
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["evaluate_ensemble", "find_runpaths", "write_ensemble_table"]
+
+_PLACEHOLDERS = {"<IENS>": "realization", "<ITER>": "iteration"}
+
+# Petroleum convention, Px is the value exceeded by x% of the realizations
+STATISTICS = {
+    "mean": np.mean,
+    "P10": partial(np.percentile, q=90),
+    "P50": partial(np.percentile, q=50),
+    "P90": partial(np.percentile, q=10),
+}
+
+
+def find_runpaths(template: str) -> list[tuple[int, int, Path]]:
+    """Find the runpaths of an ensemble.
+
+    Args:
+        template (str): ERT runpath, e.g. 'simulations/realization-<IENS>/iter-<ITER>'
+
+    Raises:
+        ValueError: The template has no <IENS> placeholder
+
+    Returns:
+        list[tuple[int, int, Path]]: (iteration, realization, runpath), sorted;
+            iteration 0 if the template has no <ITER> placeholder
+    """
+    parts = re.split("(<IENS>|<ITER>)", template)
+    if "<IENS>" not in parts:
+        raise ValueError(f"Runpath template without <IENS> placeholder: {template}")
+    groups: set[str] = set()
+    regex = ""
+    for part in parts:
+        if (group := _PLACEHOLDERS.get(part)) is None:
+            regex += re.escape(part)
+        elif group in groups:
+            regex += f"(?P={group})"
+        else:
+            regex += rf"(?P<{group}>\d+)"
+            groups.add(group)
+    pattern = re.compile(regex)
+    return sorted(
+        (
+            int(match.groupdict().get("iteration", 0)),
+            int(match["realization"]),
+            Path(path),
+        )
+        for path in glob.glob(
+            "".join(
+                "*" if part in _PLACEHOLDERS else glob.escape(part) for part in parts
+            )
+        )
+        if (match := pattern.fullmatch(path)) and Path(path).is_dir()
+    )
+
+
+def _evaluate(
+    runpath: Path,
+    calculation: str,
+    config: EconomicIndicatorConfig,
+    well_dates: dict[str, datetime.date],
+) -> float | None:
+    summary = config.summary.model_copy(update={"main": runpath / config.summary.main})
+    try:
+        return create_indicator(
+            calculation, config.model_copy(update={"summary": summary})
+        ).compute(well_dates)
+    except (AttributeError, OSError) as e:
+        logger.warning(f"Realization skipped, {e}")
+        return None
+
+
+def _map(
+    function: Callable[[Path], float | None], paths: list[Path], workers: int | None
+) -> Iterator[float | None]:
+    if workers == 1 or len(paths) < 2:
+        yield from map(function, paths)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(function, paths)
+
+
+def evaluate_ensemble(
+    runpaths: Iterable[tuple[int, int, Path]],
+    calculation: str,
+    config: EconomicIndicatorConfig,
+    well_dates: dict[str, datetime.date],
+    workers: int | None = None,
+) -> Iterator[tuple[int, int, float | None]]:
+    """Compute the economic indicator of every realization of an ensemble.
+
+    The main summary file of the config is relative to each runpath, the
+    reference summary is shared by all realizations. Realizations are streamed
+    through a pool of worker processes, each loading one summary at a time.
+    Realizations whose summary cannot be read or lacks the keys get no value.
+
+    Args:
+        runpaths (Iterable[tuple[int, int, Path]]): (iteration, realization, runpath)
+        calculation (str): economic indicator, 'npv' or 'bep'
+        config (EconomicIndicatorConfig): economic indicator config
+        well_dates (dict[str, date]): well completion dates
+        workers (int | None): number of worker processes, default: number of CPUs
+
+    Returns:
+        Iterator[tuple[int, int, float | None]]: (iteration, realization, value),
+            value None if the summary of the realization could not be used
+    """
+    runpaths = list(runpaths)
+    values = _map(
+        partial(
+            _evaluate, calculation=calculation, config=config, well_dates=well_dates
+        ),
+        [path for *_, path in runpaths],
+        workers,
+    )
+    for (iteration, realization, _), value in zip(runpaths, values, strict=True):
+        yield iteration, realization, value
+
+
+def write_ensemble_table(
+    results: Iterable[tuple[int, int, float | None]], name: str, path: Path
+) -> None:
+    """Write the values per realization and their statistics to a CSV file.
+
+    Rows hold the iteration, the realization and its value, as they are computed.
+    They are followed by the mean, P10, P50 and P90 of the values per iteration,
+    named in the realization column. Px is the value exceeded by x% of the
+    realizations; realizations without a value are left out.
+    """
+    values: defaultdict[int, list[float]] = defaultdict(list)
+    with path.open("w", encoding="utf-8", newline="") as fp:
+        writer = csv.writer(fp)
+        writer.writerow(("iteration", "realization", name))
+        for iteration, realization, value in results:
+            writer.writerow((iteration, realization, "" if value is None else value))
+            if value is not None:
+                values[iteration].append(value)
+        writer.writerows(
+            (iteration, statistic, round(float(function(values[iteration])), 2))
+            for iteration in sorted(values)
+            for statistic, function in STATISTICS.items()
+        )
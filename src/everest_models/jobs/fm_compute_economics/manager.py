@@ -9,6 +9,9 @@ from typing import Any, Protocol
 from resdata.summary import Summary
 from resdata.util.util import TimeVector
 
+from everest_models.jobs.shared.cash_flows import CashFlow, cash_flows
+from everest_models.jobs.shared.models.economics import Rate, rate_records
+
 from .economic_indicator_config_model import EconomicIndicatorConfig
 
 logger = logging.getLogger(__name__)
@@ -19,22 +22,12 @@ __all__ = ["EconomicIndicatorCalculatorABC"]
 CONVERTION_CUBIC_METERS_TO_BBL = 6.289814
 
 
-class Rate(Protocol):
-    date: datetime.date
-    value: float
-    currency: str
-
-
 class Production(Protocol):
     def blocked_production(self, totalKey, timeRange): ...
 
 
-def _rate_sort_reverse_dates(rates: Iterable[Rate]) -> Iterable[Rate]:
-    return sorted(rates, key=lambda rate: rate.date, reverse=True)
-
-
 def _get_rate(rates: Iterable[Rate], date: datetime.date, default: float) -> float:
-    for rate in _rate_sort_reverse_dates(rates):
+    for rate in rates:  # latest first
         if rate.date <= date:
             return rate.value
     return default
@@ -118,12 +111,29 @@ class EconomicIndicatorCalculatorABC(ABC):
     def __init__(self, config: EconomicIndicatorConfig) -> None:
         self.config = config
         self.summary = EclipseSummary(config)
+        # Rates are looked up for every day, sort them once:
+        self._prices = {
+            keyword: rate_records(rates) for keyword, rates in config.prices.items()
+        }
+        self._exchange_rates = {
+            currency: rate_records(rates)
+            for currency, rates in config.exchange_rates.items()
+        }
+        self._discount_rates = rate_records(config.discount_rates)
+        self._output_currency_rates = (
+            None
+            if config.output.currency_rate is None
+            else rate_records(config.output.currency_rate)
+        )
+        # (date, value(s), discount divisor) of the last computation
+        self._revenues: list[tuple[datetime.date, tuple[float, ...], float]] = []
+        self._costs: list[tuple[datetime.date, float, float]] = []
 
     def _get_output_exchange_rate(self, date: datetime.date) -> float:
-        if self.config.output.currency_rate is None:
+        if self._output_currency_rates is None:
             return self.config.default_exchange_rate
         return _get_rate(
-            itertools.chain(self.config.output.currency_rate),
+            self._output_currency_rates,
             date,
             self.config.default_exchange_rate,
         )
@@ -136,20 +146,21 @@ class EconomicIndicatorCalculatorABC(ABC):
             return self.config.default_exchange_rate * to_output
         return (
             _get_rate(
-                itertools.chain(self.config.exchange_rates.get(currency, [])),
+                self._exchange_rates.get(currency, ()),
                 date,
                 self.config.default_exchange_rate,
             )
             * to_output
         )
 
-    def _discount(self, economic_indicator: float, date: datetime.date) -> float:
+    def _discount_divisor(self, date: datetime.date) -> float:
         discount_rate = _get_rate(
-            self.config.discount_rates, date, self.config.default_discount_rate
-        )
-        return economic_indicator / (1 + discount_rate) ** (
-            (date - self.ref_date).days / 365.25
+            self._discount_rates, date, self.config.default_discount_rate
         )
+        return (1 + discount_rate) ** ((date - self.ref_date).days / 365.25)
+
+    def _discount(self, economic_indicator: float, date: datetime.date) -> float:
+        return economic_indicator / self._discount_divisor(date)
 
     def _get_dates(self) -> tuple[datetime.date, datetime.date, datetime.date]:
         start, end, _ = self.summary.dates
@@ -187,7 +198,10 @@ class EconomicIndicatorCalculatorABC(ABC):
                 else [],
             )
 
-        return sum(self._discount(*cost) for cost in get_costs())
+        self._costs = [
+            (date, cost, self._discount_divisor(date)) for cost, date in get_costs()
+        ]
+        return sum(cost / divisor for _, cost, divisor in self._costs)
 
     @abstractmethod
     def _compute(
@@ -205,12 +219,10 @@ class EconomicIndicatorCalculatorABC(ABC):
 
 class NPVCalculator(EconomicIndicatorCalculatorABC):
     def _get_price(self, date: datetime.date, keyword: str) -> float | None:
-        if keyword not in self.config.prices:
+        if keyword not in self._prices:
             raise AttributeError(f"Price information missing for {keyword}")
 
-        for tariff in _rate_sort_reverse_dates(
-            itertools.chain(self.config.prices[keyword]),
-        ):
+        for tariff in self._prices[keyword]:
             if tariff.date <= date:
                 return self._get_exchange_rate(date, tariff.currency) * tariff.value
 
@@ -219,18 +231,20 @@ class NPVCalculator(EconomicIndicatorCalculatorABC):
 
     def _extract_discounted_prices(self, time_range: TimeVector) -> float:
         blocked_productions = self.summary.get_delta_blocked_productions(time_range)
-        return sum(
-            self._discount(
-                sum(
-                    blocked_productions[keyword][index] * transaction
+        self._revenues = [
+            (
+                date,
+                tuple(
+                    0.0
+                    if (transaction := self._get_price(date, keyword)) is None
+                    else blocked_productions[keyword][index] * transaction
                     for keyword in self.summary.keys
-                    if (transaction := self._get_price(date.date(), keyword))
-                    is not None
                 ),
-                date.date(),
+                self._discount_divisor(date),
             )
-            for index, date in enumerate(time_range[1:])
-        )
+            for index, date in enumerate(time.date() for time in time_range[1:])
+        ]
+        return sum(sum(values) / divisor for _, values, divisor in self._revenues)
 
     def _compute(
         self,
@@ -242,6 +256,12 @@ class NPVCalculator(EconomicIndicatorCalculatorABC):
             self.summary.main.time_range(start, end, interval="1d")
         ) - self._extract_discounted_costs(well_dates)
 
+    def cash_flows(self) -> tuple[CashFlow, ...]:
+        """Per date contributions to the NPV of the last computation."""
+        return cash_flows(
+            self.summary.keys, self._revenues, self._costs, self.config.multiplier
+        )
+
 
 class BEPCalculator(EconomicIndicatorCalculatorABC):
     def __init__(self, config: EconomicIndicatorConfig) -> None:
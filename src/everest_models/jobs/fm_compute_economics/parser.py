@@ -1,12 +1,17 @@
 from functools import partial
 
 from everest_models.jobs.shared.arguments import (
-    SchemaAction,
     add_output_argument,
     bootstrap_parser,
     get_parser,
 )
-from everest_models.jobs.shared.validators import parse_file, valid_iso_date
+from everest_models.jobs.shared.parsers import SchemaAction
+from everest_models.jobs.shared.validators import (
+    is_gt_zero,
+    is_writable_path,
+    parse_file,
+    valid_iso_date,
+)
 
 from .economic_indicator_config_model import EconomicIndicatorConfig
 
@@ -45,6 +50,29 @@ def build_argument_parser(skip_type=False):
         help="Path to output-file where the economical indicators result is written to.",
         skip_type=skip_type,
     )
+    parser.add_argument(
+        "--timeseries",
+        type=is_writable_path if not skip_type else str,
+        help="Path to a CSV file where the contributions to the NPV are written to, "
+        "per date: revenue per summary key, costs, discount factor and cumulative NPV.",
+    )
+    parser.add_argument(
+        "--ensemble",
+        metavar="RUNPATH",
+        help="Runpath of an ensemble, e.g. 'simulations/realization-<IENS>/iter-<ITER>'. "
+        "The indicator is computed for every realization, with the main summary file "
+        "of the config relative to each runpath and the reference summary shared by "
+        "all realizations, and the output file is a CSV table of "
+        "the values per realization, with their mean, P10, P50 and P90 per iteration.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=partial(is_gt_zero, msg="workers must be a positive number")
+        if not skip_type
+        else str,
+        help="Number of worker processes computing the realizations of an ensemble "
+        "(default: number of CPUs).",
+    )
     parser.add_argument(
         "--output-currency",
         required=False,
@@ -1,3 +1,11 @@
-from everest_models.jobs.fm_drill_date_planner.cli import main_entry_point
+import importlib
+from typing import Any
 
 __all__ = ["main_entry_point"]
+
+
+def __getattr__(name: str) -> Any:
+    # The cli, and with it the job dependencies, is only imported when run
+    if name in __all__:
+        return getattr(importlib.import_module(f"{__name__}.cli"), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
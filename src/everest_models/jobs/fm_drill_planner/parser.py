@@ -2,12 +2,12 @@ from functools import partial
 
 from everest_models.jobs.fm_drill_planner.models import DrillPlanConfig, Wells
 from everest_models.jobs.shared.arguments import (
-    SchemaAction,
     add_output_argument,
     add_wells_input_argument,
     bootstrap_parser,
     get_parser,
 )
+from everest_models.jobs.shared.parsers import SchemaAction
 from everest_models.jobs.shared.validators import parse_file, valid_input_file
 
 _CONFIG_ARGUMENT = "-c/--config"
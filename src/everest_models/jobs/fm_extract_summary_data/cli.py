@@ -1,9 +1,11 @@
 import logging
 
-from everest_models.jobs.fm_extract_summary_data.parser import args_parser
+from everest_models.jobs.fm_extract_summary_data.parser import build_argument_parser
 from everest_models.jobs.fm_extract_summary_data.tasks import (
     extract_value,
+    extract_values,
     validate_arguments,
+    validate_extractions,
 )
 
 logger = logging.getLogger(__name__)
@@ -12,10 +14,50 @@ FULL_JOB_NAME = "Extract summary data"
 
 
 def main_entry_point(args=None):
+    args_parser = build_argument_parser()
     options = args_parser.parse_args(args)
-    validate_arguments(options)
+    if options.config is not None:
+        if given := [
+            name
+            for name, value in (
+                ("-o/--output", options.output),
+                ("-sd/--start-date", options.start_date),
+                ("-ed/--end-date", options.end_date),
+                ("-k/--key", options.key),
+            )
+            if value is not None
+        ]:
+            args_parser.error(
+                f"argument -c/--config: not allowed with {', '.join(given)}"
+            )
+        validate_extractions(options.summary, options.config.extractions)
+    else:
+        if missing := [
+            name
+            for name, value in (
+                ("-o/--output", options.output),
+                ("-ed/--end-date", options.end_date),
+                ("-k/--key", options.key),
+            )
+            if value is None
+        ]:
+            args_parser.error(
+                "the following arguments are required without -c/--config: "
+                + ", ".join(missing)
+            )
+        validate_arguments(options)
     if options.lint:
         args_parser.exit()
+
+    if options.config is not None:
+        extractions = options.config.extractions
+        logger.info(f"Extracting {len(extractions)} values from the summary")
+        for extraction, value in zip(
+            extractions, extract_values(options.summary, extractions), strict=True
+        ):
+            extraction.output.write_text(f"{value:.10f}")
+        return
+
     if options.start_date is None:
         logger.info(f"Extracting key {options.key} for single date {options.end_date}")
 
@@ -0,0 +1,50 @@
+from datetime import date
+from pathlib import Path
+from typing import Annotated, Literal, Self
+
+from pydantic import Field, model_validator
+
+from everest_models.jobs.shared.models import ModelConfig
+
+
+class Extraction(ModelConfig):
+    key: Annotated[str, Field(description="Eclipse summary key")]
+    start_date: Annotated[
+        date | None,
+        Field(
+            default=None,
+            description="Start date, if not specified the value for the end date "
+            "is extracted",
+        ),
+    ]
+    end_date: Annotated[
+        date,
+        Field(
+            description="End date for the summary key interval or date for which "
+            "to extract a summary key value"
+        ),
+    ]
+    type: Annotated[
+        Literal["max", "diff"],
+        Field(default="diff", description="Range calculation type to use"),
+    ]
+    multiplier: Annotated[float, Field(default=1.0, description="Result multiplier")]
+    output: Annotated[Path, Field(description="Output file")]
+
+    @model_validator(mode="after")
+    def start_before_end(self) -> Self:
+        if self.start_date is not None and self.start_date > self.end_date:
+            raise ValueError(
+                f"Start date '{self.start_date}' is after end date '{self.end_date}'."
+            )
+        return self
+
+
+class ExtractionConfig(ModelConfig):
+    extractions: Annotated[
+        tuple[Extraction, ...],
+        Field(
+            min_length=1,
+            description="Values to extract from the summary, each to its own file",
+        ),
+    ]
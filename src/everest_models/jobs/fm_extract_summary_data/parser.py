@@ -1,24 +1,40 @@
+from functools import partial
+
+from everest_models.jobs.fm_extract_summary_data.config_model import ExtractionConfig
 from everest_models.jobs.fm_extract_summary_data.tasks import CalculationType
 from everest_models.jobs.shared.arguments import (
-    add_lint_argument,
     add_output_argument,
     add_summary_argument,
+    bootstrap_parser,
     get_parser,
 )
-from everest_models.jobs.shared.validators import valid_iso_date
+from everest_models.jobs.shared.parsers import SchemaAction
+from everest_models.jobs.shared.validators import parse_file, valid_iso_date
+
+CONFIG_ARGUMENT = "-c/--config"
+SCHEMAS = {CONFIG_ARGUMENT: ExtractionConfig}
 
 
+@bootstrap_parser
 def build_argument_parser(skip_type=False):
+    SchemaAction.register_models(SCHEMAS)
     description = "Module to extract Eclipse Summary keyword data for single date or date interval"
     parser, requird_group = get_parser(description=description)
 
     add_summary_argument(requird_group, skip_type=skip_type)
     add_output_argument(
-        requird_group,
-        help="Output file",
+        parser,
+        required=False,
+        help="Output file, required without -c/--config",
         skip_type=skip_type,
     )
-    add_lint_argument(parser)
+    parser.add_argument(
+        *CONFIG_ARGUMENT.split("/"),
+        type=partial(parse_file, schema=ExtractionConfig) if not skip_type else str,
+        help="Config file listing many extractions, each with its key, dates, "
+        "type, multiplier and output file. The summary is loaded once for all "
+        "of them. Replaces the single extraction arguments.",
+    )
     parser.add_argument(
         "-sd",
         "--start-date",
@@ -26,17 +42,19 @@ def build_argument_parser(skip_type=False):
         help="Start date, if not specified the module will write to the output "
         "file a single summary key value for the specified end date",
     )
-    requird_group.add_argument(
+    parser.add_argument(
         "-ed",
         "--end-date",
         "--date",
         type=valid_iso_date,
-        required=True,
         help="End date for the summary key interval or date for which to "
-        "extract a summary key value",
+        "extract a summary key value, required without -c/--config",
     )
-    requird_group.add_argument(
-        "-k", "--key", type=str, required=True, help="Eclipse summary key"
+    parser.add_argument(
+        "-k",
+        "--key",
+        type=str,
+        help="Eclipse summary key, required without -c/--config",
     )
     parser.add_argument(
         "-t",
@@ -51,6 +69,3 @@ def build_argument_parser(skip_type=False):
     )
 
     return parser
-
-
-args_parser = build_argument_parser()
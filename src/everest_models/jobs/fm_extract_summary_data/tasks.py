@@ -1,11 +1,15 @@
 import argparse
 import datetime
 import logging
+from collections.abc import Iterator, Sequence
 from enum import Enum
 
 import numpy as np
+from numpy.typing import NDArray
 from resdata.summary import Summary
 
+from .config_model import Extraction
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,16 +29,51 @@ def extract_value(
     return summary.get_interp(key, date=end_date)
 
 
+def _summary_days(summary: Summary) -> NDArray[np.datetime64]:
+    return summary.numpy_dates.astype("datetime64[D]")
+
+
+def _step_bounds(
+    times: NDArray[np.datetime64],
+    start_dates: Sequence[datetime.date],
+    end_dates: Sequence[datetime.date],
+) -> tuple[NDArray[np.intp], NDArray[np.intp]]:
+    """Bounds of the time steps from midnight of the start date to midnight of
+    the end date, inclusive, per interval."""
+    return (
+        np.searchsorted(
+            times, np.array(start_dates, dtype="datetime64[D]").astype(times.dtype)
+        ),
+        np.searchsorted(
+            times,
+            np.array(end_dates, dtype="datetime64[D]").astype(times.dtype),
+            "right",
+        ),
+    )
+
+
+def _window_max(
+    summary: Summary,
+    key: str,
+    steps: NDArray[np.float64],
+    start_date: datetime.date,
+    end_date: datetime.date,
+) -> float:
+    # The summary values are linear or constant between time steps, the maximum
+    # is at a time step inside the interval or at one of its ends
+    return max(
+        np.max(steps, initial=-np.inf),
+        summary.get_interp(key, date=start_date),
+        summary.get_interp(key, date=end_date),
+    )
+
+
 def _extract_max(
     summary: Summary, key: str, start_date: datetime.date, end_date: datetime.date
 ) -> float:
-    return np.max(
-        summary.numpy_vector(
-            key,
-            time_index=summary.time_range(
-                start=start_date, end=end_date, interval="1d"
-            ),
-        )
+    (start,), (end,) = _step_bounds(summary.numpy_dates, [start_date], [end_date])
+    return _window_max(
+        summary, key, summary.numpy_vector(key)[start:end], start_date, end_date
     )
 
 
@@ -106,3 +145,90 @@ def validate_arguments(options: argparse.Namespace) -> argparse.Namespace:
     if errors:
         raise argparse.ArgumentTypeError("\n".join(errors))
     return options
+
+
+def validate_extractions(
+    summary: Summary, extractions: Sequence[Extraction]
+) -> Sequence[Extraction]:
+    """Validate that all extractions can be made from the eclipse summary.
+
+    Args:
+        summary (Summary): eclipse summary
+        extractions (Sequence[Extraction]): extractions from a config file
+
+    Raises:
+        argparse.ArgumentTypeError: If any extraction fails validation
+
+    Returns:
+        Sequence[Extraction]: the extractions
+    """
+    errors = [
+        f"Missing required data {key} in summary file."
+        for key in dict.fromkeys(extraction.key for extraction in extractions)
+        if key not in summary
+    ]
+    dates = sorted(
+        {
+            date
+            for extraction in extractions
+            for date in (extraction.start_date, extraction.end_date)
+            if date is not None
+        }
+    )
+    available = np.isin(np.array(dates, dtype="datetime64[D]"), _summary_days(summary))
+    missing = {date for date, found in zip(dates, available, strict=True) if not found}
+    for extraction in extractions:
+        if extraction.start_date in missing:
+            errors.append(
+                f"{extraction.output}: Start date '{extraction.start_date}' "
+                "is not part of the simulation report dates"
+            )
+        if extraction.end_date in missing:
+            errors.append(
+                f"{extraction.output}: End date '{extraction.end_date}' "
+                "is not part of the simulation report dates"
+            )
+    if errors:
+        raise argparse.ArgumentTypeError("\n".join(errors))
+    return extractions
+
+
+def extract_values(
+    summary: Summary, extractions: Sequence[Extraction]
+) -> Iterator[float]:
+    """Extract the values of many extractions from an eclipse summary.
+
+    The time steps of all intervals are found at once, and the vector of each
+    key is read once.
+
+    Args:
+        summary (Summary): eclipse summary
+        extractions (Sequence[Extraction]): extractions from a config file
+
+    Returns:
+        Iterator[float]: value of each extraction, multiplied by its multiplier
+    """
+    starts, ends = _step_bounds(
+        summary.numpy_dates,
+        [extraction.start_date or extraction.end_date for extraction in extractions],
+        [extraction.end_date for extraction in extractions],
+    )
+    vectors: dict[str, NDArray[np.float64]] = {}
+    for extraction, start, end in zip(extractions, starts, ends, strict=True):
+        if extraction.start_date is None:
+            value = extract_value(summary, extraction.key, extraction.end_date)
+        elif extraction.type == CalculationType.MAX.value:
+            if extraction.key not in vectors:
+                vectors[extraction.key] = summary.numpy_vector(extraction.key)
+            value = _window_max(
+                summary,
+                extraction.key,
+                vectors[extraction.key][start:end],
+                extraction.start_date,
+                extraction.end_date,
+            )
+        else:
+            value = _extract_diff(
+                summary, extraction.key, extraction.start_date, extraction.end_date
+            )
+        yield value * extraction.multiplier
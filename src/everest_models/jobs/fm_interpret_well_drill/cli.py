@@ -1,7 +1,7 @@
 import json
 import logging
 
-from everest_models.jobs.fm_interpret_well_drill.parser import args_parser
+from everest_models.jobs.fm_interpret_well_drill.parser import build_argument_parser
 
 logger = logging.getLogger(__name__)
 
@@ -9,6 +9,7 @@ FULL_JOB_NAME = "Interpret well drill"
 
 
 def main_entry_point(args=None):
+    args_parser = build_argument_parser()
     options = args_parser.parse_args(args)
     if not all(type(value) in (float, int) for value in options.input.values()):
         args_parser.error(
@@ -3,6 +3,7 @@ import logging
 
 from everest_models.jobs.fm_npv.manager import NPVCalculator
 from everest_models.jobs.fm_npv.parser import build_argument_parser
+from everest_models.jobs.shared.cash_flows import write_cash_flows
 
 logger = logging.getLogger(__name__)
 
@@ -130,9 +131,14 @@ def main_entry_point(args=None):
 
     logger.info(f"Initializing npv calculation with options {options}")
     inputs = options.input or []
-    npv = NPVCalculator(config=options.config, summary=options.summary).compute(
+    calculator = NPVCalculator(config=options.config, summary=options.summary)
+    npv = calculator.compute(
         {well.name: well.completion_date or well.readydate for well in inputs},
         {well.name: well.length or 0.0 for well in inputs},
     )
 
     options.output.write_text(f"{npv:.2f}")
+    if options.timeseries:
+        write_cash_flows(
+            calculator.keywords, calculator.cash_flows(), options.timeseries
+        )
@@ -2,12 +2,12 @@ import datetime
 import itertools
 import logging
 from collections.abc import Callable, Iterable
-from typing import Protocol
 
 from resdata.summary import Summary
 from resdata.util.util import TimeVector
 
-from everest_models.jobs.shared.models.economics import WellCost
+from everest_models.jobs.shared.cash_flows import CashFlow, cash_flows
+from everest_models.jobs.shared.models.economics import Rate, WellCost, rate_records
 
 from .npv_config import NPVConfig
 
@@ -16,17 +16,8 @@ logger = logging.getLogger(__name__)
 __all__ = ["NPVCalculator"]
 
 
-class Rate(Protocol):
-    date: datetime.date
-    value: float
-
-
-def _rate_sort_reverse_dates(rates: Iterable[Rate]) -> Iterable[Rate]:
-    return sorted(rates, key=lambda rate: rate.date, reverse=True)
-
-
 def _get_rate(rates: Iterable[Rate], date: datetime.date, default: float) -> float:
-    for rate in _rate_sort_reverse_dates(rates):
+    for rate in rates:  # latest first
         if rate.date <= date:
             return rate.value
     return default
@@ -57,21 +48,33 @@ class NPVCalculator:
         self.keywords = _get_keywords(
             config.summary_keys, lambda key: not summary.has_key(key)
         )
+        # Rates are looked up for every day, sort them once:
+        self._prices = {
+            keyword: rate_records(rates) for keyword, rates in config.prices.items()
+        }
+        self._exchange_rates = {
+            currency: rate_records(rates)
+            for currency, rates in config.exchange_rates.items()
+        }
+        self._discount_rates = rate_records(config.discount_rates)
+        # (date, value(s), discount divisor) of the last computation
+        self._revenues: list[tuple[datetime.date, tuple[float, ...], float]] = []
+        self._costs: list[tuple[datetime.date, float, float]] = []
 
     def _get_exchange_rate(self, date: datetime.date, currency: str = None) -> float:
         if currency is None:
             return self.config.default_exchange_rate
         return _get_rate(
-            itertools.chain(self.config.exchange_rates.get(currency, [])),
+            self._exchange_rates.get(currency, ()),
             date,
             self.config.default_exchange_rate,
         )
 
-    def _discount_npv(self, npv: float, date: datetime.date) -> float:
+    def _discount_divisor(self, date: datetime.date) -> float:
         discount_rate = _get_rate(
-            self.config.discount_rates, date, self.config.default_discount_rate
+            self._discount_rates, date, self.config.default_discount_rate
         )
-        return npv / (1 + discount_rate) ** ((date - self.ref_date).days / 365.25)
+        return (1 + discount_rate) ** ((date - self.ref_date).days / 365.25)
 
     def _extract_costs(
         self, well_dates: dict[str, datetime.date], well_lengths: dict[str, float]
@@ -98,15 +101,16 @@ class NPVCalculator:
                 else [],
             )
 
-        return sum(self._discount_npv(*cost) for cost in get_costs())
+        self._costs = [
+            (date, cost, self._discount_divisor(date)) for cost, date in get_costs()
+        ]
+        return sum(cost / divisor for _, cost, divisor in self._costs)
 
     def _get_price(self, date: datetime.date, keyword: str) -> float:
-        if keyword not in self.config.prices:
+        if keyword not in self._prices:
             raise AttributeError(f"Price information missing for {keyword}")
 
-        for tariff in _rate_sort_reverse_dates(
-            itertools.chain(self.config.prices[keyword]),
-        ):
+        for tariff in self._prices[keyword]:
             if tariff.date <= date:
                 return self._get_exchange_rate(date, tariff.currency) * tariff.value
 
@@ -118,18 +122,20 @@ class NPVCalculator:
             keyword: self.summary.blocked_production(keyword, time_range)
             for keyword in self.keywords
         }
-        return sum(
-            self._discount_npv(
-                sum(
-                    blocked_productions[keyword][index] * transaction
+        self._revenues = [
+            (
+                date,
+                tuple(
+                    0.0
+                    if (transaction := self._get_price(date, keyword)) is None
+                    else blocked_productions[keyword][index] * transaction
                     for keyword in self.keywords
-                    if (transaction := self._get_price(date.date(), keyword))
-                    is not None
                 ),
-                date.date(),
+                self._discount_divisor(date),
             )
-            for index, date in enumerate(time_range[1:])
-        )
+            for index, date in enumerate(time.date() for time in time_range[1:])
+        ]
+        return sum(sum(values) / divisor for _, values, divisor in self._revenues)
 
     def _get_dates(self) -> tuple[datetime.date, datetime.date, datetime.date]:
         return (
@@ -167,3 +173,9 @@ class NPVCalculator:
             * self.config.multiplier,
             2,
         )
+
+    def cash_flows(self) -> tuple[CashFlow, ...]:
+        """Per date contributions to the NPV of the last computation."""
+        return cash_flows(
+            self.keywords, self._revenues, self._costs, self.config.multiplier
+        )
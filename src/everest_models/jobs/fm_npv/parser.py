@@ -1,14 +1,18 @@
 from functools import partial
 
 from everest_models.jobs.shared.arguments import (
-    SchemaAction,
     add_output_argument,
     add_summary_argument,
     add_wells_input_argument,
     bootstrap_parser,
     get_parser,
 )
-from everest_models.jobs.shared.validators import parse_file, valid_iso_date
+from everest_models.jobs.shared.parsers import SchemaAction
+from everest_models.jobs.shared.validators import (
+    is_writable_path,
+    parse_file,
+    valid_iso_date,
+)
 
 from .npv_config import NPVConfig
 
@@ -41,6 +45,12 @@ def build_argument_parser(skip_type=False):
         help="Path to output-file where the NPV result is written to.",
         skip_type=skip_type,
     )
+    parser.add_argument(
+        "--timeseries",
+        type=is_writable_path if not skip_type else str,
+        help="Path to a CSV file where the contributions to the NPV are written to, "
+        "per date: revenue per summary key, costs, discount factor and cumulative NPV.",
+    )
     required_group.add_argument(
         *CONFIG_ARGUMENT.split("/"),
         required=True,
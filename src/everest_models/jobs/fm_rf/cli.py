@@ -1,6 +1,6 @@
 import logging
 
-from everest_models.jobs.fm_rf.parser import args_parser
+from everest_models.jobs.fm_rf.parser import build_argument_parser
 from everest_models.jobs.fm_rf.tasks import recovery_factor
 
 logger = logging.getLogger(__name__)
@@ -9,6 +9,7 @@ FULL_JOB_NAME = "Recovery factor"
 
 
 def main_entry_point(args=None):
+    args_parser = build_argument_parser()
     options = args_parser.parse_args(args)
 
     if options.lint:
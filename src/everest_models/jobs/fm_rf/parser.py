@@ -50,6 +50,3 @@ def build_argument_parser(skip_type=False):
         help="Start date - As ISO8601 formatted date (YYYY-MM-DD)",
     )
     return parser
-
-
-args_parser = build_argument_parser()
@@ -0,0 +1,4 @@
+from everest_models.jobs.fm_schedule_pipeline import cli
+
+if __name__ == "__main__":
+    cli.main_entry_point()
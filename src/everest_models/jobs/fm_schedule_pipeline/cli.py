@@ -0,0 +1,52 @@
+import argparse
+import logging
+
+from everest_models.jobs.fm_schedule_pipeline.parser import build_argument_parser
+from everest_models.jobs.fm_schedule_pipeline.tasks import prepare_steps, run_pipeline
+
+logger = logging.getLogger(__name__)
+
+FULL_JOB_NAME = "Schedule pipeline"
+
+EXAMPLES = """
+Argument examples
+~~~~~~~~~~~~~~~~~
+
+:code:`-config` example
+
+.. code-block:: yaml
+
+    steps:
+      - drill_planner:
+          config: drill_planner_config.yml
+          optimizer: optimizer_values.yml
+      - well_constraints:
+          config: well_constraint_config.yml
+          rate_constraints: rate_input.json
+      - add_templates:
+          config: template_config.yml
+      - schmerge:
+          schedule: raw_schedule.sch
+
+"""
+
+
+def main_entry_point(args=None):
+    args_parser = build_argument_parser()
+    options = args_parser.parse_args(args)
+
+    try:
+        steps = prepare_steps(options.config, options.output)
+    except argparse.ArgumentTypeError as e:
+        args_parser.error(str(e))
+
+    if options.lint:
+        args_parser.exit()
+
+    if options.dump_intermediate is not None:
+        options.dump_intermediate.mkdir(parents=True, exist_ok=True)
+
+    try:
+        run_pipeline(steps, options.input, options.dump_intermediate)
+    except ValueError as e:
+        args_parser.error(str(e))
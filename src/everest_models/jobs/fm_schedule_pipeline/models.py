@@ -0,0 +1,113 @@
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Annotated
+
+from pydantic import Field, FilePath, model_validator
+
+from everest_models.jobs.shared.models import ModelConfig
+
+
+class DrillPlannerStep(ModelConfig):
+    config: Annotated[FilePath, Field(description="Drill planner configuration file")]
+    optimizer: Annotated[
+        FilePath, Field(description="Optimizer file with the well priority values")
+    ]
+    time_limit: Annotated[
+        int, Field(default=3600, description="Maximum time limit for the solver")
+    ]
+    ignore_end_date: Annotated[
+        bool, Field(default=False, description="Ignore the end date in the config file")
+    ]
+
+
+class WellFilterStep(ModelConfig):
+    keep: Annotated[
+        FilePath,
+        Field(default=None, description="File with a list of well names to keep"),
+    ]
+    remove: Annotated[
+        FilePath,
+        Field(default=None, description="File with a list of well names to remove"),
+    ]
+
+    @model_validator(mode="after")
+    def keep_or_remove(self) -> "WellFilterStep":
+        if (self.keep is None) == (self.remove is None):
+            raise ValueError("Either 'keep' or 'remove' must be given")
+        return self
+
+
+class WellConstraintsStep(ModelConfig):
+    config: Annotated[
+        FilePath, Field(description="Well constraints configuration file")
+    ]
+    rate_constraints: Annotated[
+        FilePath, Field(default=None, description="Rate constraints file")
+    ]
+    phase_constraints: Annotated[
+        FilePath, Field(default=None, description="Phase constraints file")
+    ]
+    duration_constraints: Annotated[
+        FilePath, Field(default=None, description="Duration constraints file")
+    ]
+
+
+class AddTemplatesStep(ModelConfig):
+    config: Annotated[FilePath, Field(description="Add templates configuration file")]
+
+
+class SchmergeStep(ModelConfig):
+    schedule: Annotated[
+        FilePath, Field(description="Schedule file to inject templates into")
+    ]
+    template_cache: Annotated[
+        Path,
+        Field(default=None, description="Directory to keep compiled templates in"),
+    ]
+
+
+class Step(ModelConfig):
+    drill_planner: Annotated[DrillPlannerStep, Field(default=None, description="")]
+    well_filter: Annotated[WellFilterStep, Field(default=None, description="")]
+    well_constraints: Annotated[
+        WellConstraintsStep, Field(default=None, description="")
+    ]
+    add_templates: Annotated[AddTemplatesStep, Field(default=None, description="")]
+    schmerge: Annotated[SchmergeStep, Field(default=None, description="")]
+
+    @model_validator(mode="after")
+    def single_job(self) -> "Step":
+        if len(self.model_fields_set) != 1:
+            raise ValueError(
+                f"A step must hold exactly one of: {', '.join(type(self).model_fields)}"
+            )
+        return self
+
+    @property
+    def job(self) -> str:
+        return next(iter(self.model_fields_set))
+
+    @property
+    def options(self) -> ModelConfig:
+        return getattr(self, self.job)
+
+
+class PipelineConfig(ModelConfig):
+    steps: Annotated[
+        tuple[Step, ...],
+        Field(
+            description="Jobs to run in order on the wells, the last one must be 'schmerge'",
+            min_length=1,
+        ),
+    ]
+
+    @model_validator(mode="after")
+    def ends_with_schmerge(self) -> "PipelineConfig":
+        if [step.job for step in self.steps].count("schmerge") != 1 or (
+            self.steps[-1].job != "schmerge"
+        ):
+            raise ValueError("'schmerge' must be the last step, and occur only once")
+        return self
+
+    def __iter__(self) -> Iterator[Step]:  # type: ignore
+        return iter(self.steps)
@@ -0,0 +1,51 @@
+import argparse
+from functools import partial
+from pathlib import Path
+
+from everest_models.jobs.fm_schedule_pipeline.models import PipelineConfig
+from everest_models.jobs.shared.arguments import (
+    add_output_argument,
+    add_wells_input_argument,
+    bootstrap_parser,
+    get_parser,
+)
+from everest_models.jobs.shared.models import Wells
+from everest_models.jobs.shared.parsers import SchemaAction
+from everest_models.jobs.shared.validators import parse_file
+
+_CONFIG_ARGUMENT = "-c/--config"
+SCHEMAS = {_CONFIG_ARGUMENT: PipelineConfig}
+
+
+@bootstrap_parser
+def build_argument_parser(skip_type=False) -> argparse.ArgumentParser:
+    SchemaAction.register_models(SCHEMAS)
+    parser, required_group = get_parser(
+        description="Run a sequence of the drill_planner, well_filter, "
+        "well_constraints, add_templates and schmerge jobs in a single process. "
+        "The wells are passed from job to job in memory, and only the final "
+        "schedule is written."
+    )
+    add_wells_input_argument(
+        required_group,
+        schema=Wells,
+        help="File containing information related to wells (wells.json).",
+        skip_type=skip_type,
+    )
+    add_output_argument(
+        required_group,
+        help="File path to write the resulting schedule file to.",
+        skip_type=skip_type,
+    )
+    required_group.add_argument(
+        *_CONFIG_ARGUMENT.split("/"),
+        required=True,
+        type=partial(parse_file, schema=PipelineConfig) if not skip_type else str,
+        help="Configuration file listing the jobs to run and their input files.",
+    )
+    parser.add_argument(
+        "--dump-intermediate",
+        type=Path,
+        help="Directory to write the wells to after every step, for debugging.",
+    )
+    return parser
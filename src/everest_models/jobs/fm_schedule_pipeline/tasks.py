@@ -0,0 +1,179 @@
+import argparse
+import logging
+from collections.abc import Callable, Sequence
+from pathlib import Path
+
+from everest_models.jobs.fm_add_templates.config_model import TemplateConfig
+from everest_models.jobs.fm_add_templates.tasks import add_templates_to_wells
+from everest_models.jobs.fm_drill_planner.manager import get_field_manager
+from everest_models.jobs.fm_drill_planner.models import DrillPlanConfig
+from everest_models.jobs.fm_drill_planner.tasks import orchestrate_drill_schedule
+from everest_models.jobs.fm_schmerge.tasks import merge_operations_onto_file
+from everest_models.jobs.fm_schmerge.well_model import dated_operations
+from everest_models.jobs.fm_well_constraints.models import (
+    Control,
+    PhaseControl,
+    WellConstraintConfig,
+    WellConstraints,
+)
+from everest_models.jobs.fm_well_constraints.tasks import (
+    add_well_operations,
+    collect_mismatch_errors,
+)
+from everest_models.jobs.fm_well_filter.tasks import filter_wells
+from everest_models.jobs.shared.models import Wells
+from everest_models.jobs.shared.validators import parse_file, valid_input_file
+
+from .models import (
+    AddTemplatesStep,
+    DrillPlannerStep,
+    PipelineConfig,
+    SchmergeStep,
+    WellConstraintsStep,
+    WellFilterStep,
+)
+
+logger = logging.getLogger(__name__)
+
+type StepRunner = Callable[[Wells], None]
+
+
+def _drill_planner(options: DrillPlannerStep, _: Path) -> StepRunner:
+    config = parse_file(str(options.config), DrillPlanConfig)
+    if config.wells is not None:
+        raise argparse.ArgumentTypeError(
+            f"{options.config}: the `wells` config section is not supported in a "
+            "pipeline, the wells are read from -i/--input"
+        )
+    optimizer = valid_input_file(str(options.optimizer))
+
+    def run(wells: Wells) -> None:
+        if missing := ", ".join(well.name for well in wells if well.drill_time is None):
+            raise ValueError(
+                f"Missing drill time for the following wells:\n\t{missing}"
+            )
+        manager = get_field_manager(
+            config, wells, optimizer, options.ignore_end_date, False
+        )
+        orchestrate_drill_schedule(
+            manager, wells.to_dict(), config.start_date, options.time_limit
+        )
+
+    return run
+
+
+def _well_filter(options: WellFilterStep, _: Path) -> StepRunner:
+    keep = options.remove is None
+    well_names = set(valid_input_file(str(options.keep if keep else options.remove)))
+
+    def run(wells: Wells) -> None:
+        if diff := well_names.difference(well.name for well in wells):
+            logger.warning(
+                f"{'Keep' if keep else 'Remove'} value(s) are not present in wells:\n\t"
+                + ", ".join(diff)
+            )
+        wells.root = filter_wells(wells, well_names, keep)
+
+    return run
+
+
+def _well_constraints(options: WellConstraintsStep, _: Path) -> StepRunner:
+    config = parse_file(str(options.config), WellConstraintConfig)
+    constraints = WellConstraints(
+        duration=(
+            None
+            if options.duration_constraints is None
+            else parse_file(str(options.duration_constraints), Control)
+        ),
+        rate=(
+            None
+            if options.rate_constraints is None
+            else parse_file(str(options.rate_constraints), Control)
+        ),
+        phase=(
+            None
+            if options.phase_constraints is None
+            else parse_file(str(options.phase_constraints), PhaseControl)
+        ),
+    )
+
+    def run(wells: Wells) -> None:
+        if mismatch_errors := collect_mismatch_errors(wells, config, constraints):
+            raise ValueError("\n\n".join(mismatch_errors))
+        add_well_operations(wells, config, constraints)
+
+    return run
+
+
+def _add_templates(options: AddTemplatesStep, _: Path) -> StepRunner:
+    config = parse_file(str(options.config), TemplateConfig)
+
+    def run(wells: Wells) -> None:
+        if msg := add_templates_to_wells(config.templates, wells):
+            raise ValueError("No template matched:\n" + msg)
+
+    return run
+
+
+def _schmerge(options: SchmergeStep, output: Path) -> StepRunner:
+    def run(wells: Wells) -> None:
+        if missing := ", ".join(
+            well.name for well in wells if any(well.missing_templates)
+        ):
+            raise ValueError(f"Missing templates for the following wells:\n\t{missing}")
+        merge_operations_onto_file(
+            dated_operations(wells), options.schedule, output, options.template_cache
+        )
+
+    return run
+
+
+_STEPS: dict[str, Callable[..., StepRunner]] = {
+    "drill_planner": _drill_planner,
+    "well_filter": _well_filter,
+    "well_constraints": _well_constraints,
+    "add_templates": _add_templates,
+    "schmerge": _schmerge,
+}
+
+
+def prepare_steps(config: PipelineConfig, output: Path) -> list[tuple[str, StepRunner]]:
+    """Load and validate the input files of every pipeline step.
+
+    Args:
+        config (PipelineConfig): pipeline configuration
+        output (Path): filepath the final schedule is written to
+
+    Raises:
+        argparse.ArgumentTypeError: Invalid step input file
+
+    Returns:
+        list[tuple[str, StepRunner]]: job names and their runners, in order
+    """
+    return [(step.job, _STEPS[step.job](step.options, output)) for step in config]
+
+
+def run_pipeline(
+    steps: Sequence[tuple[str, StepRunner]],
+    wells: Wells,
+    dump_directory: Path | None = None,
+) -> None:
+    """Run the pipeline steps in order on the in-memory wells.
+
+    Args:
+        steps (Sequence[tuple[str, StepRunner]]): job names and their runners
+        wells (Wells): wells to process, modified in place
+        dump_directory (Path | None, optional): directory to write the wells to
+            after every step, for debugging. Defaults to None.
+
+    Raises:
+        ValueError: A step failed on the given wells
+    """
+    for index, (job, run) in enumerate(steps, start=1):
+        logger.info(f"Running step {index}: {job}")
+        try:
+            run(wells)
+        except ValueError as e:
+            raise ValueError(f"Step {index} ({job}) failed:\n{e}") from e
+        if dump_directory is not None and job != "schmerge":
+            wells.json_dump(dump_directory / f"{index:02d}_{job}.json")
@@ -1,7 +1,7 @@
 import logging
 
 from everest_models.jobs.fm_schmerge.parser import build_argument_parser
-from everest_models.jobs.fm_schmerge.tasks import merge_operations_onto_schedule
+from everest_models.jobs.fm_schmerge.tasks import merge_operations_onto_file
 
 logger = logging.getLogger(__name__)
 
@@ -15,7 +15,9 @@ def main_entry_point(args=None):
     if options.lint:
         args_parser.exit()
 
-    schedule = merge_operations_onto_schedule(
-        options.input.dated_operations(), options.schedule
+    merge_operations_onto_file(
+        options.input.dated_operations(),
+        options.schedule,
+        options.output,
+        options.template_cache,
     )
-    options.output.write_text(schedule)
@@ -1,3 +1,5 @@
+from pathlib import Path
+
 from everest_models.jobs.shared.arguments import (
     add_output_argument,
     add_wells_input_argument,
@@ -44,4 +46,10 @@ def build_argument_parser(skip_type=False):
         help="File path to write the resulting schedule file to.",
         skip_type=skip_type,
     )
+    parser.add_argument(
+        "--template-cache",
+        type=Path,
+        help="Directory to keep compiled templates in between runs."
+        " The directory may be shared by all realizations, and is created if missing.",
+    )
     return parser
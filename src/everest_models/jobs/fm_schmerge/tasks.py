@@ -1,11 +1,14 @@
-import bisect
+import collections
 import datetime
+import functools
+import io
 import logging
 import re
+from collections.abc import Iterable, Iterator
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
-from jinja2 import Template
+from jinja2 import BaseLoader, Environment, FileSystemBytecodeCache, Template
 
 from everest_models.jobs.shared.models import PhaseEnum
 
@@ -14,19 +17,62 @@ logger = logging.getLogger(__name__)
 OperationParameter = dict[str, Path | PhaseEnum | float | str]
 OperationData = dict[datetime.datetime, list[OperationParameter]]
 MODIFY_COMMENT = "-- MODIFIED by schmerge forward model\n"
-ECLIPSE_DATE_REGEX = re.compile(
-    r"^DATES.*?"  # starting from `DATE` tag
-    r"\n\s?(?<!--)\s?"  # insure not a commented out date
+DATES_LINE_REGEX = re.compile(r"(?<=\n)DATES")
+DATE_LINE_REGEX = re.compile(
+    r"\s{0,2}"  # at most two leading whitespaces, insure not a commented out date
     r"(?P<date>\d{1,2}\s+\S+\s+\d{4})"  # Capture the date
-    r".*?/.*?/.*?\n"  # end of line markers
-    r"(?P<comments>.*?)"  # Capture everything (comment) between dates
-    r"(?=DATES)",  # Till the next date (none capturing group)
-    re.VERBOSE | re.MULTILINE | re.DOTALL,
 )
+TEMPLATE_CACHE_SIZE = 400
+
+
+class _PathLoader(BaseLoader):
+    """Load templates by their file path, reloading them once their mtime changes."""
+
+    def get_source(self, environment: Environment, template: str):
+        path = Path(template)
+        mtime = path.stat().st_mtime_ns
+        return (
+            path.read_text(),
+            template,
+            lambda: path.exists() and path.stat().st_mtime_ns == mtime,
+        )
+
+
+@functools.cache
+def get_template_environment(bytecode_cache: Path | None = None) -> Environment:
+    """Get the template environment used to render schedule insertions.
+
+    Compiled templates are kept in a bounded cache keyed by their resolved
+    path, and are recompiled when the file modification time changes.
+
+    Args:
+        bytecode_cache (Path | None, optional): directory for a persistent
+            compiled template cache, may be shared between processes. Defaults to None.
+
+    Returns:
+        Environment: jinja environment
+    """
+    return Environment(
+        loader=_PathLoader(),
+        cache_size=TEMPLATE_CACHE_SIZE,
+        auto_reload=True,
+        bytecode_cache=(
+            None
+            if bytecode_cache is None
+            else FileSystemBytecodeCache(str(bytecode_cache))
+        ),
+    )
+
+
+def _get_template(template: Path, environment: Environment) -> Template:
+    return environment.get_template(str(template.resolve()))
 
 
 def _render_parameter_data(
-    date: datetime.date, template: Path, template_map: dict[str, Any]
+    date: datetime.date,
+    template: Path,
+    template_map: dict[str, Any],
+    environment: Environment,
 ):
     if phase := template_map.pop("phase", None):
         template_map["phase"] = phase.value
@@ -36,7 +82,7 @@ def _render_parameter_data(
     )
     return (
         f"--start {template}\n\n"
-        f"{Template(template.read_text()).render(**template_map)}\n\n"
+        f"{_get_template(template, environment).render(**template_map)}\n\n"
         f"--end {template}\n\n"
     )
 
@@ -45,76 +91,195 @@ def _format_insertion_date(date: datetime.date) -> str:
     return f"\n\nDATES\n {date.strftime('%d %b %Y').upper()} / --ADDED\n/\n\n"
 
 
-def _find_dates_in_schedule(source: str):
-    return {
-        datetime.datetime.strptime(
-            re.sub(
-                r"['\"]",  # Drop quotation
-                "",
-                date.replace("JLY", "JUL")  # Replace JLY
-                if "JLY" in (date := match["date"])  # date group
-                else date,
-            ),
-            "%d %b %Y",
-        ).date(): re.escape(match[0])  # Convert to date
-        for match in ECLIPSE_DATE_REGEX.finditer(f"{source}DATES")
-    }
-
-
-def _merge_operations_onto_schedule(operations: OperationData, schedule: str) -> str:
-    if re.search(r"(?<=\n)(DATES)", schedule) is None:
-        return schedule + "".join(
-            _format_insertion_date(date)
-            + "".join(
-                _render_parameter_data(date, **parameters) for parameters in entry
-            )
-            for date, entry in sorted(operations.items())
-        )
-    schedule_data = _find_dates_in_schedule(schedule)
-    dates = tuple(schedule_data)
-    # Walk through parsed schedule in reverse in order to preserve data
-    for operation_date, entry in sorted(operations.items(), reverse=True):
-        if operation_date in dates:
-            closest_date = operation_date
-            insertion_text = "\n\n"
+def _parse_date(date: str) -> datetime.date:
+    return datetime.datetime.strptime(
+        re.sub(
+            r"['\"]",  # Drop quotation
+            "",
+            date.replace("JLY", "JUL") if "JLY" in date else date,  # Replace JLY
+        ),
+        "%d %b %Y",
+    ).date()
+
+
+class _ScheduleWriter:
+    """Write schedule text to a stream as it is produced.
+
+    The modification comment is put in front of the first `DATES` keyword,
+    and runs of blank lines are collapsed to a single one on the fly.
+    """
+
+    def __init__(self, stream: TextIO) -> None:
+        self._stream = stream
+        self._modified = False
+        self._last_character = ""
+        self._newlines = 0
+
+    def write(self, text: str) -> None:
+        if not text:
+            return
+        if not self._modified and (
+            match := DATES_LINE_REGEX.search(self._last_character + text)
+        ):
+            position = match.start() - len(self._last_character)
+            text = f"{text[:position]}\n{MODIFY_COMMENT}\n{text[position:]}"
+            self._modified = True
+        self._last_character = text[-1]
+
+        stripped = text.lstrip("\n")
+        self._newlines += len(text) - len(stripped)
+        if not stripped:
+            return
+        body = stripped.rstrip("\n")
+        self._stream.write("\n" * min(self._newlines, 2))
+        self._stream.write(re.sub(r"\n{3,}", "\n\n", body))
+        self._newlines = len(stripped) - len(body)
+
+    def close(self) -> None:
+        self._stream.write("\n" * min(self._newlines, 2))
+        self._newlines = 0
+
+
+def _schedule_blocks(
+    schedule: Iterable[str],
+) -> Iterator[tuple[datetime.date | None, str]]:
+    """Split schedule lines into text, flagging where each date block starts.
+
+    A date block starts at a line beginning with the `DATES` keyword, and its date
+    is the first uncommented date found at the start of one of the following lines.
+    Only the lines in between are held back while looking for the date.
+
+    Args:
+        schedule (Iterable[str]): eclipse schedule lines, with line endings
+
+    Yields:
+        Iterator[tuple[datetime.date | None, str]]: block date and text starting the
+            block, or None and any other text
+    """
+    header: list[str] = []
+    for line in schedule:
+        if line.startswith("DATES"):
+            if header:
+                yield None, "".join(header)
+            header = [line]
+        elif header:
+            header.append(line)
+            if match := DATE_LINE_REGEX.match(line):
+                yield _parse_date(match["date"]), "".join(header)
+                header = []
         else:
-            closest_date = dates[
-                date - 1
-                if (date := bisect.bisect_left(dates, operation_date))
-                else date
-            ]
-            insertion_text = _format_insertion_date(operation_date)
-        insertion_text = insertion_text + "\n\n".join(
-            _render_parameter_data(operation_date, **parameters) for parameters in entry
-        )
-        schedule = re.sub(
-            rf"({schedule_data[closest_date]})",
-            (r"\1" + insertion_text)
-            if closest_date <= operation_date  # is operation date before closest date ?
-            else (insertion_text + r"\1"),
-            schedule,
-        )
-    return schedule
+            yield None, line
+    if header:
+        yield None, "".join(header)
 
 
-def merge_operations_onto_schedule(operations: OperationData, schedule: str) -> str:
-    """Merge well operation onto given schedule.
+def write_merged_schedule(
+    operations: OperationData,
+    schedule: Iterable[str],
+    stream: TextIO,
+    template_cache: Path | None = None,
+) -> None:
+    """Stream well operations merged onto the given schedule.
 
     - render well operation template and parameters
     - Inject rendered string onto schedule under the correct date
     - Add date if not present in schedule
 
+    Only the rendered operations of a single date are held in memory at a time.
+
+    Args:
+        operations (OperationData): <date, operation> mapping
+        schedule (Iterable[str]): eclipse schedule lines, with line endings
+        stream (TextIO): stream to write the resulting schedule to
+        template_cache (Path | None, optional): directory for a persistent
+            compiled template cache. Defaults to None.
+    """
+    environment = get_template_environment(template_cache)
+    pending = collections.deque(sorted(operations.items()))
+    writer = _ScheduleWriter(stream)
+    current_date: datetime.date | None = None
+
+    def render(operation_date: datetime.date, entry: list[OperationParameter]) -> str:
+        return (
+            "\n\n"
+            if operation_date == current_date
+            else _format_insertion_date(operation_date)
+        ) + "\n\n".join(
+            _render_parameter_data(
+                operation_date, **parameters, environment=environment
+            )
+            for parameters in entry
+        )
+
+    for block_date, text in _schedule_blocks(schedule):
+        if block_date is not None:
+            if current_date is None:
+                # Dates ahead of the first block are stacked latest date first
+                preceding = []
+                while pending and pending[0][0] < block_date:
+                    preceding.append(pending.popleft())
+                for operation in reversed(preceding):
+                    writer.write(render(*operation))
+            while pending and pending[0][0] < block_date:
+                writer.write(render(*pending.popleft()))
+            current_date = block_date
+        writer.write(text)
+    while pending:
+        writer.write(render(*pending.popleft()))
+    writer.close()
+
+
+def merge_operations_onto_schedule(
+    operations: OperationData, schedule: str, template_cache: Path | None = None
+) -> str:
+    """Merge well operation onto given schedule.
+
     Args:
         operations (OperationData): <date, operation> mapping
         schedule (str): eclipse schedule
+        template_cache (Path | None, optional): directory for a persistent
+            compiled template cache. Defaults to None.
 
     Returns:
         str: schedule
     """
-    schedule = re.sub(
-        r"(?<=\n)(DATES)",
-        f"\n{MODIFY_COMMENT}\n" + r"\1",  # insert modification comment
-        _merge_operations_onto_schedule(operations, schedule),
-        count=1,
+    stream = io.StringIO()
+    write_merged_schedule(
+        operations, schedule.splitlines(keepends=True), stream, template_cache
     )
-    return re.sub(r"\n{3,}", "\n\n", schedule)  # uniform format
+    return stream.getvalue()
+
+
+def merge_operations_onto_file(
+    operations: OperationData,
+    schedule: Path,
+    output: Path,
+    template_cache: Path | None = None,
+) -> None:
+    """Merge well operations onto a schedule file, writing the result to output.
+
+    The result is written next to the output first and then moved in place,
+    thus the schedule may also be the output. The output is left untouched if
+    the merge fails.
+
+    Args:
+        operations (OperationData): <date, operation> mapping
+        schedule (Path): eclipse schedule filepath
+        output (Path): filepath to write the resulting schedule to
+        template_cache (Path | None, optional): directory for a persistent
+            compiled template cache. Defaults to None.
+    """
+    if template_cache is not None:
+        template_cache.mkdir(parents=True, exist_ok=True)
+
+    partial_output = output.with_name(f".{output.name}.partial")
+    try:
+        with (
+            schedule.open(encoding="utf-8") as lines,
+            partial_output.open("w", encoding="utf-8") as stream,
+        ):
+            write_merged_schedule(operations, lines, stream, template_cache)
+        partial_output.replace(output)
+    except BaseException:
+        partial_output.unlink(missing_ok=True)
+        raise
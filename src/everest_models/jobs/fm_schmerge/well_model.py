@@ -1,4 +1,5 @@
 from collections import defaultdict
+from collections.abc import Iterable
 from typing import Annotated
 
 from pydantic import ConfigDict, Field, FilePath, PlainSerializer
@@ -13,6 +14,8 @@ from everest_models.jobs.shared.models import (
     Wells as _Wells,
 )
 
+from .tasks import OperationData
+
 
 class _Operation(Operation):
     model_config = ConfigDict(title="Operation")
@@ -33,22 +36,34 @@ class _Well(Well):
     ]
 
 
+def dated_operations(wells: Iterable[Well]) -> OperationData:
+    """Group well operations and their template parameters by date.
+
+    Args:
+        wells (Iterable[Well]): wells with a template set for every operation
+
+    Returns:
+        OperationData: <date, operation> mapping
+    """
+    operations_dict = defaultdict(list)
+    for well in wells:
+        for operation in well.operations:
+            operations_dict[operation.date].append(
+                {
+                    "template_map": dict(
+                        filter(
+                            lambda x: x[1] is not None,
+                            {"name": well.name, **operation.tokens}.items(),
+                        )
+                    ),
+                    "template": operation.template,
+                }
+            )
+    return operations_dict
+
+
 class Wells(_Wells):
     root: tuple[_Well, ...]  # type: ignore
 
-    def dated_operations(self):
-        operations_dict = defaultdict(list)
-        for well in self:
-            for operation in well.operations:
-                operations_dict[operation.date].append(
-                    {
-                        "template_map": dict(
-                            filter(
-                                lambda x: x[1] is not None,
-                                {"name": well.name, **operation.tokens}.items(),
-                            )
-                        ),
-                        "template": operation.template,
-                    }
-                )
-        return operations_dict
+    def dated_operations(self) -> OperationData:
+        return dated_operations(self)
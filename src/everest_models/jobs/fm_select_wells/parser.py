@@ -3,12 +3,12 @@ from functools import partial
 
 from everest_models.jobs.fm_select_wells.well_number_model import WellNumber
 from everest_models.jobs.shared.arguments import (
-    SchemaAction,
     add_output_argument,
     add_wells_input_argument,
     bootstrap_parser,
     get_parser,
 )
+from everest_models.jobs.shared.parsers import SchemaAction
 from everest_models.jobs.shared.validators import is_gtoet_zero, parse_file
 
 
@@ -2,7 +2,7 @@ import logging
 
 import stea
 
-from everest_models.jobs.fm_stea.parser import args_parser
+from everest_models.jobs.fm_stea.parser import build_argument_parser
 
 logger = logging.getLogger(__name__)
 
@@ -75,6 +75,7 @@ Argument examples
 
 
 def main_entry_point(args=None):
+    args_parser = build_argument_parser()
     options = args_parser.parse_args(args)
 
     if options.lint:
@@ -24,6 +24,3 @@ def build_argument_parser(skip_type=False):
         required=True,
     )
     return parser
-
-
-args_parser = build_argument_parser()
@@ -1,7 +1,7 @@
 import logging
 
 from everest_models.jobs.fm_strip_dates import tasks
-from everest_models.jobs.fm_strip_dates.parser import args_parser
+from everest_models.jobs.fm_strip_dates.parser import build_argument_parser
 
 logger = logging.getLogger(__name__)
 
@@ -9,6 +9,7 @@ FULL_JOB_NAME = "Strip dates"
 
 
 def main_entry_point(args=None):
+    args_parser = build_argument_parser()
     options = args_parser.parse_args(args)
     summary, summary_path = options.summary
     unique_dates = set(options.dates)
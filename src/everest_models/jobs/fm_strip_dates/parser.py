@@ -36,6 +36,3 @@ def build_argument_parser(skip_type=False):
     )
 
     return parser
-
-
-args_parser = build_argument_parser()
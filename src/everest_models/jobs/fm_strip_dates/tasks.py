@@ -1,46 +1,139 @@
+import contextlib
 import datetime
 import logging
+import mmap
 import os
 import shutil
-
-from resdata.resfile import FortIO, ResdataFile
+import struct
+import tempfile
+from collections.abc import Iterable, Iterator
+from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
-SPEC_EXTENSION = "SMSPEC"
+# Unformatted Fortran records: a big-endian length marker on both sides of the data
+_MARKER = struct.Struct(">i")
+# Keyword header record: name, number of elements and element type
+_HEADER = struct.Struct(">8si4s")
+_ELEMENT_SIZES = {b"INTE": 4, b"REAL": 4, b"LOGI": 4, b"DOUB": 8, b"CHAR": 8}
+
+
+def _element_size(element_type: bytes) -> int:
+    if element_type in _ELEMENT_SIZES:
+        return _ELEMENT_SIZES[element_type]
+    if element_type == b"MESS":
+        return 0
+    if element_type.startswith(b"C0") and element_type[2:].isdigit():
+        return int(element_type[2:])
+    raise RuntimeError(f"Unknown keyword type in summary file: {element_type!r}")
+
+
+def _record_end(data: mmap.mmap, offset: int) -> tuple[int, int]:
+    """Length and end offset of the record at offset."""
+    if offset + _MARKER.size > len(data):
+        raise RuntimeError("Unexpected end of summary file")
+    (length,) = _MARKER.unpack_from(data, offset)
+    end = offset + length + 2 * _MARKER.size
+    if (
+        length < 0
+        or end > len(data)
+        or _MARKER.unpack_from(data, end - _MARKER.size)[0] != length
+    ):
+        raise RuntimeError(f"Corrupt record in summary file at byte {offset}")
+    return length, end
+
+
+def _keywords(data: mmap.mmap) -> Iterator[tuple[str, int, int]]:
+    """Name, start and end offsets of the keywords in an unformatted Fortran file."""
+    offset = 0
+    while offset < len(data):
+        start = offset
+        length, offset = _record_end(data, offset)
+        if length != _HEADER.size:
+            raise RuntimeError(
+                f"Corrupt keyword header in summary file at byte {start}"
+            )
+        name, count, element_type = _HEADER.unpack_from(data, start + _MARKER.size)
+        remaining = count * _element_size(element_type)
+        while remaining > 0:
+            length, offset = _record_end(data, offset)
+            remaining -= length
+        yield name.decode("ascii").strip(), start, offset
+
+
+def _copy(source: int, target: int, data: mmap.mmap, start: int, end: int) -> None:
+    """Copy a byte range in the kernel if possible, from the memory map otherwise."""
+    with contextlib.suppress(AttributeError, OSError):  # Not supported
+        while start < end:
+            if not (copied := os.copy_file_range(source, target, end - start, start)):
+                break
+            start += copied
+    with memoryview(data) as view:
+        while start < end:
+            start += os.write(target, view[start:end])
+
+
+def _kept_ranges(
+    data: mmap.mmap,
+    summary_dates: list[datetime.datetime],
+    dates: set[datetime.date],
+) -> Iterator[tuple[int, int]]:
+    """Contiguous byte ranges to keep, dropping the SEQHDR of stripped report steps.
+
+    A report step starts with a SEQHDR keyword and its ministeps each have a
+    PARAMS keyword. The SEQHDR is kept if the last ministep before it is on one
+    of the dates, merging the report steps ending on any other date.
+    """
+    valid_date = True
+    date_index = 0
+    kept_start = kept_end = 0
+    for name, start, end in _keywords(data):
+        if name == "PARAMS":
+            valid_date = summary_dates[date_index].date() in dates
+            date_index += 1
+        if name != "SEQHDR" or valid_date:
+            if start != kept_end:
+                if kept_end > kept_start:
+                    yield kept_start, kept_end
+                kept_start = start
+            kept_end = end
+    if kept_end > kept_start:
+        yield kept_start, kept_end
 
 
 def strip_dates(
     summary_dates: list[datetime.datetime],
-    dates: list[datetime.date],
+    dates: Iterable[datetime.date],
     summary_path: str,
 ):
     """Strip all other dates except the ones given from eclipse summary.
 
+    The unformatted summary file is rewritten record by record: the kept
+    keywords are copied as is, and the result replaces the file atomically.
+
     Args:
         summary_dates: Eclipse summary dates
         dates (List[datetime.date]): dates to whitelist from strip
         summary_path (str): eclipse summary filepath
-    """
-    base_path, extension = os.path.splitext(summary_path)
-    temp_path = f"{base_path}_BAK.{extension}"
-
-    shutil.move(summary_path, temp_path)
-    shutil.copy(f"{base_path}.{SPEC_EXTENSION}", f"{base_path}_BAK.{SPEC_EXTENSION}")
-
-    ecl_file = ResdataFile(temp_path)
-    fort_io = FortIO(summary_path, mode=FortIO.WRITE_MODE)
 
-    valid_date = True
-    date_inx = 0
-    for kw in ecl_file:
-        tmptype, _, _ = kw.header
-
-        if tmptype == "PARAMS":
-            valid_date = summary_dates[date_inx].date() in dates
-            date_inx = date_inx + 1
-        if tmptype != "SEQHDR" or valid_date:
-            kw.fwrite(fort_io)
-
-    ecl_file.close()
-    fort_io.close()
+    Raises:
+        RuntimeError: The summary file is not a valid unformatted Fortran file
+    """
+    path = Path(summary_path)
+    with path.open("rb") as source:
+        if not os.fstat(source.fileno()).st_size:
+            return
+        with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            ranges = list(_kept_ranges(data, summary_dates, set(dates)))
+            fd, temp_path = tempfile.mkstemp(
+                dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "wb") as target:
+                    for start, end in ranges:
+                        _copy(source.fileno(), target.fileno(), data, start, end)
+                shutil.copymode(path, temp_path)
+                os.replace(temp_path, path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
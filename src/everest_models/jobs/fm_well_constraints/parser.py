@@ -7,7 +7,6 @@ from everest_models.jobs.fm_well_constraints.models import (
     WellConstraintConfig,
 )
 from everest_models.jobs.shared.arguments import (
-    SchemaAction,
     add_file_schemas,
     add_lint_argument,
     add_output_argument,
@@ -16,6 +15,7 @@ from everest_models.jobs.shared.arguments import (
     parse_file,
 )
 from everest_models.jobs.shared.models.wells import Wells
+from everest_models.jobs.shared.parsers import SchemaAction
 
 CONFIG_ARG_KEY = "-c/--config"
 RATE_CONSTRAINTS_ARG_KEY = "-rc/--rate-constraints"
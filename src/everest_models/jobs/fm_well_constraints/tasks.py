@@ -1,10 +1,12 @@
 import datetime
 import logging
+from collections.abc import Iterable
+from functools import partial
 from typing import NamedTuple, TypedDict
 
-from everest_models.jobs.shared.models.wells import Operation
+from everest_models.jobs.shared.models.wells import Operation, Well
 
-from .models import WellConstraints
+from .models import WellConstraintConfig, WellConstraints
 from .models.config import Constraints
 
 logger = logging.getLogger(__name__)
@@ -67,3 +69,75 @@ def create_well_operations(
         )
 
     return operations
+
+
+def _collect_constraints_errors(
+    optional_constraints: WellConstraints,
+    well_names: Iterable[str],
+):
+    errors = []
+    for argument, constraint in optional_constraints.items():
+        constraint = set() if constraint is None else set(constraint)  # type: ignore
+        if diff := constraint.difference(well_names):
+            errors.append(f"\t{argument}_constraints:\n\t\t{'    '.join(diff)}")
+    return errors
+
+
+def collect_mismatch_errors(
+    wells: Iterable[Well],
+    config: WellConstraintConfig,
+    constraints: WellConstraints,
+) -> list[str]:
+    """Collect mismatches between wells, constraint configuration and constraints.
+
+    Args:
+        wells (Iterable[Well]): wells to constrain
+        config (WellConstraintConfig): well constraint configuration
+        constraints (WellConstraints): optimizer well constraints
+
+    Returns:
+        list[str]: error messages, empty if there are no mismatches
+    """
+    mismatch_errors = []
+    wells = tuple(wells)
+    if errors := _collect_constraints_errors(
+        constraints,
+        well_names=[well.name for well in wells],
+    ):
+        mismatch_errors.append(
+            "Constraint well name keys do not match input well names:\n"
+            + "\n".join(errors)
+        )
+
+    if errors := set(config).difference(
+        well.name for well in wells if well.readydate is not None
+    ):
+        mismatch_errors.append(
+            "Missing start date (keyword: readydate) for the following wells:\n\t"
+            + "\t".join(errors)
+        )
+    return mismatch_errors
+
+
+def add_well_operations(
+    wells: Iterable[Well],
+    config: WellConstraintConfig,
+    constraints: WellConstraints,
+) -> None:
+    """Append the constrained rate operations to each well, starting at its ready date.
+
+    Args:
+        wells (Iterable[Well]): wells to constrain
+        config (WellConstraintConfig): well constraint configuration
+        constraints (WellConstraints): optimizer well constraints
+    """
+    _well_constraints = partial(constraint_by_well_name, constraints=constraints)
+    for well in wells:
+        well.operations = (
+            *well.operations,
+            *create_well_operations(
+                config.get(well.name, {}),
+                well.readydate,
+                _well_constraints(well_name=well.name),
+            ),
+        )
@@ -1,6 +1,7 @@
 import logging
 
 from everest_models.jobs.fm_well_filter.parser import build_argument_parser
+from everest_models.jobs.fm_well_filter.tasks import filter_wells
 
 logger = logging.getLogger(__name__)
 
@@ -60,11 +61,6 @@ def main_entry_point(args=None):
     if options.lint:
         args_parser.exit()
 
-    options.input.root = tuple(
-        filter(
-            lambda x: x.name in well_names if keep else x.name not in well_names,
-            options.input,
-        )
-    )
+    options.input.root = filter_wells(options.input, well_names, keep)
 
     options.input.json_dump(options.output)
@@ -0,0 +1,25 @@
+from collections.abc import Iterable
+
+from everest_models.jobs.shared.models import Well
+
+
+def filter_wells(
+    wells: Iterable[Well], well_names: Iterable[str], keep: bool
+) -> tuple[Well, ...]:
+    """Keep or remove wells by name.
+
+    Args:
+        wells (Iterable[Well]): wells to filter
+        well_names (Iterable[str]): names of the wells to keep or remove
+        keep (bool): keep the named wells if True, otherwise remove them
+
+    Returns:
+        tuple[Well, ...]: filtered wells
+    """
+    well_names = set(well_names)
+    return tuple(
+        filter(
+            lambda x: x.name in well_names if keep else x.name not in well_names,
+            wells,
+        )
+    )
@@ -1,10 +1,13 @@
 from collections.abc import Sequence
 
+from everest_models.jobs.shared.io_utils import compact_output
+
 from .tasks import (
     clean_parsed_data,
     determine_index_states,
     duration_to_dates,
     inject_case_operations,
+    write_state_history,
 )
 
 FULL_JOB_NAME = "Well swapping"
@@ -135,12 +138,17 @@ These controls result in an EVEREST-generated JSON file with the following conte
 
 def main_entry_point(args: Sequence[str] | None = None):
     data = clean_parsed_data(args)
-    inject_case_operations(
-        data.cases.to_dict(),
-        zip(
+    history = [
+        (_date, dict(states))
+        for _date, states in zip(
             duration_to_dates(data.state_duration, data.start_date),
             determine_index_states(data.state, data.iterations, data.priorities),
             strict=False,
-        ),
+        )
+    ]
+    inject_case_operations(
+        data.cases.to_dict(), ((_date, states.items()) for _date, states in history)
     )
     data.cases.json_dump(data.output)
+    if compact_output():
+        write_state_history(history, data.output.with_suffix(".npz"))
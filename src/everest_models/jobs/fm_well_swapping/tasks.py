@@ -10,6 +10,7 @@ from typing import Any
 
 from everest_models.jobs.fm_well_swapping.models.state import StateConfig
 from everest_models.jobs.fm_well_swapping.parser import build_argument_parser
+from everest_models.jobs.shared.io_utils import dump_npz
 from everest_models.jobs.shared.models import Operation
 from everest_models.jobs.shared.models import Well as CaseConfig
 from everest_models.jobs.shared.models import Wells as CasesConfig
@@ -212,3 +213,29 @@ def determine_index_states(
         else:
             yield processor.latest_valid_states(max(index - 1, 0))
             break
+
+
+def write_state_history(
+    history: Sequence[tuple[date, dict[Case, State]]], path: Path
+) -> None:
+    """Write the state of each case per iteration to a `.npz` sidecar.
+
+    Args:
+        history (Sequence[Tuple[date, Dict[str, str]]]): A sequence in the form of
+            (date, {case: state, ...}), ...
+        path (Path): file to write to
+
+    The archive holds the `dates` of the iterations, the sorted `cases` and their
+    `states`, with one row per iteration and one column per case.
+    """
+    cases = sorted({case for _, states in history for case in states})
+    dump_npz(
+        {
+            "dates": [_date.isoformat() for _date, _ in history],
+            "cases": cases,
+            "states": [
+                [states.get(case, "") for case in cases] for _, states in history
+            ],
+        },
+        path,
+    )
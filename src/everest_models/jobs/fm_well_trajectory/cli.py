@@ -1,7 +1,14 @@
 import logging
 from pathlib import Path
 
-from .outputs import write_guide_points, write_mlt_guide_md, write_mlt_guide_points
+from everest_models.jobs.shared.io_utils import compact_output
+
+from .outputs import (
+    write_guide_points,
+    write_guide_points_sidecar,
+    write_mlt_guide_md,
+    write_mlt_guide_points,
+)
 from .parser import build_argument_parser
 from .read_trajectories import read_trajectories
 from .well_trajectory_resinsight import well_trajectory_resinsight
@@ -127,9 +134,13 @@ def main_entry_point(args=None):
     )
     logger.info("Writing guide points to 'guide_points.json'")
     write_guide_points(guide_points, Path("guide_points.json"))
+    if compact_output():
+        logger.info("Writing guide points to 'guide_points.npz'")
+        write_guide_points_sidecar(guide_points, Path("guide_points.npz"))
 
+    trajectories = None
     if options.config.interpolation.type == "simple":
-        well_trajectory_simple(
+        trajectories = well_trajectory_simple(
             options.config.wells,
             options.config.interpolation,
             options.config.npv_input_file,
@@ -155,7 +166,11 @@ def main_entry_point(args=None):
             args_parser.error(f"Missing {eclipse_model}.INIT file")
 
         mlt_guide_points = well_trajectory_resinsight(
-            options.config, eclipse_model, guide_points
+            options.config,
+            eclipse_model,
+            guide_points,
+            trajectories=trajectories,
+            server_port=options.resinsight_server,
         )
         if mlt_guide_points:
             logger.info("Writing multilateral guide points to 'mlt_guide_points.json'")
@@ -0,0 +1,52 @@
+import functools
+import logging
+from pathlib import Path
+
+import numpy as np
+
+from .models.data_structs import Deviation
+
+logger = logging.getLogger(__name__)
+
+DEVIATION_CACHE_SIZE = 256
+
+
+@functools.lru_cache(maxsize=DEVIATION_CACHE_SIZE)
+def _read_deviation_file(path: Path, mtime_ns: int, size: int) -> Deviation:
+    rows = []
+    with path.open(encoding="utf-8") as fp:
+        next(fp, None)  # WELLNAME
+        for line in fp:
+            if line.strip() == "-999":
+                break
+            if not line.lstrip().startswith("#"):
+                rows.append(line)
+    values = np.array("".join(rows).split(), dtype=np.float64).reshape(-1, 4)
+    values.flags.writeable = False
+    return Deviation(*values.T)
+
+
+def read_deviation_file(path: Path) -> Deviation:
+    """Read the trajectory of a single well from a deviation file.
+
+    Parsed files are cached per path, and read again once they are modified.
+    The returned arrays are shared between callers, and thus read-only.
+
+    Args:
+        path (Path): deviation file path, written by ResInsight or by the job
+
+    Returns:
+        Deviation: well trajectory coordinates and measured depths
+    """
+    stat = path.stat()
+    return _read_deviation_file(path.resolve(), stat.st_mtime_ns, stat.st_size)
+
+
+def read_well_length(well: str) -> float:
+    """Read well length, the measured depth of the last point, from a deviation file"""
+
+    if not (path := Path(f"wellpaths/{well}").with_suffix(".dev")).exists():
+        logger.warning(f"File does not exist, {path}")
+        return 0.0
+
+    return float(read_deviation_file(path).mdmsl[-1])
@@ -1,15 +1,17 @@
 import logging
-import math
+from collections.abc import Callable, Iterator
 
 import numpy as np
 from numpy.typing import NDArray
 
 from everest_models.jobs.fm_well_trajectory.models.data_structs import Trajectory
 
-from .geometry import compute_azimuths, compute_inclinations, compute_interval_lengths
+from .geometry import compute_dogleg_severities, stack_trajectories
 
 logger = logging.getLogger(__name__)
 
+LINE_SEARCH_MAX_STEP = 0.25
+
 
 def _identify_most_violating_point(
     trajectory: Trajectory,
@@ -66,42 +68,8 @@ def _move_point_towards_neighbor(
     return Trajectory(x, y, z)
 
 
-def _compute_dogleg_severities(
-    dogleg_angles: NDArray[np.float64], interval_lengths: NDArray[np.float64]
-) -> NDArray[np.float64]:
-    severities = np.empty(len(dogleg_angles), dtype=np.float64)
-    severities[0] = 0.0
-    severities[1:] = (
-        30.48
-        * (dogleg_angles[1:] * 180 / math.pi)
-        / interval_lengths[: len(dogleg_angles) - 1]
-    )
-    return severities
-
-
-def _compute_dogleg_angles(
-    inclanations: NDArray[np.float64], azimuths: NDArray[np.float64]
-):
-    angles = np.empty(len(inclanations), dtype=np.float64)
-    angles[0] = 0.0
-    angles[1:] = 2 * np.arcsin(
-        np.sqrt(
-            np.sin((inclanations[1:] - inclanations[:-1]) / 2) ** 2
-            + np.sin(inclanations[:-1])
-            * np.sin(inclanations[1:])
-            * (np.sin((azimuths[1:] - azimuths[:-1]) / 2) ** 2)
-        )
-    )
-    return angles
-
-
 def compute_dogleg_severity(trajectory: Trajectory) -> NDArray[np.float64]:
-    inclinations = compute_inclinations(trajectory)
-    azimuths = compute_azimuths(trajectory)
-    return _compute_dogleg_severities(
-        _compute_dogleg_angles(inclinations, azimuths),
-        compute_interval_lengths(trajectory),
-    )
+    return compute_dogleg_severities(stack_trajectories([trajectory]))[0]
 
 
 def try_fixing_dog_leg(
@@ -116,3 +84,129 @@ def try_fixing_dog_leg(
     except IndexError as e:
         logger.warning(e)
         return Trajectory(None, None, None)
+
+
+def _identify_violating_points(
+    trajectory: Trajectory,
+    s_trajectory: Trajectory,
+    dogleg_severities: NDArray[np.float64],
+    dogleg: float,
+) -> NDArray[np.intp]:
+    violating = np.array(s_trajectory)[:, dogleg_severities >= dogleg]
+    dist = np.linalg.norm(
+        np.array(trajectory)[:, 1:, np.newaxis] - violating[:, np.newaxis, :], axis=0
+    )
+    return np.unique(np.argmin(dist, axis=0) + 1)
+
+
+def _points_to_move(
+    trajectory: Trajectory,
+    s_trajectory: Trajectory,
+    dogleg_severities: NDArray[np.float64],
+    dogleg: float,
+) -> Iterator[NDArray[np.intp]]:
+    # All violating points, or else only the most violating one
+    yield _identify_violating_points(
+        trajectory, s_trajectory, dogleg_severities, dogleg
+    )
+    yield np.array(
+        [_identify_most_violating_point(trajectory, s_trajectory, dogleg_severities)]
+    )
+
+
+def _move_points_towards_neighbors(
+    trajectory: Trajectory, indices: NDArray[np.intp], step: float
+) -> Trajectory:
+    points = np.array(trajectory)
+    last = points.shape[1] - 1
+    current = points[:, indices]
+    # Straighten the trajectory by moving towards the middle of the neighbors,
+    # the last point can only move towards the previous one.
+    targets = np.where(
+        indices == last,
+        points[:, indices - 1],
+        (points[:, indices - 1] + points[:, np.minimum(indices + 1, last)]) / 2,
+    )
+    moved = current + step * (targets - current)
+    # The kickoff only moves vertically
+    moved[:2, indices == 1] = current[:2, indices == 1]
+    points[:, indices] = moved
+    return Trajectory(*points)
+
+
+def _line_search_dog_leg(
+    trajectory: Trajectory,
+    indices: NDArray[np.intp],
+    interpolate: Callable[[Trajectory], Trajectory],
+    dogleg: float,
+    severity: float,
+    tolerance: float,
+) -> tuple[Trajectory, Trajectory, NDArray[np.float64]] | None:
+    def evaluate(step: float) -> tuple[Trajectory, Trajectory, NDArray[np.float64]]:
+        moved = _move_points_towards_neighbors(trajectory, indices, step)
+        coordinates = interpolate(moved)
+        return moved, coordinates, compute_dogleg_severity(coordinates)
+
+    # Backtrack until the maximum severity decreases
+    step = LINE_SEARCH_MAX_STEP
+    while np.amax((candidate := evaluate(step))[2]) >= severity:
+        step /= 2
+        if step < tolerance:
+            return None
+    if np.amax(candidate[2]) >= dogleg:
+        return candidate
+
+    # Bisect towards the smallest step satisfying the dogleg limit
+    lower = 0.0
+    while step - lower > tolerance:
+        middle = (lower + step) / 2
+        if np.amax((result := evaluate(middle))[2]) < dogleg:
+            step, candidate = middle, result
+        else:
+            lower = middle
+    return candidate
+
+
+def repair_dog_leg(
+    trajectory: Trajectory,
+    interpolate: Callable[[Trajectory], Trajectory],
+    dogleg: float,
+    iterations: int,
+    tolerance: float,
+) -> Trajectory | None:
+    """Move guide points until the interpolated trajectory satisfies the dogleg limit.
+
+    Each iteration moves all guide points nearest to a violating interpolated
+    point at once, towards the middle of their neighbors. The step is found by a line search,
+    refined by bisection to the given tolerance once the limit is satisfied.
+
+    Args:
+        trajectory (Trajectory): guide points
+        interpolate (Callable[[Trajectory], Trajectory]): guide points interpolation
+        dogleg (float): maximum dogleg severity
+        iterations (int): maximum number of iterations
+        tolerance (float): smallest step, as a fraction of the distance to a neighbor
+
+    Returns:
+        Trajectory | None: interpolated trajectory, None if the limit could not be met
+    """
+    coordinates = interpolate(trajectory)
+    dogleg_severities = compute_dogleg_severity(coordinates)
+    for _ in range(iterations):
+        if (severity := np.amax(dogleg_severities)) < dogleg:
+            return coordinates
+        try:
+            for indices in _points_to_move(
+                trajectory, coordinates, dogleg_severities, dogleg
+            ):
+                if result := _line_search_dog_leg(
+                    trajectory, indices, interpolate, dogleg, severity, tolerance
+                ):
+                    break
+            else:
+                return None
+        except IndexError as e:
+            logger.warning(e)
+            return None
+        trajectory, coordinates, dogleg_severities = result
+    return coordinates if np.amax(dogleg_severities) < dogleg else None
@@ -1,90 +1,131 @@
 import math
+from collections.abc import Sequence
 
 import numpy as np
 from numpy.typing import NDArray
 
 from everest_models.jobs.fm_well_trajectory.models.data_structs import (
-    Geometry,
+    CalculatedTrajectory,
     Trajectory,
 )
 
 
-def compute_deviations(x: NDArray[np.float64]) -> NDArray[np.float64]:
-    deviations = np.empty(len(x), dtype=np.float64)
-    deviations[0] = 0.0
-    deviations[1:] = x[1:] - x[0]
-    return deviations
+def stack_trajectories(trajectories: Sequence[Trajectory]) -> NDArray[np.float64]:
+    """Stack trajectories of equal length into a (wells x points x 3) array."""
+    return np.stack(trajectories, dtype=np.float64).transpose(0, 2, 1)
 
 
-def _get_diff_array(trajectory: Trajectory) -> NDArray[np.float64]:
-    return np.array(
-        [
-            trajectory.x[1:] - trajectory.x[:-1],
-            trajectory.y[1:] - trajectory.y[:-1],
-            trajectory.z[1:] - trajectory.z[:-1],
-        ]
-    )
+def _repeat_last(values: NDArray[np.float64]) -> NDArray[np.float64]:
+    return np.concatenate((values, values[..., -1:]), axis=-1)
 
 
-def compute_inclinations(
-    trajectory: Trajectory,
+def _compute_inclinations(
+    dx: NDArray[np.float64], dy: NDArray[np.float64], dz: NDArray[np.float64]
 ) -> NDArray[np.float64]:
-    diffs = _get_diff_array(trajectory)
-    vec_z = np.array([0, 0, 1])
-    inclinations = np.empty(len(trajectory.x), dtype=np.float64)
-    inclinations[:-1] = np.arctan2(
-        np.linalg.norm(np.cross(diffs, vec_z, axis=0), axis=0),
-        np.dot(vec_z, diffs),
-    )
-    inclinations[-1] = inclinations[-2]
-    return inclinations
+    return _repeat_last(np.arctan2(np.sqrt(dx**2 + dy**2), dz))
 
 
-def compute_azimuths(
-    trajectory: Trajectory,
-    eps: float = 1e-5,
+def _compute_azimuths(
+    dx: NDArray[np.float64], dy: NDArray[np.float64], eps: float = 1e-5
 ) -> NDArray[np.float64]:
-    azimuths = np.zeros(len(trajectory.x), dtype=np.float64)
-    diffs = _get_diff_array(trajectory)
-    abs_diffs = np.abs(diffs)
-    azimuths[:-1] = np.where(
-        (abs_diffs[0] > eps) & (abs_diffs[1] > eps),
-        np.arctan2(np.dot([1, 0, 0], diffs), np.dot([0, 1, 0], diffs)),
-        0.0,
+    abs_dx, abs_dy = np.abs(dx), np.abs(dy)
+    return _repeat_last(
+        np.select(
+            [
+                (abs_dx > eps) & (abs_dy > eps),
+                (abs_dx < eps) & (abs_dy >= eps) & (dy <= 0),
+                (abs_dx >= eps) & (abs_dy < eps) & (dx > 0),
+                (abs_dx >= eps) & (abs_dy < eps) & (dx <= 0),
+            ],
+            [np.arctan2(dx, dy), math.pi, math.pi / 2, 3 * math.pi / 2],
+            0.0,
+        )
     )
-    azimuths[:-1] = np.where(
-        (abs_diffs[0] < eps) & (abs_diffs[1] >= eps) & (diffs[1] <= 0),
-        math.pi,
-        azimuths[:-1],
-    )
-    azimuths[:-1] = np.where(
-        (abs_diffs[0] >= eps) & (abs_diffs[1] < eps) & (diffs[0] > 0),
-        math.pi / 2,
-        azimuths[:-1],
+
+
+def _compute_dogleg_angles(
+    inclinations: NDArray[np.float64], azimuths: NDArray[np.float64]
+) -> NDArray[np.float64]:
+    angles = np.empty_like(inclinations)
+    angles[..., 0] = 0.0
+    angles[..., 1:] = 2 * np.arcsin(
+        np.sqrt(
+            np.sin((inclinations[..., 1:] - inclinations[..., :-1]) / 2) ** 2
+            + np.sin(inclinations[..., :-1])
+            * np.sin(inclinations[..., 1:])
+            * (np.sin((azimuths[..., 1:] - azimuths[..., :-1]) / 2) ** 2)
+        )
     )
-    azimuths[:-1] = np.where(
-        (abs_diffs[0] >= eps) & (abs_diffs[1] < eps) & (diffs[0] <= 0),
-        3 * math.pi / 2,
-        azimuths[:-1],
+    return angles
+
+
+def _compute_dogleg_severities(
+    dogleg_angles: NDArray[np.float64], interval_lengths: NDArray[np.float64]
+) -> NDArray[np.float64]:
+    severities = np.empty_like(dogleg_angles)
+    severities[..., 0] = 0.0
+    severities[..., 1:] = (
+        30.48 * (dogleg_angles[..., 1:] * 180 / math.pi) / interval_lengths
     )
-    azimuths[-1] = azimuths[-2]
-    return azimuths
+    return severities
 
 
-def compute_interval_lengths(trajectory: Trajectory) -> NDArray[np.float64]:
-    return np.sqrt(
-        (trajectory.x[1:] - trajectory.x[:-1]) ** 2
-        + (trajectory.y[1:] - trajectory.y[:-1]) ** 2
-        + (trajectory.z[1:] - trajectory.z[:-1]) ** 2
+def _compute_dogleg_geometry(
+    points: NDArray[np.float64],
+) -> tuple[NDArray[np.float64], ...]:
+    diffs = points[..., 1:, :] - points[..., :-1, :]
+    dx, dy, dz = diffs[..., 0], diffs[..., 1], diffs[..., 2]
+    inclinations = _compute_inclinations(dx, dy, dz)
+    azimuths = _compute_azimuths(dx, dy)
+    interval_lengths = np.sqrt(dx**2 + dy**2 + dz**2)
+    severities = _compute_dogleg_severities(
+        _compute_dogleg_angles(inclinations, azimuths), interval_lengths
     )
+    return inclinations, azimuths, interval_lengths, severities
+
+
+def compute_dogleg_severities(points: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Compute the dogleg severities of stacked trajectories.
+
+    Args:
+        points (NDArray[np.float64]): (wells x points x 3) trajectory coordinates
+
+    Returns:
+        NDArray[np.float64]: (wells x points) dogleg severities
+    """
+    return _compute_dogleg_geometry(points)[-1]
+
+
+def compute_batch_geometry(
+    points: NDArray[np.float64],
+) -> list[CalculatedTrajectory]:
+    """Compute the geometry of stacked trajectories in a single pass.
+
+    Segment differences are computed once for all wells, the inclinations,
+    azimuths, lengths and dogleg severities are all derived from them.
 
+    Args:
+        points (NDArray[np.float64]): (wells x points x 3) trajectory coordinates
 
-def compute_geometry(trajectory: Trajectory) -> Geometry:
-    return Geometry(
-        deviation=(compute_deviations(trajectory.x), compute_deviations(trajectory.y)),
-        inclination=compute_inclinations(trajectory),
-        azimuths=compute_azimuths(trajectory),
-        lengths=np.cumsum(
-            np.append(0.0, np.array(compute_interval_lengths(trajectory)))
-        ),
+    Returns:
+        list[CalculatedTrajectory]: per well calculations, as views on the
+            stacked results
+    """
+    inclinations, azimuths, interval_lengths, severities = _compute_dogleg_geometry(
+        points
     )
+    deviations = points[..., :2] - points[..., :1, :2]
+    deviations[..., 0, :] = 0.0
+    lengths = np.zeros(severities.shape, dtype=np.float64)
+    np.cumsum(interval_lengths, axis=-1, out=lengths[..., 1:])
+    return [
+        CalculatedTrajectory(
+            coordinates=Trajectory(*points[idx].T),
+            dogleg=severities[idx],
+            deviation=(deviations[idx, :, 0], deviations[idx, :, 1]),
+            inclination=inclinations[idx],
+            azimuth=azimuths[idx],
+            length=lengths[idx],
+        )
+        for idx in range(len(points))
+    ]
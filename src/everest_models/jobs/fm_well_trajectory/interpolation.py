@@ -1,23 +1,42 @@
 import numpy as np
+from numpy.typing import NDArray
 from scipy import interpolate
 
 from everest_models.jobs.fm_well_trajectory.models.data_structs import Trajectory
 
 
+def _arc_length(points: NDArray[np.float64]) -> NDArray[np.float64]:
+    s = np.zeros(points.shape[1], dtype=np.float64)
+    s[1:] = np.linalg.norm(points[:, 1:] - points[:, :-1], axis=0)
+    return np.cumsum(s)
+
+
+class GuidePointInterpolator:
+    """Vector-valued PCHIP interpolation of guide points over their arc length.
+
+    A single spline interpolates all three coordinates, and can be evaluated
+    at any arc length. Construction is cheap enough to rebuild the
+    interpolator after each guide point perturbation.
+    """
+
+    def __init__(self, trajectory: Trajectory) -> None:
+        points = np.array(trajectory, dtype=np.float64)
+        self.arc_length = _arc_length(points)
+        self._spline = interpolate.PchipInterpolator(self.arc_length, points, axis=1)
+
+    def __call__(self, s: NDArray[np.float64]) -> Trajectory:
+        return Trajectory(*self._spline(s))
+
+    def resample(self, n: int) -> Trajectory:
+        """Sample the kickoff and n evenly spaced points from the kickoff onwards."""
+        s = np.empty(n + 1, dtype=np.float64)
+        s[0] = self.arc_length[0]
+        s[1:] = np.linspace(self.arc_length[1], self.arc_length[-1], n)
+        return self(s)
+
+
 def interpolate_points(
     trajectory: Trajectory,
     n: int,
 ) -> Trajectory:
-    x, y, z = trajectory
-    diffs = np.array([x[1:] - x[:-1], y[1:] - y[:-1], z[1:] - z[:-1]])
-    s = np.zeros(len(x), dtype=float)
-    s[1:] = np.linalg.norm(diffs, axis=0)
-    s = np.cumsum(s)
-
-    # Enforce the presence of the kickoff:
-    xvec = np.append(np.linspace(s[0], s[0], 1), np.linspace(s[1], s[-1], n))
-    return Trajectory(
-        x=interpolate.PchipInterpolator(s, x)(xvec),
-        y=interpolate.PchipInterpolator(s, y)(xvec),
-        z=interpolate.PchipInterpolator(s, z)(xvec),
-    )
+    return GuidePointInterpolator(trajectory).resample(n)
@@ -3,7 +3,7 @@ from __future__ import annotations
 import datetime
 import textwrap
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Literal
 
 from pydantic import (
     AfterValidator,
@@ -55,6 +55,27 @@ class InterpolationConfig(ModelConfig):
             gt=0,
         ),
     ]
+    dogleg_repair: Annotated[
+        Literal["step", "line_search"],
+        Field(
+            default="step",
+            description="Simple interpolation only: dogleg repair method. "
+            "'step' moves the most violating guide point by 'trial_step' per trial. "
+            "'line_search' moves all violating guide points per trial, "
+            "searching for the step size down to a 'trial_step' resolution.",
+            examples="line_search",
+        ),
+    ]
+    workers: Annotated[
+        int,
+        Field(
+            default=1,
+            description="Simple interpolation only: number of worker processes "
+            "used to compute the well trajectories in parallel.",
+            examples="4",
+            ge=1,
+        ),
+    ]
     measured_depth_step: Annotated[
         float,
         Field(
@@ -69,7 +90,13 @@ class InterpolationConfig(ModelConfig):
     def check_type(self) -> InterpolationConfig:
         fields_set = self.__pydantic_fields_set__ - {"type"}
         if self.type == "resinsight":
-            fields = ["length", "trial_number", "trial_step"]
+            fields = [
+                "length",
+                "trial_number",
+                "trial_step",
+                "dogleg_repair",
+                "workers",
+            ]
             if fields_set & set(fields):
                 msg = f"Interpolation type 'resinsight': fields not allowed: {fields}"
                 raise ValueError(msg)
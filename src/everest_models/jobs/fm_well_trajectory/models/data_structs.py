@@ -32,19 +32,19 @@ class Well(NamedTuple):
     platform: str | None = None
 
 
-class Geometry(NamedTuple):
-    deviation: tuple[NDArray[np.float64], NDArray[np.float64]]
-    inclination: NDArray[np.float64]
-    azimuths: NDArray[np.float64]
-    lengths: NDArray[np.float64]
-
-
 class Trajectory(NamedTuple):
     x: NDArray[np.float64]
     y: NDArray[np.float64]
     z: NDArray[np.float64]
 
 
+class Deviation(NamedTuple):
+    x: NDArray[np.float64]
+    y: NDArray[np.float64]
+    tvdmsl: NDArray[np.float64]
+    mdmsl: NDArray[np.float64]
+
+
 class CalculatedTrajectory(NamedTuple):
     coordinates: Trajectory
     dogleg: NDArray[np.float64]
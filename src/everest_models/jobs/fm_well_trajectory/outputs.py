@@ -2,14 +2,19 @@ import math
 from collections.abc import Iterable
 from pathlib import Path
 
+import numpy as np
+from numpy.typing import NDArray
+
 from everest_models.jobs.shared import io_utils as io
 
 from .models.config import WellConfig
 from .models.data_structs import CalculatedTrajectory, Trajectory
 
 
-def join_float_values(*values) -> str:
-    return "\t".join(f"{arg:f}" for arg in values)
+def _format_rows(row_format: str, *columns: NDArray[np.float64] | float) -> str:
+    """Format columns of values in bulk, using a printf-style row format."""
+    rows = np.column_stack(np.broadcast_arrays(*columns))
+    return (row_format * len(rows)) % tuple(rows.ravel().tolist())
 
 
 def write_wicalc(
@@ -18,20 +23,18 @@ def write_wicalc(
     path: Path,
 ) -> None:
     with path.open("w", encoding="utf-8") as file_obj:
-        file_obj.writelines(
-            f"{well}\t"
-            + join_float_values(
-                *(coordinate[idx] for coordinate in result.coordinates),
-                *(coordinate[idx + 1] for coordinate in result.coordinates),
-                result.length[idx],
-                result.length[idx + 1],
-                wells[well].radius,
-                wells[well].skin,
+        for well, result in results.items():
+            file_obj.write(
+                _format_rows(
+                    well.replace("%", "%%") + "\t%f" * 10 + "\n",
+                    *(coordinate[:-1] for coordinate in result.coordinates),
+                    *(coordinate[1:] for coordinate in result.coordinates),
+                    result.length[:-1],
+                    result.length[1:],
+                    wells[well].radius,
+                    wells[well].skin,
+                )
             )
-            + "\n"
-            for well, result in results.items()
-            for idx, _ in enumerate(result.coordinates.x[:-1])
-        )
 
 
 def write_resinsight(results: dict[str, CalculatedTrajectory]) -> None:
@@ -39,35 +42,59 @@ def write_resinsight(results: dict[str, CalculatedTrajectory]) -> None:
     for well, result in results.items():
         with open(f"wellpaths/{well}.dev", "w", encoding="utf-8") as file_obj:
             file_obj.write(f"WELLNAME {well}\n")
-            xs, ys, zs = result.coordinates
-            for idx in range(len(xs)):
-                file_obj.write(f"{xs[idx]:<24.4f}")
-                file_obj.write(f"{ys[idx]:<24.4f}")
-                file_obj.write(f"{zs[idx]:<24.4f}")
-                file_obj.write(f"{result.length[idx]:.4f}\n")
+            file_obj.write(
+                _format_rows(
+                    "%-24.4f%-24.4f%-24.4f%.4f\n", *result.coordinates, result.length
+                )
+            )
             file_obj.write("-999\n")
 
 
 def write_path_files(results: Iterable[tuple[Path, CalculatedTrajectory]]) -> None:
-    def f180(a: float) -> float:
-        return a * 180 / math.pi
-
     for well, result in results:
+        azimuths = result.azimuth * 180 / math.pi
         with well.open("w", encoding="utf-8") as file_obj:
-            file_obj.writelines(
-                join_float_values(
-                    result.length[idx],
-                    *(coordinate[idx] for coordinate in result.coordinates),
-                    *(deviation[idx] for deviation in result.deviation),
-                    f if (f := f180(result.azimuth[idx])) >= 0 else (f + 360),
-                    f180(result.inclination[idx]),
-                    result.dogleg[idx],
+            file_obj.write(
+                _format_rows(
+                    "\t".join(["%f"] * 9) + "\n",
+                    result.length,
+                    *result.coordinates,
+                    *result.deviation,
+                    np.where(azimuths >= 0, azimuths, azimuths + 360),
+                    result.inclination * 180 / math.pi,
+                    result.dogleg,
                 )
-                + "\n"
-                for idx, _ in enumerate(result.coordinates.x)
             )
 
 
+def write_geometry_sidecar(
+    results: dict[str, CalculatedTrajectory], filename: Path
+) -> None:
+    """Write the interpolated trajectories to a `.npz` sidecar.
+
+    The arrays of each well are stored as `<well>/<x|y|z|md|inclination|azimuth|dogleg>`,
+    angles in radians.
+    """
+    io.dump_npz(
+        {
+            f"{well}/{name}": array
+            for well, result in results.items()
+            for name, array in zip(
+                ("x", "y", "z", "md", "inclination", "azimuth", "dogleg"),
+                (
+                    *result.coordinates,
+                    result.length,
+                    result.inclination,
+                    result.azimuth,
+                    result.dogleg,
+                ),
+                strict=True,
+            )
+        },
+        filename,
+    )
+
+
 def write_guide_points(guide_points: dict[str, Trajectory], filename: Path) -> None:
     io.dump_json(
         {
@@ -78,6 +105,20 @@ def write_guide_points(guide_points: dict[str, Trajectory], filename: Path) -> N
     )
 
 
+def write_guide_points_sidecar(
+    guide_points: dict[str, Trajectory], filename: Path
+) -> None:
+    """Write the guide points to a `.npz` sidecar, stored as `<well>/<x|y|z>`."""
+    io.dump_npz(
+        {
+            f"{well}/{name}": array
+            for well, data in guide_points.items()
+            for name, array in data._asdict().items()
+        },
+        filename,
+    )
+
+
 def write_mlt_guide_points(guide_points: dict[str, Trajectory], filename: Path) -> None:
     io.dump_json(
         {
@@ -1,11 +1,12 @@
 import argparse
 from functools import partial
+from pathlib import Path
 
 from everest_models.jobs.shared.arguments import (
-    SchemaAction,
     bootstrap_parser,
     get_parser,
 )
+from everest_models.jobs.shared.parsers import SchemaAction
 from everest_models.jobs.shared.validators import (
     parse_file,
     validate_eclipse_path_argparse,
@@ -15,10 +16,25 @@ from .models.config import ConfigSchema
 
 CONFIG_ARG_KEY = "-c/--config"
 ECLIPSE_FILES_ARG_KEY = "-E/--eclipse-model"
+RESINSIGHT_SERVER_ARG_KEY = "--resinsight-server"
 
 SCHEMAS = {CONFIG_ARG_KEY: ConfigSchema}
 
 
+def parse_resinsight_port(value: str) -> int:
+    """Read a port number, given directly or as a file holding the port number."""
+    if not value.isdigit():
+        try:
+            value = Path(value).read_text(encoding="utf-8").strip()
+        except OSError as e:
+            msg = f"Cannot read ResInsight port file: {e}"
+            raise argparse.ArgumentTypeError(msg) from e
+    if not value.isdigit() or not 0 < (port := int(value)) < 65536:
+        msg = f"Invalid ResInsight port: {value}"
+        raise argparse.ArgumentTypeError(msg)
+    return port
+
+
 @bootstrap_parser
 def build_argument_parser(skip_type=False) -> argparse.ArgumentParser:
     SchemaAction.register_models(SCHEMAS)
@@ -46,5 +62,20 @@ def build_argument_parser(skip_type=False) -> argparse.ArgumentParser:
             "CONFIG file then UNRST file expected."
         ),
     )
+    parser.add_argument(
+        RESINSIGHT_SERVER_ARG_KEY,
+        type=parse_resinsight_port if not skip_type else str,
+        help=(
+            "Port number of an already running ResInsight instance to use instead of "
+            "launching one, or a file holding that port number. The loaded grid is "
+            "kept between calls, and reused if the next call has identical EGRID, "
+            "INIT and UNRST files, otherwise it is reloaded. The created well "
+            "paths and plots are removed. Jobs of a user sharing an instance run "
+            "one at a time, they wait for a lock file in the temporary directory. "
+            "This only saves time when the model is shared, e.g. by reruns or "
+            "realizations with a static model; realizations with their own "
+            "results are faster with an instance per job."
+        ),
+    )
 
     return parser
@@ -7,6 +7,7 @@ from typing import Any, Final, NamedTuple
 import numpy as np
 
 from ..shared.io_utils import load_json
+from .deviation import read_deviation_file
 from .models.config import PlatformConfig, WellConfig
 from .models.data_structs import Trajectory
 
@@ -191,24 +192,18 @@ def _find_mlt_p1(
     z = lateral_files[M1][well_name][branch]
 
     # Read the trajectory of the well, which must be available:
-    dev = np.genfromtxt(
-        f"wellpaths/{well_name}.dev",
-        dtype=np.float64,
-        skip_header=1,
-        skip_footer=1,
-        names=True,
-    )
+    dev = read_deviation_file(Path(f"wellpaths/{well_name}.dev"))
 
     # Check the depth we want:
-    if z < dev["TVDMSL"][0] or z > dev["TVDMSL"][-1]:
+    if z < dev.tvdmsl[0] or z > dev.tvdmsl[-1]:
         msg = f"Branch '{branch}' does not start on well '{well_name}'"
         raise ValueError(msg)
 
     # Return the measured depth and the coordinates of the start of the branch:
-    idx = np.argmin(abs(dev["TVDMSL"] - z))
+    idx = np.argmin(abs(dev.tvdmsl - z))
     return (
-        dev["MDMSL"][idx],
-        _Point(x=dev["X"][idx], y=dev["Y"][idx], z=dev["TVDMSL"][idx]),
+        dev.mdmsl[idx],
+        _Point(x=dev.x[idx], y=dev.y[idx], z=dev.tvdmsl[idx]),
     )
 
 
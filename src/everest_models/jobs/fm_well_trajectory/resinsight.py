@@ -1,14 +1,21 @@
 from __future__ import annotations
 
+import collections
+import contextlib
 import datetime
+import filecmp
+import itertools
 import logging
-from collections.abc import Iterable
+import time
+import warnings
+from collections.abc import Collection, Iterable, Iterator, Sequence
 from pathlib import Path
 from textwrap import dedent
-from typing import Any
+from typing import Any, TextIO
 
 import numpy as np
 import pandas as pd
+from numpy.typing import NDArray
 
 try:
     import rips  # ResInsight support is optional
@@ -36,6 +43,85 @@ from .models.data_structs import Trajectory
 
 logger = logging.getLogger(__name__)
 
+_LAS_KEY_CURVES = ("DEPTH", "TVDMSL", "TVDRKB")
+_CHANNEL_CALLS = ("unary_unary", "unary_stream", "stream_unary", "stream_stream")
+
+
+class _CountingCallable:
+    """Count the invocations of a gRPC multi-callable."""
+
+    def __init__(
+        self, multicallable: Any, method: str, counts: collections.Counter[str]
+    ) -> None:
+        self._multicallable = multicallable
+        self._method = method
+        self._counts = counts
+
+    def __call__(self, *args, **kwargs) -> Any:
+        self._counts[self._method] += 1
+        return self._multicallable(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._multicallable, name)
+        if name not in ("future", "with_call"):
+            return attribute
+
+        def call(*args, **kwargs) -> Any:
+            self._counts[self._method] += 1
+            return attribute(*args, **kwargs)
+
+        return call
+
+
+class _CountingChannel:
+    """Wrap a gRPC channel, counting the calls made through it per method."""
+
+    def __init__(self, channel: Any, counts: collections.Counter[str]) -> None:
+        self._channel = channel
+        self._counts = counts
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._channel, name)
+        if name not in _CHANNEL_CALLS:
+            return attribute
+
+        def create(method: str, *args, **kwargs) -> _CountingCallable:
+            return _CountingCallable(
+                attribute(method, *args, **kwargs), method, self._counts
+            )
+
+        return create
+
+
+class RoundTripCounter:
+    """Count and time the gRPC round trips made to ResInsight.
+
+    Objects fetched through an instrumented project share its channel,
+    hence every call made on them is counted.
+    """
+
+    def __init__(self) -> None:
+        self.counts: collections.Counter[str] = collections.Counter()
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def instrument(self, project: rips.Project) -> rips.Project:
+        """Get a copy of the project issuing its calls through a counting channel."""
+        return rips.Project.create(_CountingChannel(project.channel(), self.counts))
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Log the round trips made, and the time spent, within a stage."""
+        total = self.total
+        start = time.perf_counter()
+        yield
+        logger.info(
+            f"ResInsight {name}: {self.total - total} round trips "
+            f"in {time.perf_counter() - start:.2f}s"
+        )
+
 
 def _create_perforation_view(
     perforations: Iterable[PerforationConfig],
@@ -49,19 +135,64 @@ def _create_perforation_view(
     case.create_view().set_time_step(-1)
 
 
-def read_wells(
+def _same_model(loaded: Path, grid_file: Path) -> bool:
+    """Check if two models have the same grid, and the same INIT and UNRST files."""
+    if loaded.resolve() == grid_file.resolve():
+        return True
+    try:
+        return filecmp.cmp(loaded, grid_file, shallow=False) and all(
+            filecmp.cmp(first, second, shallow=False)
+            if first.exists() and second.exists()
+            else first.exists() == second.exists()
+            for first, second in (
+                (loaded.with_suffix(suffix), grid_file.with_suffix(suffix))
+                for suffix in (".INIT", ".UNRST")
+            )
+        )
+    except OSError:
+        return False
+
+
+def load_case(project: rips.Project, grid_file: Path) -> rips.Case:
+    """Load a grid case, reusing the loaded case if it holds the same model.
+
+    The case is reused if its grid, INIT and UNRST files are identical to
+    those of the given grid, e.g. when realizations share a static model.
+    Any other loaded case is closed first, so that the grid is the only case.
+
+    Args:
+        project (rips.Project): ResInsight project
+        grid_file (Path): EGRID file path
+
+    Returns:
+        rips.Case: loaded case
+    """
+    cases = project.cases()
+    if len(cases) == 1 and _same_model(Path(cases[0].file_path), grid_file):
+        logger.info(f"Reusing loaded case: {cases[0].file_path}")
+        return cases[0]
+    if cases:
+        project.close()
+    return project.load_case(str(grid_file))
+
+
+def clear_project(project: rips.Project) -> None:
+    """Delete the plots, views and well paths created, keeping loaded cases."""
+    for pdm_object in itertools.chain(
+        project.descendants(rips.WellLogPlot),
+        project.descendants(rips.CurveIntersection),
+        (view for case in project.cases() for view in case.views()),
+        project.well_paths(),
+    ):
+        pdm_object.delete()
+    project.update()
+
+
+def _create_perforation_views(
     project: rips.Project,
-    well_path_folder: Path,
     well_names: Iterable[str],
     connection: ConnectionConfig | None,
 ) -> None:
-    project.import_well_paths(
-        well_path_files=[
-            str(well_path_folder / f"{well_name}.dev") for well_name in well_names
-        ],
-        well_path_folder=str(well_path_folder),
-    )
-
     if connection is not None:
         for well_name in well_names:
             _create_perforation_view(
@@ -74,102 +205,189 @@ def read_wells(
     project.update()
 
 
-def create_well(
-    connection: ConnectionConfig,
-    well_config: WellConfig,
-    guide_points: Trajectory,
+def read_wells(
     project: rips.Project,
-) -> rips.ModeledWellPath:
-    _create_perforation_view(
-        connection.perforations,
-        connection.formations_file,
-        project.cases()[0],
-        well_config.name,
+    well_path_folder: Path,
+    well_names: Iterable[str],
+    connection: ConnectionConfig | None,
+) -> None:
+    project.import_well_paths(
+        well_path_files=[
+            str(well_path_folder / f"{well_name}.dev") for well_name in well_names
+        ],
+        well_path_folder=str(well_path_folder),
+    )
+    _create_perforation_views(project, well_names, connection)
+
+
+def can_import_wells(project: rips.Project) -> bool:
+    """Check if ResInsight can create well paths from points directly."""
+    return _HAVE_RIPS and hasattr(
+        project.descendants(rips.WellPathCollection)[0],
+        "import_well_path_from_points",
     )
 
-    if not _HAVE_RIPS:
-        msg = "Failed to launch ResInsight: module `rips` not found"
-        raise ImportError(msg)
 
+def import_wells(
+    project: rips.Project,
+    trajectories: dict[str, Trajectory],
+    connection: ConnectionConfig | None,
+) -> None:
+    """Create point based well paths from trajectories held in memory.
+
+    Avoids writing and parsing deviation files. ResInsight expects elevations,
+    negative downwards, while the trajectories hold depths. The measured depths
+    are computed by ResInsight along the points, from the platform at depth 0,
+    as written to the deviation files.
+
+    Args:
+        project (rips.Project): ResInsight project
+        trajectories (dict[str, Trajectory]): interpolated trajectory per well
+        connection (ConnectionConfig | None): connections configuration
+    """
     well_path_collection = project.descendants(rips.WellPathCollection)[0]
-    well_path = well_path_collection.add_new_object(rips.ModeledWellPath)
-    well_path.name = well_config.name
-    well_path.update()
-
-    geometry = well_path.well_path_geometry()
-    reference_point = geometry.reference_point
-    reference_point[0] = str(guide_points.x[0])
-    reference_point[1] = str(guide_points.y[0])
-    reference_point[2] = str(guide_points.z[0])
-    geometry.update()
+    for well_name, trajectory in trajectories.items():
+        well_path_collection.import_well_path_from_points(
+            well_name,
+            np.column_stack((trajectory.x, trajectory.y, -trajectory.z)).tolist(),
+        )
+    _create_perforation_views(project, trajectories, connection)
 
-    intersection_points = []
-    for point in zip(
-        guide_points.x[1:], guide_points.y[1:], guide_points.z[1:], strict=False
-    ):
-        coord = [str(item) for item in point]
+
+def _append_targets(
+    geometry: rips.WellPathGeometry, guide_points: Trajectory, dogleg: float
+) -> list[list[str]]:
+    coordinates = [
+        [str(item) for item in point]
+        for point in zip(
+            guide_points.x[1:], guide_points.y[1:], guide_points.z[1:], strict=False
+        )
+    ]
+    for coord in coordinates:
         target = geometry.append_well_target(coordinate=coord, absolute=True)
-        target.dogleg1 = well_config.dogleg
-        target.dogleg2 = well_config.dogleg
-        target.update()
-        intersection_points.append(coord)
+        # Targets are created with default doglegs, only update them if needed:
+        if target.dogleg1 != dogleg or target.dogleg2 != dogleg:
+            target.dogleg1 = dogleg
+            target.dogleg2 = dogleg
+            target.update()
     geometry.update()
+    return coordinates
 
-    intersection_collection = project.descendants(rips.IntersectionCollection)[0]
+
+def _add_intersection(
+    intersection_collection: rips.IntersectionCollection,
+    intersection_points: list[list[str]],
+) -> None:
     intersection = intersection_collection.add_new_object(rips.CurveIntersection)
     intersection.points = intersection_points
     intersection.update()
 
-    for well in geometry.well_path_targets():
-        logger.info(
-            "\t".join(
-                (
-                    f"DL1: {well.dogleg1}",
-                    f"DL2: {well.dogleg2}",
-                    f"Azi: {well.azimuth}",
-                    f"Incl: {well.inclination}",
+
+def create_wells(
+    connection: ConnectionConfig,
+    wells: Iterable[WellConfig],
+    guide_points: dict[str, Trajectory],
+    project: rips.Project,
+) -> dict[str, rips.ModeledWellPath]:
+    """Create modeled well paths through the guide points of each well.
+
+    The case and the collections holding the well paths and intersections
+    are looked up once for all wells.
+
+    Args:
+        connection (ConnectionConfig): connections configuration
+        wells (Iterable[WellConfig]): wells to create
+        guide_points (dict[str, Trajectory]): guide points per well
+        project (rips.Project): ResInsight project
+
+    Returns:
+        dict[str, rips.ModeledWellPath]: created well path per well
+    """
+    if not _HAVE_RIPS:
+        msg = "Failed to launch ResInsight: module `rips` not found"
+        raise ImportError(msg)
+
+    case = project.cases()[0]
+    well_path_collection = project.descendants(rips.WellPathCollection)[0]
+    intersection_collection = project.descendants(rips.IntersectionCollection)[0]
+
+    well_paths = {}
+    for well_config in wells:
+        _create_perforation_view(
+            connection.perforations,
+            connection.formations_file,
+            case,
+            well_config.name,
+        )
+        points = guide_points[well_config.name]
+
+        well_path = well_path_collection.add_new_object(rips.ModeledWellPath)
+        well_path.name = well_config.name
+        well_path.update()
+
+        geometry = well_path.well_path_geometry()
+        reference_point = geometry.reference_point
+        reference_point[0] = str(points.x[0])
+        reference_point[1] = str(points.y[0])
+        reference_point[2] = str(points.z[0])
+        geometry.update()
+
+        _add_intersection(
+            intersection_collection,
+            _append_targets(geometry, points, well_config.dogleg),
+        )
+
+        for well in geometry.well_path_targets():
+            logger.info(
+                "\t".join(
+                    (
+                        f"DL1: {well.dogleg1}",
+                        f"DL2: {well.dogleg2}",
+                        f"Azi: {well.azimuth}",
+                        f"Incl: {well.inclination}",
+                    )
                 )
             )
-        )
+        well_paths[well_config.name] = well_path
 
-    return well_path
+    return well_paths
 
 
 def create_branches(
-    well_config: WellConfig,
-    well_path: rips.ModeledWellPath,
-    mlt_guide_points: dict[str, tuple[float, Trajectory]],
+    wells: Iterable[WellConfig],
+    well_paths: dict[str, rips.ModeledWellPath],
+    mlt_guide_points: dict[str, dict[str, tuple[float, Trajectory]]],
     project: rips.Project,
-) -> Any:
+) -> None:
+    """Append the lateral branches of multi-lateral wells to their well paths.
+
+    Args:
+        wells (Iterable[WellConfig]): well configurations
+        well_paths (dict[str, rips.ModeledWellPath]): main well path per well
+        mlt_guide_points (dict[str, dict[str, tuple[float, Trajectory]]]):
+            measured depth and guide points of each branch, per well
+        project (rips.Project): ResInsight project
+    """
     if not _HAVE_RIPS:
         msg = "Failed to launch ResInsight: module `rips` not found"
         raise ImportError(msg)
 
-    for md, guide_points in mlt_guide_points.values():
-        lateral = well_path.append_lateral(md)
-        geometry = lateral.well_path_geometry()
-
-        intersection_points = []
-        for point in zip(
-            guide_points.x[1:], guide_points.y[1:], guide_points.z[1:], strict=False
-        ):
-            coord = [str(item) for item in point]
-            target = geometry.append_well_target(coordinate=coord, absolute=True)
-            target.dogleg1 = well_config.dogleg
-            target.dogleg2 = well_config.dogleg
-            target.update()
-            intersection_points.append(coord)
-        geometry.update()
-
-        intersection_collection = project.descendants(rips.IntersectionCollection)[0]
-        intersection = intersection_collection.add_new_object(rips.CurveIntersection)
-        intersection.points = intersection_points
-        intersection.update()
+    intersection_collection = project.descendants(rips.IntersectionCollection)[0]
+    for well_config in wells:
+        for md, guide_points in mlt_guide_points.get(well_config.name, {}).values():
+            lateral = well_paths[well_config.name].append_lateral(md)
+            _add_intersection(
+                intersection_collection,
+                _append_targets(
+                    lateral.well_path_geometry(), guide_points, well_config.dogleg
+                ),
+            )
 
 
-def _find_time_step(case: rips.Case, date: datetime.date | None = None) -> int | None:
+def _find_time_step(
+    time_steps: Sequence[Any], date: datetime.date | None = None
+) -> int | None:
     time_step_num = None
-    time_steps = case.time_steps()
     for ts_idx, time_step in enumerate(time_steps):
         date_simgrid = datetime.date(time_step.year, time_step.month, time_step.day)
         if date_simgrid == date:
@@ -185,12 +403,13 @@ def _create_tracks(
     properties: Iterable[DynamicDomainProperty | StaticDomainProperty],
     property_type: str,
     case: rips.Case,
+    time_steps: Sequence[Any],
     well_path: rips.WellPath,
     well_log_plot: rips.WellLogPlot,
 ) -> None:
     for property in properties:
         time_step_num = (
-            _find_time_step(case, property.date)
+            _find_time_step(time_steps, property.date)
             if isinstance(property, DynamicDomainProperty)
             else 0
         )
@@ -209,6 +428,7 @@ def create_well_logs(
     project_path: Path,
 ) -> None:
     case = project.cases()[0]
+    time_steps: list[Any] | None = None
 
     well_log_plot_collection = project.descendants(rips.WellLogPlotCollection)[0]
 
@@ -231,10 +451,13 @@ def create_well_logs(
                 raise RuntimeError(
                     f"Dynamic perforations specified, but {restart} file not found. "
                 )
+            if time_steps is None:
+                time_steps = case.time_steps()
             _create_tracks(
                 perforation.dynamic,
                 "DYNAMIC_NATIVE",
                 case,
+                time_steps,
                 well_path,
                 well_log_plot,
             )
@@ -243,6 +466,7 @@ def create_well_logs(
                 perforation.static,
                 "STATIC_NATIVE",
                 case,
+                (),
                 well_path,
                 well_log_plot,
             )
@@ -265,54 +489,151 @@ def create_well_logs(
 
 
 def _filter_properties(
-    conditions: pd.Series,
+    conditions: NDArray[np.bool_],
     df: pd.DataFrame,
     properties: tuple[DynamicDomainProperty | StaticDomainProperty, ...],
-) -> pd.Series:
+) -> NDArray[np.bool_]:
     for property in properties:
+        values = df[property.key].to_numpy()
         if property.min is not None:
-            conditions = conditions & (df[property.key] > property.min)
+            conditions &= values > property.min
         if property.max is not None:
-            conditions = conditions & (df[property.key] < property.max)
+            conditions &= values < property.max
     return conditions
 
 
+def _perforation_intervals(
+    depths: NDArray[np.float64], mask: NDArray[np.bool_]
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Start and end depths of the contiguous runs of selected log samples.
+
+    Runs of a single sample have no length, and are dropped.
+
+    Args:
+        depths (NDArray[np.float64]): measured depth of each log sample
+        mask (NDArray[np.bool_]): samples selected for perforation
+
+    Returns:
+        tuple[NDArray[np.float64], NDArray[np.float64]]: interval starts and ends
+    """
+    edges = np.flatnonzero(np.diff(mask, prepend=False, append=False))
+    starts, ends = depths[edges[::2]], depths[edges[1::2] - 1]
+    keep = ends > starts
+    return starts[keep], ends[keep]
+
+
 def _select_perforations(
     perforation: PerforationConfig, df: pd.DataFrame
-) -> tuple[pd.Series, float | None]:
+) -> tuple[NDArray[np.float64], NDArray[np.float64], float | None]:
     well_depth = df["DEPTH"].max()
     logger.info(f"Well total measured depth: {well_depth}")
 
     if not df.empty:
+        depths = df["DEPTH"].to_numpy()
         return (
-            _filter_perforation_properties(perforation, df, df["DEPTH"] > 0.0),
+            *_perforation_intervals(
+                depths, _filter_perforation_properties(perforation, df, depths > 0.0)
+            ),
             well_depth,
         )
     logger.warning("Well log empty")
-    return df["DEPTH"], None
+    return np.empty(0), np.empty(0), None
 
 
 def _filter_perforation_properties(
-    perforation: PerforationConfig, df: pd.DataFrame, conditions: pd.Series
-):
+    perforation: PerforationConfig, df: pd.DataFrame, conditions: NDArray[np.bool_]
+) -> NDArray[np.bool_]:
     # Filter formations
     if perforation.formations:
-        conditions = df["ACTIVE_FORMATION_NAMES"].isin(perforation.formations)
+        conditions = np.isin(
+            df["ACTIVE_FORMATION_NAMES"].to_numpy(), perforation.formations
+        )
 
     # Filter dynamic and static properties
     conditions = _filter_properties(conditions, df, perforation.dynamic)
-    conditions = _filter_properties(conditions, df, perforation.static)
-
-    df_selected = df.loc[conditions]
-    df_selected.describe().loc[["min", "max"]]
+    return _filter_properties(conditions, df, perforation.static)
 
-    return df_selected["DEPTH"]
 
-
-def _read_las_file(las: Path) -> pd.DataFrame:
+def _perforation_curves(perforation: PerforationConfig) -> set[str]:
+    curves = {*_LAS_KEY_CURVES}
+    curves.update(item.key for item in (*perforation.dynamic, *perforation.static))
+    if perforation.formations:
+        curves.add("ACTIVE_FORMATION_NAMES")
+    return curves
+
+
+def _read_las_header(fp: TextIO) -> tuple[list[str], float | None] | None:
+    """Read the curve mnemonics and null value, up to the data section.
+
+    Returns None for wrapped files, which are left to `lasio`.
+    """
+    section = ""
+    mnemonics: list[str] = []
+    null = None
+    for line in fp:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("~"):
+            section = line[1:2].upper()
+            if section == "A":
+                return mnemonics, null
+            continue
+        mnemonic, _, rest = line.partition(".")
+        mnemonic = mnemonic.strip().upper()
+        value = rest.rpartition(":")[0].partition(" ")[2]  # drop the unit
+        if section == "V" and mnemonic == "WRAP" and value.strip().upper() != "NO":
+            return None
+        if section == "W" and mnemonic == "NULL":
+            null = float(value)
+        elif section == "C":
+            mnemonics.append(mnemonic)
+    return None
+
+
+def _read_las_file(las: Path, curves: Collection[str] | None = None) -> pd.DataFrame:
+    """Read a LAS file, loading only the requested curves.
+
+    The first (index) curve is always loaded. Null values are replaced by NaN.
+    Files that cannot be read column-wise, such as wrapped files, are read
+    in full by `lasio`.
+
+    Args:
+        las (Path): LAS file path
+        curves (Collection[str] | None, optional): upper case curve mnemonics
+            to load, all curves if None. Defaults to None.
+
+    Returns:
+        pd.DataFrame: curve values, one column per curve
+    """
     if not _HAVE_LASIO:
         raise ImportError("Failed to read LAS file: module `lasio` not found")
-    return lasio.read(las).df().reset_index()
+    with las.open(encoding="utf-8") as fp:
+        header = _read_las_header(fp)
+        if header is not None and len(set(header[0])) == len(header[0]):
+            mnemonics, null = header
+            columns = [
+                idx
+                for idx, mnemonic in enumerate(mnemonics)
+                if curves is None or idx == 0 or mnemonic in curves
+            ]
+            try:
+                with warnings.catch_warnings():
+                    # Logs of wells outside the grid have no data
+                    warnings.filterwarnings(
+                        "ignore", "loadtxt: input contained no data"
+                    )
+                    values = np.loadtxt(fp, usecols=columns, ndmin=2)
+            except ValueError:
+                pass
+            else:
+                if null is not None:
+                    values[values == null] = np.nan
+                return pd.DataFrame(values, columns=[mnemonics[idx] for idx in columns])
+    df = lasio.read(las).df().reset_index()
+    return (
+        df if curves is None else df[[df.columns[0], *df.columns.intersection(curves)]]
+    )
 
 
 def perforate_all_wells(
@@ -322,6 +643,7 @@ def perforate_all_wells(
     project_path: Path,
 ) -> list[WellConfig]:
     filtered_wells: list[WellConfig] = []
+    case = project.cases()[0]
     for well_path in project.well_paths():
         # If we created multi-lateral wells, the well path names are stored in the
         # form "name Y#", e.g., "INJ Y1", where the index Y# indicates the number of
@@ -333,8 +655,10 @@ def perforate_all_wells(
         perforation_cfg = next(
             item for item in perforations if item.well == well_name_base
         )
-        df = _read_and_merge_las(project_path, well_name)
-        perf_depths, well_depth = _select_perforations(perforation_cfg, df)
+        df = _read_and_merge_las(
+            project_path, well_name, _perforation_curves(perforation_cfg)
+        )
+        starts, ends, well_depth = _select_perforations(perforation_cfg, df)
         well_cfg = next(item for item in wells if item.name == well_name_base)
         if well_depth is not None:
             filtered_wells.append(well_cfg)
@@ -343,9 +667,10 @@ def perforate_all_wells(
             ".SCH"
         )
         _apply_perforations(
-            project,
-            project.well_path_by_name(well_name),
-            perf_depths,
+            case,
+            well_path,
+            starts,
+            ends,
             well_depth,
             well_cfg,
             export_filename,
@@ -355,7 +680,7 @@ def perforate_all_wells(
             well_cfg.phase,
             well_cfg.group,
             export_filename,
-            perf_depths,
+            starts,
             project_path,
         )
 
@@ -365,9 +690,10 @@ def perforate_all_wells(
 
 
 def _apply_perforations(
-    project: rips.Project,
+    case: rips.Case,
     well_path_obj: rips.WellPath,
-    perf_depths: pd.Series,
+    starts: NDArray[np.float64],
+    ends: NDArray[np.float64],
     well_depth: float | None,
     well_cfg: WellConfig,
     export_filename: Path,
@@ -376,20 +702,17 @@ def _apply_perforations(
         logger.info(f"Skipping well {well_path_obj.name}: no depth data.")
         return
 
-    total_perf_length = 0
-    if perf_depths.size > 0:
-        for start, end in zip(
-            perf_depths.iloc[::2], perf_depths.iloc[1::2], strict=False
-        ):
+    if starts.size > 0:
+        for start, end in zip(starts.tolist(), ends.tolist(), strict=True):
             well_path_obj.append_perforation_interval(
                 start_md=start,
                 end_md=end,
                 diameter=2 * well_cfg.radius,
                 skin_factor=well_cfg.skin,
             )
-            total_perf_length = round(total_perf_length + end - start, 2)
         logger.info(
-            f"Total perforation length for {well_path_obj.name}: {total_perf_length}"
+            f"Total perforation length for {well_path_obj.name}: "
+            f"{round(float(np.sum(ends - starts)), 2)}"
         )
     else:
         # Dummy connection
@@ -401,7 +724,7 @@ def _apply_perforations(
         )
 
     logger.info(f"Exporting well completion data to: {export_filename}")
-    project.cases()[0].export_well_path_completions(
+    case.export_well_path_completions(
         time_step=0,
         well_path_names=[well_path_obj.name],
         file_split="UNIFIED_FILE",
@@ -411,12 +734,14 @@ def _apply_perforations(
     )
 
 
-def _read_and_merge_las(path: Path, well_name: str) -> pd.DataFrame:
+def _read_and_merge_las(
+    path: Path, well_name: str, curves: Collection[str] | None = None
+) -> pd.DataFrame:
     # LAS files are generated per track (well?) for each date
     # a property is extracted from ResInsight, in the form:
     # <well_name>-<case_name>-(<property>)-<date>.las
     files = sorted(path.glob(f"{well_name.replace(' ', '_')}*.las"))
-    dfs = [_read_las_file(file) for file in files]
+    dfs = [_read_las_file(file, curves) for file in files]
 
     if not dfs:
         logger.warning(f"No LAS files found for well `{well_name}` in path `{path}`")
@@ -424,13 +749,12 @@ def _read_and_merge_las(path: Path, well_name: str) -> pd.DataFrame:
 
     # All LAS files should at least contain these key columns, we also
     # should verify that DEPTH values are the same across all files:
-    key_cols = ["DEPTH", "TVDMSL", "TVDRKB"]
-    first_depth = dfs[0]["DEPTH"].tolist()
+    first_depth = dfs[0]["DEPTH"].to_numpy() if "DEPTH" in dfs[0] else None
     first_length = len(dfs[0])
 
+    columns: dict[str, NDArray[np.float64]] = {}
     for i, df in enumerate(dfs):
-        missing = [col for col in key_cols if col not in df.columns]
-        if missing:
+        if any(col not in df.columns for col in _LAS_KEY_CURVES):
             logger.warning(
                 f"No non-empty LAS files found for well `{well_name}` in path `{path}`"
             )
@@ -444,17 +768,17 @@ def _read_and_merge_las(path: Path, well_name: str) -> pd.DataFrame:
                 f"LAS file {files[i].stem} has {len(df)} rows, expected {first_length}"
             )
 
-        if not np.allclose(df["DEPTH"], first_depth, atol=1e-6):
+        if not np.allclose(df["DEPTH"].to_numpy(), first_depth, atol=1e-6):
             logger.error(f"DEPTH values do not match for LAS file {files[i].stem}")
             raise ValueError(f"DEPTH values do not match for LAS file {files[i].stem}")
 
-    if len(dfs) == 1:
-        return dfs[0]
+        # Here we assume all LAS files have the same size, the key columns
+        # are taken from the first file:
+        for name in df.columns:
+            if i == 0 or name not in _LAS_KEY_CURVES:
+                columns[name] = df[name].to_numpy()
 
-    # Here we assume all LAS files have the same size
-    base = dfs[0]
-    others = [df.drop(columns=key_cols, errors="ignore") for df in dfs[1:]]
-    return pd.concat([base] + others, axis=1)
+    return dfs[0] if len(dfs) == 1 else pd.DataFrame(columns)
 
 
 def _generate_welspecs(
@@ -462,7 +786,7 @@ def _generate_welspecs(
     phase: PhaseEnum,
     group: str,
     export_filename: Path,
-    perf_depths: pd.Series,
+    perf_depths: NDArray[np.float64],
     project_path: Path,
 ) -> None:
     #### edit well group name in WELSPECS in the exported schedule file
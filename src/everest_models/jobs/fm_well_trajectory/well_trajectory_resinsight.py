@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import fcntl
 import logging
+import os
 import signal
 import sys
+import tempfile
 from pathlib import Path
 
 try:
@@ -18,9 +21,14 @@ from .models.config import ConfigSchema
 from .outputs import write_well_costs, write_well_lengths
 from .read_trajectories import read_laterals
 from .resinsight import (
+    RoundTripCounter,
+    can_import_wells,
+    clear_project,
     create_branches,
-    create_well,
     create_well_logs,
+    create_wells,
+    import_wells,
+    load_case,
     perforate_all_wells,
     read_wells,
 )
@@ -31,9 +39,32 @@ from .well_trajectory_simple import Trajectory
 logger = logging.getLogger(__name__)
 
 
+def _lock_path(port: int) -> Path:
+    return (
+        Path(tempfile.gettempdir())
+        / f"everest-models-resinsight-{os.getuid()}-{port}.lock"
+    )
+
+
+def _lock_server(port: int) -> int:
+    """Lock the ResInsight server on a port, waiting for other jobs using it."""
+    fd = os.open(_lock_path(port), os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, 0o600)
+    try:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            logger.info(f"Waiting for other jobs using ResInsight on port {port}...")
+            fcntl.flock(fd, fcntl.LOCK_EX)
+    except BaseException:
+        os.close(fd)
+        raise
+    return fd
+
+
 class ResInsight:
-    def __init__(self, executable: str = "") -> None:
+    def __init__(self, executable: str = "", port: int | None = None) -> None:
         self._executable = executable
+        self._port = port
         signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
         signal.signal(signal.SIGINT, lambda *_: sys.exit(0))
 
@@ -41,6 +72,15 @@ class ResInsight:
         if not _HAVE_RIPS:
             msg = "Failed to launch ResInsight: module `rips` not found"
             raise ImportError(msg)
+        if self._port is not None:
+            # The project of the server is shared, use it one job at a time
+            self._lock = _lock_server(self._port)
+            try:
+                self._instance = self._connect()
+            except BaseException:
+                os.close(self._lock)
+                raise
+            return self._instance
         logger.info("Launching ResInsight...")
         try:
             instance = rips.Instance.launch(
@@ -55,6 +95,14 @@ class ResInsight:
         self._instance = instance
         return instance
 
+    def _connect(self) -> rips.Instance:
+        logger.info(f"Connecting to ResInsight on port {self._port}...")
+        try:
+            return rips.Instance(port=self._port)
+        except _RIPS_LAUNCH_ERROR as exc:
+            msg = f"Failed to connect to ResInsight on port {self._port}"
+            raise ConnectionError(msg) from exc
+
     def _launch_error_message(self) -> str:
         return (
             "Failed to launch ResInsight: no executable found"
@@ -63,7 +111,14 @@ class ResInsight:
         )
 
     def __exit__(self, *_) -> None:
-        self._instance.exit()
+        if self._port is None:
+            self._instance.exit()
+        else:
+            # Leave the running instance, and its loaded grid, to the next caller
+            try:
+                clear_project(self._instance.project)
+            finally:
+                os.close(self._lock)
 
 
 def _save_project(project_path: str, project: rips.Project):
@@ -85,70 +140,70 @@ def well_trajectory_resinsight(
     eclipse_model: Path,
     guide_points: dict[str, Trajectory],
     project_path: Path | None = None,
+    trajectories: dict[str, Trajectory] | None = None,
+    server_port: int | None = None,
 ) -> None:
     mlt_guide_points = {}
     if project_path is None:
         project_path = Path.cwd()
     with ResInsight(
-        "" if config.resinsight_binary is None else str(config.resinsight_binary)
+        "" if config.resinsight_binary is None else str(config.resinsight_binary),
+        port=server_port,
     ) as resinsight:
-        resinsight.project.load_case(str(eclipse_model.with_suffix(".EGRID")))
+        round_trips = RoundTripCounter()
+        project = round_trips.instrument(resinsight.project)
+        with round_trips.stage("load case"):
+            load_case(project, eclipse_model.with_suffix(".EGRID"))
 
         if config.interpolation.type == "resinsight":
             # Interpolate trajectories, keep the created well paths inc case we
             # will turn them into multi-lateral trajectories below:
-            well_paths = {
-                well_config.name: create_well(
-                    config.connections,
-                    well_config,
-                    guide_points[well_config.name],
-                    resinsight.project,
+            with round_trips.stage("create wells"):
+                well_paths = create_wells(
+                    config.connections, config.wells, guide_points, project
+                )
+                _save_paths(
+                    project_path, project, config.interpolation.measured_depth_step
                 )
-                for well_config in config.wells
-            }
-            _save_paths(
-                project_path,
-                resinsight.project,
-                config.interpolation.measured_depth_step,
-            )
 
             mlt_guide_points = read_laterals(config.wells)
             if mlt_guide_points:
                 # Create multi-lateral trajectories based on the trajectories we
                 # made before:
-                for well_config in config.wells:
-                    if well_config.name in mlt_guide_points:
-                        create_branches(
-                            well_config,
-                            well_paths[well_config.name],
-                            mlt_guide_points[well_config.name],
-                            resinsight.project,
-                        )
-                _save_paths(
-                    project_path,
-                    resinsight.project,
-                    config.interpolation.measured_depth_step,
-                )
+                with round_trips.stage("create branches"):
+                    create_branches(config.wells, well_paths, mlt_guide_points, project)
+                    _save_paths(
+                        project_path,
+                        project,
+                        config.interpolation.measured_depth_step,
+                    )
+        elif trajectories is not None and can_import_wells(project):
+            # Simple interpolation, hand over the trajectories in memory:
+            with round_trips.stage("import wells"):
+                import_wells(project, trajectories, config.connections)
         else:
             # Simple interpolation, use saved trajectories:
-            read_wells(
-                resinsight.project,
-                project_path / "wellpaths",
-                [well.name for well in config.wells],
-                config.connections,
+            with round_trips.stage("read wells"):
+                read_wells(
+                    project,
+                    project_path / "wellpaths",
+                    [well.name for well in config.wells],
+                    config.connections,
+                )
+        with round_trips.stage("well logs"):
+            create_well_logs(
+                config.connections.perforations,
+                project,
+                eclipse_model,
+                project_path,
+            )
+        with round_trips.stage("perforations"):
+            wells = perforate_all_wells(
+                project,
+                config.connections.perforations,
+                config.wells,
+                project_path,
             )
-        create_well_logs(
-            config.connections.perforations,
-            resinsight.project,
-            eclipse_model,
-            project_path,
-        )
-        wells = perforate_all_wells(
-            resinsight.project,
-            config.connections.perforations,
-            config.wells,
-            project_path,
-        )
         if config.npv_input_file is not None:
             write_well_costs(
                 costs=compute_well_costs(wells),
@@ -158,6 +213,10 @@ def well_trajectory_resinsight(
             logger.info("Writing well lengths to wells file")
             write_well_lengths(compute_well_lengths(wells), config.wells_file)
 
-        _save_project(project_path, resinsight.project)
+        _save_project(project_path, project)
+        logger.info(
+            f"ResInsight round trips: {round_trips.total}, "
+            f"by method: {dict(round_trips.counts.most_common())}"
+        )
 
     return mlt_guide_points
@@ -1,16 +1,20 @@
 import logging
-from collections.abc import Iterable, Iterator
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
 import numpy as np
-from numpy.typing import NDArray
 
-from .dogleg import compute_dogleg_severity, try_fixing_dog_leg
-from .geometry import compute_geometry
+from everest_models.jobs.shared.io_utils import compact_output
+
+from .dogleg import compute_dogleg_severity, repair_dog_leg, try_fixing_dog_leg
+from .geometry import compute_batch_geometry, stack_trajectories
 from .interpolation import interpolate_points
 from .models.config import InterpolationConfig, WellConfig
 from .models.data_structs import CalculatedTrajectory, Trajectory
 from .outputs import (
+    write_geometry_sidecar,
     write_path_files,
     write_resinsight,
     write_well_costs,
@@ -40,26 +44,31 @@ def _check_kickoff_alignment(
         )
 
 
-def _generate_coordinates_dogleg(
-    wells: Iterable[WellConfig],
+def _calculate_trajectory(
+    well: WellConfig,
+    trajectory: Trajectory,
     interpolation: InterpolationConfig,
-    trajectories: dict[str, Trajectory],
-) -> Iterator[tuple[str, Trajectory, NDArray[np.float64]]]:
-    for well in wells:
-        trajectory = trajectories[well.name]
-        for _ in range(interpolation.trial_number):
-            if trajectory.x is not None:
-                coordinates = interpolate_points(trajectory, interpolation.length)
-                dogleg_severities = compute_dogleg_severity(coordinates)
-            if np.amax(dogleg_severities) < well.dogleg:
-                break
-            trajectory = try_fixing_dog_leg(
-                interpolation.trial_step, trajectory, coordinates, dogleg_severities
-            )
-        else:
-            logger.warning("Maximum iteration reached, well skipped")
-            continue
-        yield well.name, coordinates, dogleg_severities
+) -> Trajectory | None:
+    if interpolation.dogleg_repair == "line_search":
+        return repair_dog_leg(
+            trajectory,
+            partial(interpolate_points, n=interpolation.length),
+            well.dogleg,
+            interpolation.trial_number,
+            interpolation.trial_step,
+        )
+    for _ in range(interpolation.trial_number):
+        if trajectory.x is not None:
+            coordinates = interpolate_points(trajectory, interpolation.length)
+            dogleg_severities = compute_dogleg_severity(coordinates)
+        if np.amax(dogleg_severities) < well.dogleg:
+            break
+        trajectory = try_fixing_dog_leg(
+            interpolation.trial_step, trajectory, coordinates, dogleg_severities
+        )
+    else:
+        return None
+    return coordinates
 
 
 def _compute_well_trajectory(
@@ -67,13 +76,31 @@ def _compute_well_trajectory(
     interpolation: InterpolationConfig,
     trajectories: dict[str, Trajectory],
 ) -> dict[str, CalculatedTrajectory]:
+    wells = tuple(wells)
     _check_kickoff_alignment(wells, trajectories)
-    return {
-        well: CalculatedTrajectory(coordinates, dogleg, *compute_geometry(coordinates))
-        for well, coordinates, dogleg in _generate_coordinates_dogleg(
-            wells, interpolation, trajectories
+    calculate = partial(_calculate_trajectory, interpolation=interpolation)
+    guide_points = [trajectories[well.name] for well in wells]
+    if (workers := min(interpolation.workers, len(wells))) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(calculate, wells, guide_points))
+    else:
+        results = list(map(calculate, wells, guide_points))
+
+    calculated = {}
+    for well, coordinates in zip(wells, results, strict=True):
+        if coordinates is None:
+            logger.warning("Maximum iteration reached, well skipped")
+            continue
+        calculated[well.name] = coordinates
+    if not calculated:
+        return {}
+    return dict(
+        zip(
+            calculated,
+            compute_batch_geometry(stack_trajectories(list(calculated.values()))),
+            strict=True,
         )
-    }
+    )
 
 
 def well_trajectory_simple(
@@ -82,7 +109,7 @@ def well_trajectory_simple(
     npv_input_file: Path | None,
     wells_file: Path | None,
     guide_points: dict[str, Trajectory],
-) -> None:
+) -> dict[str, Trajectory]:
     points = _compute_well_trajectory(wells, interpolation, guide_points)
     logger.info("Writing interpolation results to 'well_geometry.txt;")
     write_wicalc(
@@ -104,3 +131,7 @@ def well_trajectory_simple(
         (Path(f"PATH_{well}").with_suffix(".txt"), trajectory)
         for well, trajectory in points.items()
     )
+    if compact_output():
+        logger.info("Writing interpolation results to 'well_geometry.npz'")
+        write_geometry_sidecar(points, Path("well_geometry.npz"))
+    return {well: trajectory.coordinates for well, trajectory in points.items()}
@@ -2,11 +2,8 @@ import argparse
 import functools
 from collections.abc import Callable
 from functools import partial
+from typing import TYPE_CHECKING
 
-from pydantic import BaseModel
-
-from .models import Wells
-from .parsers import SchemaAction
 from .validators import (
     is_writable_path,
     parse_file,
@@ -14,6 +11,9 @@ from .validators import (
     valid_input_file,
 )
 
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
 type Parser = argparse.ArgumentParser | argparse._ArgumentGroup
 
 
@@ -73,6 +73,8 @@ def add_file_schemas(parser: Parser) -> None:
     Args:
         parser (argparse.ArgumentParser): Argument parser
     """
+    from .parsers import SchemaAction  # noqa: PLC0415, slow import
+
     parser.add_argument(
         "--schema",
         nargs=0,
@@ -110,7 +112,7 @@ def add_wells_input_argument[T: BaseModel](
     parser: Parser,
     *,
     required: bool = True,
-    schema: type[T] = Wells,
+    schema: type[T] | None = None,
     arg: tuple[str, str] = ("-i", "--input"),
     **kwargs,
 ) -> None:
@@ -122,8 +124,15 @@ def add_wells_input_argument[T: BaseModel](
         parser (argparse.ArgumentParser): Argument parser
         required (bool, optional): Is this argument required?. Defaults to True.
         schema (models.BaseConfig, optional):
-            Parser and validation schema to use. Defaults to models.WellListModel.
+            Parser and validation schema to use. Defaults to models.Wells.
     """
+    # Models and schema support are imported here, jobs without wells
+    # input arguments do not need them:
+    from .models import Wells  # noqa: PLC0415
+    from .parsers import SchemaAction  # noqa: PLC0415
+
+    if schema is None:
+        schema = Wells
     skip_type = kwargs.pop("skip_type") if "skip_type" in kwargs else False
     parser.add_argument(
         *arg,
@@ -0,0 +1,91 @@
+import csv
+import datetime
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import NamedTuple
+
+from .io_utils import compact_output, dump_npz
+
+__all__ = ["CashFlow", "cash_flows", "write_cash_flows"]
+
+
+class CashFlow(NamedTuple):
+    """Contribution of a date to the NPV, in the output currency.
+
+    Attributes:
+        date: date of the contribution
+        revenues: undiscounted revenue per summary keyword
+        costs: undiscounted costs
+        discount_factor: factor discounting the date to the reference date
+        npv: cumulative discounted NPV up to and including the date, rounded to
+            cents as the NPV result
+    """
+
+    date: datetime.date
+    revenues: tuple[float, ...]
+    costs: float
+    discount_factor: float
+    npv: float
+
+
+def cash_flows(
+    keywords: Sequence[str],
+    revenues: Iterable[tuple[datetime.date, tuple[float, ...], float]],
+    costs: Iterable[tuple[datetime.date, float, float]],
+    multiplier: float = 1,
+) -> tuple[CashFlow, ...]:
+    """Merge revenues and costs, as recorded by the NPV calculations, per date.
+
+    Args:
+        keywords (Sequence[str]): summary keywords of the revenues
+        revenues (Iterable[tuple[date, tuple[float, ...], float]]): revenue per
+            keyword and discount divisor, per date
+        costs (Iterable[tuple[date, float, float]]): cost and discount divisor
+        multiplier (float): NPV multiplier
+
+    Returns:
+        tuple[CashFlow, ...]: contributions sorted by date
+    """
+    flows: dict[datetime.date, list] = {
+        date: [values, 0.0, divisor] for date, values, divisor in revenues
+    }
+    no_revenues = (0.0,) * len(keywords)
+    for date, cost, divisor in costs:
+        flows.setdefault(date, [no_revenues, 0.0, divisor])[1] += cost
+
+    npv = 0.0
+    result = []
+    for date in sorted(flows):
+        values, cost, divisor = flows[date]
+        npv += (sum(values) - cost) / divisor * multiplier
+        result.append(CashFlow(date, values, cost, 1 / divisor, round(npv, 2)))
+    return tuple(result)
+
+
+def write_cash_flows(
+    keywords: Sequence[str], flows: Sequence[CashFlow], path: Path
+) -> None:
+    """Write NPV contributions to a CSV file, one row per date.
+
+    The columns are the date, the revenue per keyword, the costs, the discount
+    factor and the cumulative NPV. In compact output mode, the columns are also
+    written to a `.npz` sidecar.
+    """
+    with path.open("w", encoding="utf-8", newline="") as fp:
+        writer = csv.writer(fp)
+        writer.writerow(("date", *keywords, "costs", "discount_factor", "npv"))
+        writer.writerows(
+            (flow.date.isoformat(), *flow.revenues, *flow[2:]) for flow in flows
+        )
+    if compact_output():
+        dump_npz(
+            {
+                "dates": [flow.date.isoformat() for flow in flows],
+                "keywords": list(keywords),
+                "revenues": [flow.revenues for flow in flows],
+                "costs": [flow.costs for flow in flows],
+                "discount_factor": [flow.discount_factor for flow in flows],
+                "npv": [flow.npv for flow in flows],
+            },
+            path.with_suffix(".npz"),
+        )
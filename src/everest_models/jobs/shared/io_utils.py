@@ -1,10 +1,31 @@
 import json
 import linecache
+import os
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Any, TextIO
+from typing import TYPE_CHECKING, Any, TextIO
 
 from ruamel.yaml import YAML, YAMLError
 
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike
+
+COMPACT_OUTPUT_ENV = "EVEREST_MODELS_COMPACT_OUTPUT"
+# Set by ERT in the environment of every forward model step
+_PIPELINE_ENV = "_ERT_REALIZATION_NUMBER"
+
+
+def compact_output() -> bool:
+    """Whether jobs write compact outputs.
+
+    Compact JSON outputs are written without indentation, and array-like outputs
+    are also written to a `.npz` sidecar. Enabled by default when running in an
+    ERT/Everest pipeline, `EVEREST_MODELS_COMPACT_OUTPUT=0|1` overrides it.
+    """
+    if (value := os.environ.get(COMPACT_OUTPUT_ENV)) is None:
+        return _PIPELINE_ENV in os.environ
+    return value.strip().lower() not in {"", "0", "false", "no", "off"}
+
 
 def load_json(path: Path | str):
     with Path(path).open("r", encoding="utf-8") as fd:
@@ -39,7 +60,18 @@ def load_supported_file_encoding(path: Path) -> Any:
 
 def dump_json(data: dict, path: Path):
     with path.open("w") as fd:
-        json.dump(data, fd, indent=2, separators=(",", ": "), sort_keys=True)
+        if compact_output():
+            json.dump(data, fd, separators=(",", ":"), sort_keys=True)
+        else:
+            json.dump(data, fd, indent=2, separators=(",", ": "), sort_keys=True)
+
+
+def dump_npz(arrays: Mapping[str, "ArrayLike"], path: Path):
+    """Write arrays to an uncompressed NumPy archive, readable with `numpy.load`."""
+    import numpy as np  # noqa: PLC0415
+
+    with path.open("wb") as fd:
+        np.savez(fd, **arrays)
 
 
 def dump_yaml(
@@ -4,7 +4,7 @@ from pydantic import (
     BaseModel,
     ConfigDict,
     RootModel,
-    model_validator,
+    field_validator,
 )
 from ruamel.yaml.comments import CommentedMap, CommentedSeq
 
@@ -20,7 +20,9 @@ class ModelConfig(BaseModel):
     Use for any model that you wish to expose the model's specification to a user.
 
     NOTE: If your not planning to access your model fields introspectivally
-    please stick to pydantic BaseModel. This base model can be expensive
+    please stick to pydantic BaseModel. This base model can be expensive,
+    data used repeatedly inside computations is best converted to lightweight
+    records once validated (e.g. `economics.rate_records`).
 
     Attributes:
     - model_config:
@@ -55,20 +57,19 @@ class ModelConfig(BaseModel):
         regex_engine="rust-regex",
     )
 
-    @model_validator(mode="before")
+    @field_validator("*", mode="before")
     @classmethod
-    def check_for_ellipses(cls, data: Any) -> Any:
-        def any_ellipses(data: Any):
-            return any(
-                any_ellipses(value) if isinstance(value, dict) else value == "..."
-                for value in (data.values() if isinstance(data, dict) else data)
-            )
+    def check_for_ellipses(cls, value: Any) -> Any:
+        def any_ellipses(data: Any) -> bool:
+            if isinstance(data, dict):
+                return any(map(any_ellipses, data.values()))
+            return isinstance(data, str) and data == "..."
 
-        if any_ellipses(data):
+        if any_ellipses(value):
             raise ValueError(
                 "Please replace any and/or all `...`, these field are required"
             )
-        return data
+        return value
 
     @classmethod
     def introspective_data(
@@ -1,12 +1,14 @@
+from collections.abc import Iterable
 from datetime import date
-from typing import Annotated, Self
+from operator import attrgetter
+from typing import Annotated, NamedTuple, Self
 
 from pydantic import AfterValidator, ConfigDict, Field, model_validator
 
 from ..currency import currency_exist
 from .base_config import ModelConfig
 
-__all__ = ["Dates", "CurrencyRate", "WellCost"]
+__all__ = ["Dates", "CurrencyRate", "Rate", "WellCost", "rate_records"]
 
 
 class Dates(ModelConfig):
@@ -27,6 +29,32 @@ class CurrencyRate(ModelConfig):
     ]
 
 
+class Rate(NamedTuple):
+    """Lightweight record of a currency rate, for use inside computations."""
+
+    date: date
+    value: float
+    currency: str | None = None
+
+
+def rate_records(rates: Iterable[CurrencyRate]) -> tuple[Rate, ...]:
+    """Convert validated currency rates to records, sorted by descending date.
+
+    Args:
+        rates (Iterable[CurrencyRate]): validated currency rates
+
+    Returns:
+        tuple[Rate, ...]: rate records, latest first
+    """
+    return tuple(
+        sorted(
+            (Rate(rate.date, rate.value, rate.currency) for rate in rates),
+            key=attrgetter("date"),
+            reverse=True,
+        )
+    )
+
+
 class WellCost(ModelConfig):
     well: Annotated[str, Field(description="Well name")]
     value: Annotated[
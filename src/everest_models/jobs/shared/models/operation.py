@@ -1,8 +1,14 @@
 from datetime import date
-from pathlib import Path
-from typing import Annotated, Any
+from typing import Annotated, Any, Self
 
-from pydantic import ConfigDict, Field, FilePath, PlainSerializer, model_validator
+from pydantic import (
+    ConfigDict,
+    Field,
+    FilePath,
+    PlainSerializer,
+    field_validator,
+    model_validator,
+)
 from typing_extensions import TypedDict
 
 from everest_models.jobs.shared.converters import path_to_str
@@ -17,13 +23,6 @@ class Tokens(TypedDict, total=False):
     rate: float
 
 
-class OperationDict(TypedDict):
-    date: date
-    name: str
-    template: Path | None
-    tokens: Tokens
-
-
 class Operation(ModelConfig):
     model_config = ConfigDict(extra="allow", frozen=False, validate_assignment=True)
 
@@ -47,13 +46,21 @@ class Operation(ModelConfig):
         ),
     ]
 
-    @model_validator(mode="before")
+    @field_validator("opname", mode="before")
     @classmethod
-    def no_extra_based_fields(cls, values: dict[str, Any]) -> OperationDict:
-        for key in filter(lambda x: x in values, ("phase", "rate")):
-            values.setdefault("tokens", {})[key] = values.pop(key)
-
-        validate_no_extra_fields(
-            "date", "opname", "template", "tokens", values=iter(values)
-        )
-        return OperationDict(**values)
+    def check_for_ellipses(cls, value: Any) -> Any:
+        # The other fields and tokens reject '...' by type, only check the name:
+        return super().check_for_ellipses(value)
+
+    @model_validator(mode="after")
+    def no_extra_based_fields(self) -> Self:
+        # Move 'phase' and 'rate' to the tokens once validated, so that JSON input
+        # is never converted to Python objects for this:
+        if not (extra := self.__pydantic_extra__):
+            return self
+        tokens = {key: extra.pop(key) for key in ("phase", "rate") if key in extra}
+        if extra:
+            validate_no_extra_fields(values=iter(extra))
+        self.model_fields_set.difference_update(tokens)
+        self.tokens = {**self.tokens, **tokens}  # type: ignore
+        return self
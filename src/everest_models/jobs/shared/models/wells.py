@@ -5,6 +5,7 @@ from typing import Annotated, Any
 
 from pydantic import ConfigDict, Field, model_validator
 
+from ..io_utils import compact_output
 from .base_config import ModelConfig, RootModelConfig
 from .operation import Operation
 
@@ -52,14 +53,14 @@ class Wells(RootModelConfig):
         return {well.name: well for well in self}
 
     def json_dump(self, output: Path) -> None:
-        """Write instance state to a JSON file.
+        """Write instance state to a JSON file, unindented in compact output mode.
 
         Args:
             output (Path): file to write to
         """
         output.write_text(
             self.model_dump_json(
-                indent=2,
+                indent=None if compact_output() else 2,
                 exclude_none=True,
                 exclude_unset=True,
                 by_alias=True,
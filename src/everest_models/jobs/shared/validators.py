@@ -1,18 +1,23 @@
+from __future__ import annotations
+
 import argparse
+import contextlib
 import datetime
 from collections import Counter
 from collections.abc import Callable, Iterable, Sized
 from json import JSONDecodeError
 from os import W_OK, access
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from pydantic import BaseModel, ValidationError, ValidationInfo
-from resdata.summary import Summary
 from ruamel.yaml.error import YAMLError
 
 from everest_models.jobs.shared.io_utils import load_supported_file_encoding
 
+if TYPE_CHECKING:
+    from pydantic import BaseModel, ValidationError, ValidationInfo
+    from resdata.summary import Summary
+
 
 def is_writable_path(value: str) -> Path:
     """Validate if given value is a writable filepath.
@@ -61,6 +66,8 @@ def valid_ecl_summary(file_path: str) -> Summary:
     Returns:
         Summary: Eclipse summary instance
     """
+    from resdata.summary import Summary  # noqa: PLC0415, slow import
+
     try:
         return Summary(file_path)
     except OSError as e:
@@ -117,16 +124,24 @@ def valid_iso_date(value: str) -> datetime.date:
         ) from e
 
 
-def valid_schedule_template(value: str) -> str:
-    """collect eclipse file content.
+def valid_schedule_template(value: str) -> Path:
+    """Validate eclipse schedule filepath.
 
     Args:
         value (str): eclipse filepath
 
+    Raises:
+        argparse.ArgumentTypeError: Directory or not Found
+
     Returns:
-        str: eclipse content
+        Path: eclipse filepath
     """
-    return Path(value).read_text(encoding="utf-8")
+    path = Path(value)
+    if not path.is_file():
+        raise argparse.ArgumentTypeError(
+            f"The path '{path}' is a directory or file not found."
+        )
+    return path
 
 
 def valid_input_file(value: str) -> Any:
@@ -232,6 +247,9 @@ def _prettify_validation_error_message(error: ValidationError) -> str:
 def parse_file[T: BaseModel](value: str, schema: type[T]) -> T:
     """Parse filepath content by given schema
 
+    JSON files are validated directly from their content, other files and
+    invalid JSON files are loaded first, to report errors in field order.
+
     Args:
         value (str): filepath
         schema (BaseModel): schema to use for validation and parsing
@@ -242,9 +260,16 @@ def parse_file[T: BaseModel](value: str, schema: type[T]) -> T:
     Returns:
         pydantic.BaseModel: a schema instance
     """
-    value = valid_input_file(value)
+    from pydantic import ValidationError  # noqa: PLC0415, slow import
+
+    path = Path(value)
+    if path.suffix == ".json" and path.is_file():
+        with contextlib.suppress(ValidationError):
+            # Validate the raw bytes, without building intermediate Python objects
+            return schema.model_validate_json(path.read_bytes())
+    # Invalid files are reported as before, from their loaded content
     try:
-        return schema.model_validate(value)
+        return schema.model_validate(valid_input_file(value))
     except ValidationError as e:
         raise argparse.ArgumentTypeError(
             f"\n{_prettify_validation_error_message(e)}"
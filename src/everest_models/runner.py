@@ -0,0 +1,298 @@
+"""
+Run forward model steps in a preloaded runner daemon.
+
+Every `fm_*` command is installed as `main_entry_point` of this module. When a
+daemon, started with `everest_models_runner`, listens on the local Unix socket,
+the command line, working directory, environment and standard streams of the
+step are handed over to it. The daemon has the jobs and their dependencies
+imported, and forks a process per step, so steps skip the interpreter start up
+and imports. Without a daemon, the step runs in-process as before.
+
+Steps are only handed over to a daemon of the same user, checked with the
+credentials of the socket peer (Linux only), running the same version of
+`everest_models` with the same interpreter.
+
+This module is imported by every step, it should only import the standard library.
+"""
+
+import argparse
+import contextlib
+import importlib
+import importlib.util
+import json
+import os
+import signal
+import socket
+import struct
+import sys
+import tempfile
+import traceback
+from collections.abc import Callable, Iterable, Sequence
+from pathlib import Path
+from typing import Any
+
+from everest_models import __version__
+
+__all__ = ["default_socket_path", "main_entry_point", "run_job", "serve"]
+
+SOCKET_ENV = "EVEREST_MODELS_RUNNER_SOCKET"
+
+_LENGTH = struct.Struct("!I")
+_INTEGER = struct.Struct("!i")
+_STREAMS = (0, 1, 2)
+
+
+def default_socket_path() -> Path:
+    """Socket of the runner daemon, `EVEREST_MODELS_RUNNER_SOCKET` if set.
+
+    The default socket is local to the node and the user: in `$XDG_RUNTIME_DIR`,
+    or in a directory private to the user in the temporary directory.
+    """
+    if path := os.environ.get(SOCKET_ENV):
+        return Path(path)
+    if runtime_dir := os.environ.get("XDG_RUNTIME_DIR"):
+        return Path(runtime_dir) / "everest-models-runner.sock"
+    return (
+        Path(tempfile.gettempdir())
+        / f"everest-models-runner-{os.getuid()}"
+        / "runner.sock"
+    )
+
+
+def _identity() -> dict[str, str]:
+    return {"version": __version__, "executable": sys.executable}
+
+
+def _entry_point(job: str) -> Callable[[list[str]], Any]:
+    # Look the job package up without importing the plugin hooks, and ERT
+    if (
+        not job.startswith("fm_")
+        or not job.isidentifier()
+        or importlib.util.find_spec(f"everest_models.jobs.{job}") is None
+    ):
+        raise SystemExit(f"Unknown forward model step: {job}")
+    return importlib.import_module(f"everest_models.jobs.{job}").main_entry_point
+
+
+def _exit_code(code: Any) -> int:
+    # Same conventions as the interpreter on SystemExit
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)  # noqa: T201
+    return 1
+
+
+def run_job(job: str, args: list[str]) -> int:
+    """Run a forward model step in this process.
+
+    Args:
+        job (str): forward model step command, e.g. 'fm_npv'
+        args (list[str]): command line arguments
+
+    Returns:
+        int: exit code of the step
+    """
+    sys.argv = [job, *args]
+    try:
+        return _exit_code(_entry_point(job)(args))
+    except SystemExit as e:
+        return _exit_code(e.code)
+
+
+def _receive(connection: socket.socket, size: int) -> bytes:
+    data = b""
+    while len(data) < size and (chunk := connection.recv(size - len(data))):
+        data += chunk
+    return data
+
+
+def _send_message(connection: socket.socket, message: Any) -> None:
+    data = json.dumps(message).encode()
+    connection.sendall(_LENGTH.pack(len(data)) + data)
+
+
+def _receive_message(connection: socket.socket) -> Any:
+    if len(data := _receive(connection, _LENGTH.size)) < _LENGTH.size:
+        raise ConnectionError("Connection closed by the peer")
+    return json.loads(_receive(connection, *_LENGTH.unpack(data)))
+
+
+def _peer_uid(connection: socket.socket) -> int | None:
+    if not hasattr(socket, "SO_PEERCRED"):
+        return None
+    _, uid, _ = struct.unpack(
+        "3i",
+        connection.getsockopt(
+            socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i")
+        ),
+    )
+    return uid
+
+
+def _request(path: Path, job: str, args: list[str]) -> int | None:
+    """Run a step in the daemon, None if no daemon accepted it.
+
+    The daemon is refused if it runs as another user, or another version or
+    interpreter than the client.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        request = json.dumps(
+            {"job": job, "args": args, "cwd": os.getcwd(), "env": dict(os.environ)}
+        ).encode()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        try:
+            connection.connect(str(path))
+            if _peer_uid(connection) != os.getuid():
+                return None
+            if _receive_message(connection) != _identity():
+                return None
+            socket.send_fds(connection, [_LENGTH.pack(len(request))], _STREAMS)
+            connection.sendall(request)
+        except (OSError, ValueError):
+            return None
+        if len(data := _receive(connection, _INTEGER.size)) < _INTEGER.size:
+            return None  # The step was not started
+        (pid,) = _INTEGER.unpack(data)
+        # Interrupting the command interrupts the step
+        handlers = {
+            signum: signal.signal(signum, lambda signum, _: os.kill(pid, signum))
+            for signum in (signal.SIGINT, signal.SIGTERM)
+        }
+        try:
+            data = _receive(connection, _INTEGER.size)
+        finally:
+            for signum, handler in handlers.items():
+                signal.signal(signum, handler)
+        if len(data) < _INTEGER.size:
+            raise ConnectionError(f"Runner daemon stopped while running {job}")
+    (code,) = _INTEGER.unpack(data)
+    return 128 - code if code < 0 else code
+
+
+def main_entry_point(args: Sequence[str] | None = None) -> int:
+    """Entry point of all `fm_*` commands, the step is named by the command.
+
+    Args:
+        args (Sequence[str] | None): command line arguments, default sys.argv[1:]
+
+    Returns:
+        int: exit code of the step
+    """
+    job = Path(sys.argv[0]).name
+    args = sys.argv[1:] if args is None else list(args)
+    if (code := _request(default_socket_path(), job, args)) is None:
+        return run_job(job, args)
+    return code
+
+
+def _run_request(connection: socket.socket) -> None:
+    _send_message(connection, _identity())
+    data, fds, *_ = socket.recv_fds(connection, _LENGTH.size, len(_STREAMS))
+    if len(data) < _LENGTH.size:
+        return  # The client refused the daemon
+    request = json.loads(_receive(connection, *_LENGTH.unpack(data)))
+    if (pid := os.fork()) == 0:
+        connection.close()
+        for target, fd in zip(_STREAMS, fds, strict=True):
+            os.dup2(fd, target)
+            os.close(fd)
+        code = 1
+        try:
+            os.chdir(request["cwd"])
+            os.environ.clear()
+            os.environ.update(request["env"])
+            code = run_job(request["job"], request["args"])
+        except Exception:  # noqa: BLE001, reported like the interpreter does
+            traceback.print_exc()
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(code)
+    for fd in fds:
+        os.close(fd)
+    connection.sendall(_INTEGER.pack(pid))
+    _, status = os.waitpid(pid, 0)
+    connection.sendall(_INTEGER.pack(os.waitstatus_to_exitcode(status)))
+
+
+def serve(path: Path, jobs: Iterable[str] = ()) -> None:
+    """Preload jobs and run the requested steps, until interrupted.
+
+    Each request is handled in a forked process, which in turn forks the step,
+    so that a step never affects the daemon or other steps.
+
+    Args:
+        path (Path): Unix socket to listen on
+        jobs (Iterable[str]): forward model step commands to preload
+
+    Raises:
+        RuntimeError: The directory of the socket is writable by other users,
+            or a daemon is already listening on the socket
+    """
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    status = path.parent.stat()
+    if status.st_uid != os.getuid() or status.st_mode & 0o022:
+        raise RuntimeError(
+            f"The socket directory must be owned by the user and not writable "
+            f"by others: {path.parent}"
+        )
+    for job in jobs:
+        importlib.import_module(f"everest_models.jobs.{job}.cli")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        with contextlib.suppress(OSError), socket.socket(socket.AF_UNIX) as probe:
+            probe.connect(str(path))
+            raise RuntimeError(f"A runner daemon is already listening on {path}")
+        path.unlink(missing_ok=True)
+        umask = os.umask(0o177)
+        try:
+            server.bind(str(path))
+        finally:
+            os.umask(umask)
+        server.listen()
+        signal.signal(signal.SIGCHLD, signal.SIG_IGN)  # Reap request handlers
+        try:
+            while True:
+                connection, _ = server.accept()
+                if os.fork() == 0:
+                    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+                    server.close()
+                    try:
+                        _run_request(connection)
+                    finally:
+                        os._exit(0)
+                connection.close()
+        finally:
+            path.unlink(missing_ok=True)
+
+
+def serve_entry_point(args: Sequence[str] | None = None) -> None:
+    from everest_models.forward_models import get_forward_models  # noqa: PLC0415
+
+    jobs = [f"fm_{job}" for job in get_forward_models()]
+    parser = argparse.ArgumentParser(
+        prog="everest_models_runner",
+        description="Run forward model steps in a single preloaded process.",
+    )
+    parser.add_argument(
+        "-s",
+        "--socket",
+        type=Path,
+        default=default_socket_path(),
+        help=f"Unix socket to listen on (default: ${SOCKET_ENV} or %(default)s)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        nargs="+",
+        choices=jobs,
+        default=jobs,
+        metavar="JOB",
+        help="Forward model steps to preload (default: all)",
+    )
+    options = parser.parse_args(args)
+    print(f"Serving forward model steps on {options.socket}", file=sys.stderr)  # noqa: T201
+    with contextlib.suppress(KeyboardInterrupt):
+        serve(options.socket, options.jobs)
@@ -36,6 +36,7 @@ def test_get_forward_model_schemas_hook(plugin_manager):
         "add_templates",
         "compute_economics",
         "drill_planner",
+        "extract_summary_data",
         "npv",
         "well_trajectory",
         "well_constraints",
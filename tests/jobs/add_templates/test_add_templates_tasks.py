@@ -1,3 +1,4 @@
+import itertools
 import logging
 
 from sub_testdata import ADD_TEMPLATE as TEST_DATA
@@ -35,6 +36,23 @@ def test_collect_matching(add_tmpl_config):
     )
 
 
+def test_collect_matching_config_order(add_tmpl_config):
+    templates = (
+        *add_tmpl_config.templates,
+        Template.model_validate(
+            {"file": "templates/template_open.tmpl", "keys": {"phase": "water"}}
+        ),
+        Template.model_validate({"file": "templates/notused.tmpl", "keys": {}}),
+    )
+    wells = parse_file("wells.json", Wells)
+    assert list(collect_matching(templates=templates, wells=wells.root)) == [
+        (well.name, operation, template)
+        for well in wells
+        for operation, template in itertools.product(well.operations, templates)
+        if template.matching_keys(operation)
+    ]
+
+
 def test_add_templates(path_test_data, caplog):
     template_path = path_test_data / f"{TEST_DATA}/templates/template_open.tmpl"
     template = Template.model_validate(
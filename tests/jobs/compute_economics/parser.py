@@ -132,6 +132,9 @@ class Options(NamedTuple):
     lint: bool | None = None
     output: Path = Path("test")
     output_currency: str | None = None
+    timeseries: Path | None = None
+    ensemble: str | None = None
+    workers: int | None = None
 
 
 class MockParser:
@@ -1,15 +1,21 @@
+import csv
 import datetime
 import logging
 from pathlib import Path
 
 import pytest
 from jobs.compute_economics.parser import Options
+from resdata.summary import Summary
 from sub_testdata import ECONOMIC_INDICATOR as TEST_DATA
 
 from everest_models.jobs.fm_compute_economics import cli
 from everest_models.jobs.fm_compute_economics.economic_indicator_config_model import (
     EconomicIndicatorConfig,
 )
+from everest_models.jobs.fm_compute_economics.manager import create_indicator
+from everest_models.jobs.fm_compute_economics.parser import build_argument_parser
+from everest_models.jobs.shared.models import Wells
+from everest_models.jobs.shared.validators import parse_file
 
 
 @pytest.mark.parametrize(
@@ -110,6 +116,47 @@ def test_economic_indicator_main_entry_point_pairing_error(
     ) in err
 
 
+def test_economic_indicator_main_entry_point_timeseries(
+    copy_testdata_tmpdir,
+    modify_economic_config,
+    build_economic_parser_patch,
+    get_summary_patch,
+):
+    copy_testdata_tmpdir(TEST_DATA)
+    config = modify_economic_config("wells.json")
+    config["output"]["timeseries"] = "npv.csv"
+    build_economic_parser_patch(config, calculation="npv")
+
+    cli.main_entry_point()
+
+    assert Path("test").read_text() == "691981114.68"
+    with Path("npv.csv").open(newline="") as fp:
+        header, *rows = csv.reader(fp)
+    assert header == ["date", "FWIT", "FOPT", "costs", "discount_factor", "npv"]
+    assert rows[-1][-1] == "691981114.68"
+    assert sum(
+        (float(fwit) + float(fopt) - float(costs)) * float(factor)
+        for _, fwit, fopt, costs, factor, _ in rows
+    ) == pytest.approx(691981114.68, abs=0.005)
+
+
+def test_bep_main_entry_point_timeseries_error(
+    copy_testdata_tmpdir, capsys, modify_economic_config, build_economic_parser_patch
+):
+    copy_testdata_tmpdir(TEST_DATA)
+    build_economic_parser_patch(
+        modify_economic_config("wells.json"),
+        calculation="bep",
+        timeseries=Path("bep.csv"),
+    )
+
+    with pytest.raises(SystemExit) as e:
+        cli.main_entry_point()
+    assert e.value.code == 2
+    assert "only supported by the npv calculation" in capsys.readouterr().err
+    assert not Path("bep.csv").exists()
+
+
 @pytest.mark.parametrize(
     "calculation_type, expected",
     (
@@ -187,3 +234,110 @@ def test_bep_main_entry_lint_ignore_overwrite_config(
     assert e.value.code == 0
     assert "Overwrite config field with 'multiplier' CLI argument" not in caplog.text
     assert not Path("test").exists()
+
+
+def _write_ensemble(realizations: int) -> None:
+    for realization in range(realizations):
+        runpath = Path(f"simulations/realization-{realization}/iter-1")
+        runpath.mkdir(parents=True)
+        summary = Summary.writer(
+            str(runpath / "TEST"), datetime.date(1999, 12, 1), 10, 10, 10
+        )
+        for key in ("FOPT", "FWIT"):
+            summary.add_variable(key)
+        for step in range(42):
+            t_step = summary.add_t_step(step, 30 * step)
+            t_step["FOPT"] = 1e5 * step * (realization + 1)
+            t_step["FWIT"] = step
+        summary.fwrite()
+    # A failed realization, without summary
+    Path(f"simulations/realization-{realizations}/iter-1").mkdir(parents=True)
+    # A realization without the summary keys
+    runpath = Path(f"simulations/realization-{realizations + 1}/iter-1")
+    runpath.mkdir(parents=True)
+    summary = Summary.writer(
+        str(runpath / "TEST"), datetime.date(1999, 12, 1), 10, 10, 10
+    )
+    summary.add_variable("FGPT")
+    summary.add_t_step(0, 0)["FGPT"] = 0
+    summary.fwrite()
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.parametrize("calculation", ["npv", "bep"])
+def test_economic_indicator_main_entry_point_ensemble(
+    calculation,
+    workers,
+    copy_testdata_tmpdir,
+    modify_economic_config,
+    build_economic_parser_patch,
+):
+    copy_testdata_tmpdir(TEST_DATA)
+    _write_ensemble(3)
+    config = modify_economic_config("wells.json")
+    config["summary"]["main"] = "TEST"
+    build_economic_parser_patch(
+        config,
+        calculation=calculation,
+        ensemble="simulations/realization-<IENS>/iter-<ITER>",
+        workers=workers,
+    )
+
+    expected = [
+        create_indicator(
+            calculation,
+            EconomicIndicatorConfig.model_validate(
+                {**config, "summary": {**config["summary"], "main": runpath / "TEST"}}
+            ),
+        ).compute(
+            {
+                well.name: well.completion_date or well.readydate
+                for well in parse_file("wells.json", Wells)
+            }
+        )
+        for runpath in sorted(Path("simulations").glob("realization-[0-2]/iter-1"))
+    ]
+
+    cli.main_entry_point()
+
+    with Path("test").open(newline="") as fp:
+        header, *rows = csv.reader(fp)
+    assert header == ["iteration", "realization", calculation]
+    assert rows[:5] == [
+        *(["1", str(index), str(value)] for index, value in enumerate(expected)),
+        ["1", "3", ""],
+        ["1", "4", ""],
+    ]
+    assert [row[:2] for row in rows[5:]] == [
+        ["1", "mean"],
+        ["1", "P10"],
+        ["1", "P50"],
+        ["1", "P90"],
+    ]
+    mean, p10, p50, p90 = (float(row[2]) for row in rows[5:])
+    assert mean == pytest.approx(sum(expected) / 3, abs=0.01)
+    assert p50 == pytest.approx(sorted(expected)[1], abs=0.01)
+    assert p90 <= p50 <= p10
+
+
+def test_economic_indicator_main_entry_point_ensemble_error(
+    copy_testdata_tmpdir, capsys, modify_economic_config, build_economic_parser_patch
+):
+    copy_testdata_tmpdir(TEST_DATA)
+    build_economic_parser_patch(
+        modify_economic_config("wells.json"),
+        calculation="npv",
+        ensemble="simulations/realization-0",
+    )
+
+    with pytest.raises(SystemExit) as e:
+        cli.main_entry_point()
+    assert e.value.code == 2
+    assert "must contain the <IENS> placeholder" in capsys.readouterr().err
+
+
+def test_economic_indicator_workers_error(capsys):
+    with pytest.raises(SystemExit) as e:
+        build_argument_parser().parse_args(["--calculation", "npv", "--workers", "0"])
+    assert e.value.code == 2
+    assert "workers must be a positive number" in capsys.readouterr().err
@@ -2,7 +2,7 @@ import datetime
 
 from resdata.summary import Summary
 
-from everest_models.jobs.fm_extract_summary_data.parser import args_parser
+from everest_models.jobs.fm_extract_summary_data import parser
 
 
 def ecl_summary(*args, **kwargs):
@@ -26,6 +26,6 @@ def ecl_summary(*args, **kwargs):
 
 
 def build_argument_parser():
-    parser = args_parser
-    parser._actions[1].type = ecl_summary
-    return parser
+    args_parser = parser.build_argument_parser()
+    args_parser._actions[1].type = ecl_summary
+    return args_parser
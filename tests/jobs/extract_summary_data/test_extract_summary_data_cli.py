@@ -1,3 +1,4 @@
+import argparse
 import os
 from pathlib import Path
 
@@ -10,11 +11,7 @@ from everest_models.jobs.fm_extract_summary_data.tasks import CalculationType
 
 @pytest.fixture()
 def mock_extract_summary_data_parser(monkeypatch):
-    monkeypatch.setattr(
-        cli,
-        "args_parser",
-        build_argument_parser(),
-    )
+    monkeypatch.setattr(cli, "build_argument_parser", build_argument_parser)
 
 
 @pytest.fixture(scope="module")
@@ -133,3 +130,76 @@ def test_extract_summary_data_entry_point_single_date(
     log_messages = [rec.message for rec in caplog.records]
 
     assert "Extracting key FGPT for single date 2000-01-21" in log_messages
+
+
+def test_extract_summary_data_entry_point_config(
+    mock_extract_summary_data_parser,
+    switch_cwd_tmp_path,
+):
+    Path("config.yml").write_text(
+        """
+extractions:
+  - {key: FGPT, start_date: 2000-01-01, end_date: 2000-01-26, output: diff}
+  - {key: FGPT, start_date: 2000-01-01, end_date: 2000-01-26, type: max,
+     multiplier: 2.6, output: max}
+  - {key: FOPR, start_date: 2000-01-06, end_date: 2000-01-16, type: max,
+     output: rate}
+  - {key: FOPT, end_date: 2000-01-21, output: single}
+"""
+    )
+    cli.main_entry_point(["--summary", "PATCHED.UNSMRY", "--config", "config.yml"])
+
+    assert {
+        name: float(Path(name).read_text())
+        for name in ("diff", "max", "rate", "single")
+    } == {"diff": 8, "max": pytest.approx(26), "rate": 6, "single": 82}
+
+
+@pytest.mark.parametrize(
+    ("extraction", "error"),
+    [
+        (
+            "{key: FWPT, end_date: 2000-01-21, output: out}",
+            "Missing required data FWPT in summary file.",
+        ),
+        (
+            "{key: FGPT, end_date: 2000-01-22, output: out}",
+            "out: End date '2000-01-22' is not part of the simulation report dates",
+        ),
+    ],
+)
+def test_extract_summary_data_config_invalid(
+    extraction,
+    error,
+    mock_extract_summary_data_parser,
+    switch_cwd_tmp_path,
+):
+    Path("config.yml").write_text(f"extractions:\n  - {extraction}\n")
+    with pytest.raises(argparse.ArgumentTypeError, match=error):
+        cli.main_entry_point(["--summary", "PATCHED.UNSMRY", "--config", "config.yml"])
+
+    assert not Path("out").exists()
+
+
+def test_extract_summary_data_config_with_key(
+    mock_extract_summary_data_parser,
+    switch_cwd_tmp_path,
+    capsys,
+):
+    Path("config.yml").write_text(
+        "extractions:\n  - {key: FGPT, end_date: 2000-01-21, output: out}\n"
+    )
+    with pytest.raises(SystemExit) as e:
+        cli.main_entry_point(
+            [
+                "--summary",
+                "PATCHED.UNSMRY",
+                "--config",
+                "config.yml",
+                "--key",
+                "FGPT",
+            ]
+        )
+
+    assert e.value.code == 2
+    assert "argument -c/--config: not allowed with -k/--key" in capsys.readouterr().err
@@ -3,11 +3,14 @@ import datetime
 from collections import namedtuple
 
 import pytest
+from resdata.summary import Summary
 from summary import ecl_summary
 
+from everest_models.jobs.fm_extract_summary_data.config_model import Extraction
 from everest_models.jobs.fm_extract_summary_data.tasks import (
     CalculationType,
     extract_value,
+    extract_values,
     validate_arguments,
 )
 
@@ -118,3 +121,34 @@ def test_extract_value(validate_argument_options):
     summary, _, _, _, key, _ = validate_argument_options
     assert extract_value(summary, "FOPR", datetime.date(2000, 1, 16)) == 4
     assert extract_value(summary, key, datetime.date(2000, 1, 11)) == 52
+
+
+def test_extract_max_intraday_steps():
+    summary = Summary.writer("TEST", datetime.date(2000, 1, 1), 10, 10, 10)
+    summary.add_variable("FOPT", wgname=None, num=0)
+    for idx, (days, value) in enumerate(
+        zip((0, 5, 10, 14.5, 15, 15.5, 20), (2, 22, 52, 90, 72, 82, 82), strict=True)
+    ):
+        summary.add_t_step(idx, days)["FOPT"] = value
+    start, end = datetime.date(2000, 1, 6), datetime.date(2000, 1, 16)
+
+    # The step inside the interval counts, the step later on the end date does
+    # not, and the value at the end of the interval is interpolated
+    assert CalculationType.MAX.extract(summary, "FOPT", start, end) == 90
+    assert list(
+        extract_values(
+            summary,
+            [
+                Extraction(
+                    key="FOPT", start_date=start, end_date=end, type="max", output="max"
+                ),
+                Extraction(
+                    key="FOPT",
+                    start_date=start,
+                    end_date=datetime.date(2000, 1, 15),
+                    type="max",
+                    output="partial",
+                ),
+            ],
+        )
+    ) == [90, pytest.approx(52 + 38 * 4 / 4.5)]
@@ -5,6 +5,7 @@ import pytest
 from sub_testdata import INTERPRET_WELL_DRILL as TEST_DATA
 
 from everest_models.jobs.fm_interpret_well_drill import cli
+from everest_models.jobs.fm_interpret_well_drill.parser import build_argument_parser
 
 
 @pytest.fixture(scope="module")
@@ -43,11 +44,13 @@ def test_interpret_well_drill_bad_input_value(
     copy_testdata_tmpdir, monkeypatch, interpret_well_drill_args, capsys
 ):
     copy_testdata_tmpdir(TEST_DATA)
+    parser = build_argument_parser()
     monkeypatch.setattr(
-        cli.args_parser,
+        parser,
         "parse_args",
         lambda *args, **kwargs: Options({"w1": ".8", "w2": "."}),
     )
+    monkeypatch.setattr(cli, "build_argument_parser", lambda: parser)
 
     with pytest.raises(SystemExit) as e:
         cli.main_entry_point(interpret_well_drill_args)
@@ -55,6 +55,7 @@ class Options(NamedTuple):
     multiplier: float = 1.0
     summary: Summary = ecl_summary_npv()
     output: Path = Path("test")
+    timeseries: Path | None = None
 
 
 class MockParser:
@@ -1,13 +1,16 @@
+import csv
 import datetime
 import logging
 from pathlib import Path
 
+import numpy as np
 import pytest
 from jobs.npv.parser import MockParser, Options, ecl_summary_npv
 from sub_testdata import NPV as TEST_DATA
 
 from everest_models.jobs.fm_npv import cli, parser
 from everest_models.jobs.fm_npv.npv_config import NPVConfig
+from everest_models.jobs.shared.io_utils import COMPACT_OUTPUT_ENV
 from everest_models.jobs.shared.models import Wells
 from everest_models.jobs.shared.validators import parse_file
 
@@ -55,6 +58,40 @@ def test_npv_main_entry_point_with_lengths(copy_testdata_tmpdir, monkeypatch):
     assert Path("test").read_text() == "691981114.68"
 
 
+def test_npv_main_entry_point_timeseries(copy_testdata_tmpdir, monkeypatch):
+    copy_testdata_tmpdir(TEST_DATA)
+    monkeypatch.setenv(COMPACT_OUTPUT_ENV, "1")
+    monkeypatch.setattr(
+        cli,
+        "build_argument_parser",
+        lambda: MockParser(
+            options=Options(
+                input=parse_file("wells.json", Wells),
+                config=parse_file(_CONFIG_FILE, NPVConfig),
+                timeseries=Path("npv.csv"),
+            )
+        ),
+    )
+    cli.main_entry_point()
+    assert Path("test").read_text() == "691981114.68"
+
+    with Path("npv.csv").open(newline="") as fp:
+        rows = list(csv.DictReader(fp))
+    assert list(rows[0]) == [
+        "date",
+        "FWIT",
+        "FOPT",
+        "costs",
+        "discount_factor",
+        "npv",
+    ]
+    assert [row["date"] for row in rows] == sorted(row["date"] for row in rows)
+    assert rows[-1]["npv"] == "691981114.68"
+    with np.load("npv.npz") as sidecar:
+        assert sidecar["revenues"].shape == (len(rows), 2)
+        assert sidecar["npv"][-1] == float(rows[-1]["npv"])
+
+
 def test_npv_main_entry_point_no_input_error(copy_testdata_tmpdir, monkeypatch, capsys):
     copy_testdata_tmpdir(TEST_DATA)
     monkeypatch.setattr(
@@ -6,7 +6,7 @@ import pytest
 from resdata.summary import Summary
 
 from everest_models.jobs.fm_rf import cli
-from everest_models.jobs.fm_rf.parser import args_parser
+from everest_models.jobs.fm_rf.parser import build_argument_parser
 
 ARGUMENTS = ["-s", "TEST", "-o", "rf_result"]
 
@@ -42,16 +42,12 @@ def ecl_summary_rf():
 
 @pytest.fixture
 def mock_rf_parser(ecl_summary_rf, monkeypatch):
-    def build_argument_parser():
-        parser = args_parser
+    def build_mock_parser():
+        parser = build_argument_parser()
         parser._actions[1].type = lambda *x, **y: ecl_summary_rf
         return parser
 
-    monkeypatch.setattr(
-        cli,
-        "args_parser",
-        build_argument_parser(),
-    )
+    monkeypatch.setattr(cli, "build_argument_parser", build_mock_parser)
 
 
 @pytest.mark.parametrize(
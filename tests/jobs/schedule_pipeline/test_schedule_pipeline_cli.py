@@ -0,0 +1,106 @@
+from pathlib import Path
+
+import pytest
+from sub_testdata import WORKFLOWS as TEST_DATA
+
+from everest_models.jobs.fm_interpret_well_drill import (
+    main_entry_point as interpret_entry,
+)
+from everest_models.jobs.fm_schedule_pipeline.cli import main_entry_point
+
+
+@pytest.fixture(scope="module")
+def pipeline_args() -> tuple[str, ...]:
+    return (
+        "-i",
+        "wells.json",
+        "-c",
+        "schedule_pipeline_config.yml",
+        "-o",
+        "result_schedule.sch",
+    )
+
+
+@pytest.fixture()
+def pipeline_testdata(copy_testdata_tmpdir):
+    copy_testdata_tmpdir(TEST_DATA)
+    interpret_entry(
+        ["-i", "interpreter_optimizer_values.yml", "-o", "filter_keep_wells.json"]
+    )
+
+
+@pytest.mark.usefixtures("pipeline_testdata")
+def test_schedule_pipeline_main_entry_point(pipeline_args):
+    main_entry_point(pipeline_args)
+
+    assert (
+        Path("result_schedule.sch").read_text()
+        == Path("expected_schedule.sch").read_text()
+    )
+    assert not list(Path().glob("*wells*result*.json"))
+
+
+@pytest.mark.usefixtures("pipeline_testdata")
+def test_schedule_pipeline_dump_intermediate(pipeline_args):
+    main_entry_point([*pipeline_args, "--dump-intermediate", "steps"])
+
+    assert sorted(path.name for path in Path("steps").iterdir()) == [
+        "01_well_filter.json",
+        "02_drill_planner.json",
+        "03_well_filter.json",
+        "04_well_constraints.json",
+        "05_add_templates.json",
+    ]
+
+
+@pytest.mark.usefixtures("pipeline_testdata")
+def test_schedule_pipeline_lint(pipeline_args):
+    with pytest.raises(SystemExit) as e:
+        main_entry_point([*pipeline_args, "--lint"])
+
+    assert e.value.code == 0
+    assert not Path("result_schedule.sch").exists()
+
+
+@pytest.mark.usefixtures("pipeline_testdata")
+def test_schedule_pipeline_step_error(pipeline_args, capsys):
+    Path("schedule_pipeline_config.yml").write_text(
+        "steps:\n"
+        "  - well_constraints:\n"
+        "      config: well_constraint_config.yml\n"
+        "  - schmerge:\n"
+        "      schedule: raw_schedule.sch\n"
+    )
+    with pytest.raises(SystemExit) as e:
+        main_entry_point(pipeline_args)
+
+    assert e.value.code == 2
+    _, err = capsys.readouterr()
+    assert "Step 1 (well_constraints) failed:" in err
+    assert "Missing start date (keyword: readydate)" in err
+
+
+@pytest.mark.usefixtures("pipeline_testdata")
+def test_schedule_pipeline_drill_planner_wells_error(pipeline_args, capsys):
+    config = Path("drill_planner_config.yml")
+    config.write_text(config.read_text() + "wells:\n  - name: W1\n    drill_time: 10\n")
+    with pytest.raises(SystemExit) as e:
+        main_entry_point(pipeline_args)
+
+    assert e.value.code == 2
+    _, err = capsys.readouterr()
+    assert "the `wells` config section is not supported in a pipeline" in err
+    assert not Path("result_schedule.sch").exists()
+
+
+@pytest.mark.usefixtures("pipeline_testdata")
+def test_schedule_pipeline_schmerge_last(pipeline_args, capsys):
+    Path("schedule_pipeline_config.yml").write_text(
+        "steps:\n  - add_templates:\n      config: template_config.yml\n"
+    )
+    with pytest.raises(SystemExit) as e:
+        main_entry_point(pipeline_args)
+
+    assert e.value.code == 2
+    _, err = capsys.readouterr()
+    assert "'schmerge' must be the last step, and occur only once" in err
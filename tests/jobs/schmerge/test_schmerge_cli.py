@@ -3,6 +3,7 @@ from pathlib import Path
 import pytest
 from sub_testdata import SCHMERGE as TEST_DATA
 
+from everest_models.jobs.fm_schmerge import tasks
 from everest_models.jobs.fm_schmerge.cli import main_entry_point
 
 
@@ -51,3 +52,47 @@ def test_schmerge_entry_lint(copy_testdata_tmpdir, schmerge_args):
 
     assert e.value.code == 0
     assert not Path("out.sch").exists()
+
+
+def test_schmerge_main_entry_point_template_cache(copy_testdata_tmpdir, schmerge_args):
+    copy_testdata_tmpdir(TEST_DATA)
+
+    main_entry_point([*schmerge_args, "--template-cache", "cache"])
+
+    assert Path("result.sch").read_bytes() == Path("out.sch").read_bytes()
+    assert any(Path("cache").glob("__jinja2_*.cache"))
+
+
+def test_schmerge_main_entry_point_in_place(copy_testdata_tmpdir, schmerge_args):
+    copy_testdata_tmpdir(TEST_DATA)
+
+    main_entry_point(
+        [
+            "--output",
+            "loaded_dates.sch",
+            "--schedule",
+            "loaded_dates.sch",
+            "-i",
+            "wells.json",
+        ]
+    )
+
+    assert Path("result.sch").read_bytes() == Path("loaded_dates.sch").read_bytes()
+    assert not list(Path().glob(".*.partial"))
+
+
+def test_schmerge_main_entry_point_failure_cleanup(
+    copy_testdata_tmpdir, schmerge_args, monkeypatch
+):
+    copy_testdata_tmpdir(TEST_DATA)
+
+    def fail(operations, lines, stream, template_cache):
+        stream.write(next(lines))
+        raise RuntimeError("Rendering failed")
+
+    monkeypatch.setattr(tasks, "write_merged_schedule", fail)
+    with pytest.raises(RuntimeError, match="Rendering failed"):
+        main_entry_point(schmerge_args)
+
+    assert not Path("out.sch").exists()
+    assert not list(Path().glob(".*.partial"))
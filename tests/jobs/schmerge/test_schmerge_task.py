@@ -1,10 +1,16 @@
 import datetime
+import io
+import os
+import time
 from pathlib import Path
 
 import pytest
 from sub_testdata import SCHMERGE as TEST_DATA
 
-from everest_models.jobs.fm_schmerge.tasks import merge_operations_onto_schedule
+from everest_models.jobs.fm_schmerge.tasks import (
+    merge_operations_onto_schedule,
+    write_merged_schedule,
+)
 from everest_models.jobs.shared.models.phase import PhaseEnum
 
 SCHEDULE_HEAD = """
@@ -123,3 +129,71 @@ def test_insert_operations_no_initial_date():
         "DATES\n 01 MAR 2000 / --ADDED\n/\n\n"
         "DATES\n 01 JAN 2005 / --ADDED\n/\n\n"
     )
+
+
+def test_insert_operations_before_first_date():
+    assert merge_operations_onto_schedule(
+        {datetime.date(1999, 3, 1): [], datetime.date(1999, 6, 1): []},
+        f"{SCHEDULE_HEAD}\n\nDATES\n 01 JAN 2000 /\n/\n",
+    ) == (
+        f"{SCHEDULE_HEAD}\n\n-- MODIFIED by schmerge forward model\n\n"
+        "DATES\n 01 JUN 1999 / --ADDED\n/\n\n"
+        "DATES\n 01 MAR 1999 / --ADDED\n/\n\n"
+        "DATES\n 01 JAN 2000 /\n/\n"
+    )
+
+
+@pytest.mark.slow
+def test_insert_operations_large_schedule_benchmark():
+    dates = [
+        datetime.date(2000, 1, 1) + datetime.timedelta(days=2 * i) for i in range(20000)
+    ]
+    schedule = "".join(
+        f"DATES\n {date.strftime('%d %b %Y').upper()} /\n/\n\nWCONPROD\n 'P' OPEN /\n/\n\n"
+        for date in dates
+    )
+    operations = {date + datetime.timedelta(days=1): [] for date in dates}
+
+    start = time.perf_counter()
+    result = merge_operations_onto_schedule(
+        operations, f"{SCHEDULE_HEAD}\n\n{schedule}"
+    )
+    elapsed = time.perf_counter() - start
+
+    assert result.count("DATES\n") == 2 * len(dates)
+    assert result.count("--ADDED") == len(operations)
+    assert elapsed < 5.0, f"merging {len(dates)} dates took {elapsed:.2f}s"
+
+
+def test_insert_operations_reloads_modified_template(tmp_path):
+    template = tmp_path / "welopen.jinja"
+    operations = {
+        datetime.date(2000, 1, 1): [
+            {"template": template, "template_map": {"name": "W1"}}
+        ]
+    }
+    template.write_text("WELOPEN\n  '{{ name }}' 'OPEN' /\n/")
+    assert "'W1' 'OPEN'" in merge_operations_onto_schedule(
+        operations, "\nDATES\n 01 JAN 2000 /\n/\n"
+    )
+
+    template.write_text("WELOPEN\n  '{{ name }}' 'SHUT' /\n/")
+    os.utime(template, ns=(0, template.stat().st_mtime_ns + 1_000_000_000))
+    assert "'W1' 'SHUT'" in merge_operations_onto_schedule(
+        operations, "\nDATES\n 01 JAN 2000 /\n/\n"
+    )
+
+
+def test_write_merged_schedule_streams_lines():
+    stream = io.StringIO()
+    write_merged_schedule(
+        {datetime.date(2000, 3, 1): []},
+        iter(
+            ["RPTRST\n", "\n", "\n", "\n", "DATES\n", "\n", " 01 JAN 2000 /\n", "/\n"]
+        ),
+        stream,
+    )
+    assert stream.getvalue() == (
+        "RPTRST\n\n-- MODIFIED by schmerge forward model\n\n"
+        "DATES\n\n 01 JAN 2000 /\n/\n\nDATES\n 01 MAR 2000 / --ADDED\n/\n\n"
+    )
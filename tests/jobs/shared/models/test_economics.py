@@ -1,7 +1,12 @@
 import pytest
 from pydantic import ValidationError
 
-from everest_models.jobs.shared.models.economics import CurrencyRate, EconomicConfig
+from everest_models.jobs.shared.models.economics import (
+    CurrencyRate,
+    EconomicConfig,
+    Rate,
+    rate_records,
+)
 
 
 def test_economic_currency_bad():
@@ -39,3 +44,23 @@ def test_economic_config_defaults():
     assert config.ref_date is None
     assert not config.discount_rates and isinstance(config.discount_rates, tuple)
     assert not config.well_costs and isinstance(config.well_costs, tuple)
+
+
+def test_rate_records():
+    rates = [
+        CurrencyRate.model_validate({"date": date, "value": value, "currency": "USD"})
+        for date, value in (
+            ("1999-01-01", 1.0),
+            ("2001-01-01", 2.0),
+            ("1999-01-01", 3.0),
+        )
+    ]
+
+    records = rate_records(rates)
+
+    assert [(str(rate.date), rate.value) for rate in records] == [
+        ("2001-01-01", 2.0),
+        ("1999-01-01", 1.0),
+        ("1999-01-01", 3.0),
+    ]
+    assert all(isinstance(rate, Rate) and rate.currency == "USD" for rate in records)
@@ -139,3 +139,66 @@ def test_well_model_from_controls(control_dict):
     for item in control_model:
         assert isinstance(item, Well)
     assert [item.name for item in control_model] == ["WELL1", "WELL2"]
+
+
+def test_operation_model_based_fields():
+    operation = Operation.model_validate(
+        {
+            "date": "2019-09-15",
+            "opname": "rate",
+            "phase": "water",
+            "rate": "2.5",
+            "tokens": {"rate": 1.0, "s": 12},
+        }
+    )
+    assert operation.tokens == {"phase": PhaseEnum.WATER, "rate": 2.5, "s": 12}
+    assert not operation.model_extra
+    assert operation.model_fields_set == {"date", "opname", "tokens"}
+
+
+@pytest.mark.parametrize(
+    "data, match",
+    (
+        pytest.param(
+            {"z": 3.3, "rate": 1.0}, r"Extra field\(s\) not allowed: z", id="extra"
+        ),
+        pytest.param({"rate": "r"}, r"tokens\.rate\n\s+Input should be", id="rate"),
+        pytest.param({"opname": "..."}, "Please replace any", id="ellipses"),
+    ),
+)
+def test_operation_model_based_fields_error(data, match):
+    with pytest.raises(ValidationError, match=match):
+        Operation.model_validate({"date": "2019-09-15", "opname": "rate", **data})
+
+
+def test_wells_model_validate_json(well_dict):
+    wells = Wells.model_validate(well_dict)
+    assert (
+        Wells.model_validate_json(
+            wells.model_dump_json(by_alias=True, exclude_none=True)
+        )
+        == wells
+    )
+    assert Wells.model_validate_json('{"WELL1": 0.0}')[0].name == "WELL1"
+
+
+@pytest.mark.parametrize(
+    "environment, compact",
+    [
+        ({}, False),
+        ({"_ERT_REALIZATION_NUMBER": "0"}, True),
+        ({"_ERT_REALIZATION_NUMBER": "0", "EVEREST_MODELS_COMPACT_OUTPUT": "0"}, False),
+        ({"EVEREST_MODELS_COMPACT_OUTPUT": "true"}, True),
+    ],
+)
+def test_wells_model_json_dump(well_model, tmp_path, monkeypatch, environment, compact):
+    monkeypatch.delenv("_ERT_REALIZATION_NUMBER", raising=False)
+    monkeypatch.delenv("EVEREST_MODELS_COMPACT_OUTPUT", raising=False)
+    for name, value in environment.items():
+        monkeypatch.setenv(name, value)
+    output = tmp_path / "wells.json"
+
+    well_model.json_dump(output)
+
+    assert ("\n" not in output.read_text()) is compact
+    assert Wells.model_validate_json(output.read_bytes()) == well_model
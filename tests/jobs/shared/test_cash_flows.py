@@ -0,0 +1,27 @@
+from datetime import date
+
+import pytest
+
+from everest_models.jobs.shared.cash_flows import CashFlow, cash_flows
+
+
+def test_cash_flows_merge_costs_by_date():
+    flows = cash_flows(
+        ("FOPT", "FGPT"),
+        revenues=[
+            (date(2000, 1, 2), (10.0, 2.0), 1.0),
+            (date(2000, 1, 3), (20.0, 4.0), 2.0),
+        ],
+        costs=[
+            (date(2000, 1, 3), 4.0, 2.0),
+            (date(1999, 12, 1), 5.0, 0.5),
+            (date(2000, 1, 3), 2.0, 2.0),
+        ],
+        multiplier=2,
+    )
+
+    assert flows == (
+        CashFlow(date(1999, 12, 1), (0.0, 0.0), 5.0, 2.0, pytest.approx(-20.0)),
+        CashFlow(date(2000, 1, 2), (10.0, 2.0), 0.0, 1.0, pytest.approx(4.0)),
+        CashFlow(date(2000, 1, 3), (20.0, 4.0), 6.0, 0.5, pytest.approx(22.0)),
+    )
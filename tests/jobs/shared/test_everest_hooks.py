@@ -0,0 +1,59 @@
+import importlib
+
+import pytest
+
+pytest.importorskip("pluggy")
+
+from everest_models import everest_hooks  # noqa: E402
+from everest_models.forward_models import get_forward_models  # noqa: E402
+
+
+@pytest.fixture
+def imported_modules(monkeypatch):
+    for cached in (
+        everest_hooks._forward_models_schemas,
+        everest_hooks._forward_model_documentations,
+        everest_hooks._skip_type_parser,
+    ):
+        cached.cache_clear()
+    modules = []
+
+    def import_module(name, *args, **kwargs):
+        modules.append(name)
+        return importlib.import_module(name, *args, **kwargs)
+
+    monkeypatch.setattr(everest_hooks, "import_module", import_module)
+    return modules
+
+
+def test_forward_models_schemas_cached(imported_modules):
+    schemas = everest_hooks.get_forward_models_schemas()
+    schemas.pop("well_trajectory")
+
+    assert "well_trajectory" in everest_hooks.get_forward_models_schemas()
+    assert len(imported_modules) == len(get_forward_models())
+
+
+def test_forward_model_documentations_cached(imported_modules):
+    docs = everest_hooks.get_forward_model_documentations()
+    docs["rf"]["cmd_name"] = "changed"
+
+    assert everest_hooks.get_forward_model_documentations()["rf"] == {
+        "cmd_name": "fm_rf",
+        "examples": None,
+        "full_job_name": "Recovery factor",
+    }
+    assert len(imported_modules) == len(get_forward_models())
+
+
+def test_check_forward_model_arguments_reuses_parsers(imported_modules, capsys):
+    steps = ["rf -s TEST -o rf_result", "unknown_job --any", "rf -s OTHER"]
+    for _ in range(3):
+        everest_hooks.check_forward_model_arguments(steps)
+    assert imported_modules == ["everest_models.jobs.fm_rf.parser"]
+
+    with pytest.raises(SystemExit):
+        everest_hooks.check_forward_model_arguments(["rf -o rf_result"])
+    assert "fm_rf: error: the following arguments are required: -s/--summary" in (
+        capsys.readouterr().err
+    )
@@ -0,0 +1,182 @@
+import multiprocessing
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from everest_models import runner
+
+
+def _stand_in(args: list[str]) -> int:
+    """Stand-in forward model step, recording where and how it ran."""
+    Path("step.txt").write_text(
+        f"{os.getpid()} {os.environ.get('STEP_ENV')} {' '.join(sys.argv)}"
+    )
+    print(f"stand-in {' '.join(args)}")  # noqa: T201
+    if args[0] == "crash":
+        os.kill(os.getpid(), signal.SIGKILL)
+    if args[0] == "exit":
+        sys.exit("stand-in failed")
+    return int(args[0])
+
+
+@pytest.fixture
+def stand_in(monkeypatch, tmp_path):
+    monkeypatch.setattr(runner, "_entry_point", lambda job: _stand_in)
+    monkeypatch.setattr(sys, "argv", ["/usr/bin/fm_stand_in"])
+    monkeypatch.setenv(runner.SOCKET_ENV, str(tmp_path / "runner.sock"))
+    monkeypatch.setenv("STEP_ENV", "client")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def _serve(path: Path, jobs: list[str]) -> None:
+    # Steps write to the streams of the daemon, not those captured by pytest
+    sys.stdout, sys.stderr = sys.__stdout__, sys.__stderr__
+    runner.serve(path, jobs)
+
+
+def _start_daemon(jobs: list[str]) -> multiprocessing.Process:
+    path = runner.default_socket_path()
+    process = multiprocessing.get_context("fork").Process(
+        target=_serve, args=(path, jobs), daemon=True
+    )
+    process.start()
+    while True:
+        with socket.socket(socket.AF_UNIX) as probe:
+            if not probe.connect_ex(str(path)):
+                return process
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def daemon(stand_in):
+    process = _start_daemon([])
+    yield process
+    process.terminate()
+    process.join()
+
+
+def _step_record() -> tuple[int, str, str]:
+    pid, env, argv = Path("step.txt").read_text().split(" ", 2)
+    return int(pid), env, argv
+
+
+def test_runner_without_daemon(stand_in, capfd):
+    assert runner.main_entry_point(["3", "--flag"]) == 3
+
+    assert _step_record() == (os.getpid(), "client", "fm_stand_in 3 --flag")
+    assert capfd.readouterr().out == "stand-in 3 --flag\n"
+
+
+def test_runner_stale_socket(stand_in):
+    runner.default_socket_path().touch()
+
+    assert runner.main_entry_point(["0"]) == 0
+    assert _step_record()[0] == os.getpid()
+
+
+def test_runner_daemon(daemon, capfd, monkeypatch):
+    monkeypatch.setenv("STEP_ENV", "changed")
+
+    assert runner.main_entry_point(["2"]) == 2
+
+    pid, env, argv = _step_record()
+    assert pid not in {os.getpid(), daemon.pid}
+    assert (env, argv) == ("changed", "fm_stand_in 2")
+    assert capfd.readouterr().out == "stand-in 2\n"
+
+
+def test_runner_daemon_exit(daemon, capfd):
+    assert runner.main_entry_point(["exit"]) == 1
+    assert capfd.readouterr().err == "stand-in failed\n"
+    assert runner.main_entry_point(["crash"]) == 128 + signal.SIGKILL
+    # The daemon is not affected by its steps
+    assert runner.main_entry_point(["0"]) == 0
+
+
+def test_runner_daemon_other_user(daemon, monkeypatch):
+    monkeypatch.setattr(os, "getuid", lambda: os.geteuid() + 1)
+
+    assert runner.main_entry_point(["0"]) == 0
+    assert _step_record()[0] == os.getpid()
+
+
+def test_runner_daemon_other_version(daemon, monkeypatch):
+    identity = runner._identity
+    monkeypatch.setattr(
+        runner, "_identity", lambda: {"version": "0.0.0", "executable": "python"}
+    )
+
+    assert runner.main_entry_point(["0"]) == 0
+    assert _step_record()[0] == os.getpid()
+    # The daemon is not affected by refused requests
+    monkeypatch.setattr(runner, "_identity", identity)
+    assert runner.main_entry_point(["0"]) == 0
+    assert _step_record()[0] != os.getpid()
+
+
+def test_runner_default_socket_path(monkeypatch, tmp_path):
+    monkeypatch.delenv(runner.SOCKET_ENV, raising=False)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    assert runner.default_socket_path() == tmp_path / "everest-models-runner.sock"
+
+    monkeypatch.delenv("XDG_RUNTIME_DIR")
+    monkeypatch.setattr(runner.tempfile, "gettempdir", lambda: str(tmp_path))
+    path = runner.default_socket_path()
+    assert path.parent == tmp_path / f"everest-models-runner-{os.getuid()}"
+
+
+def test_runner_daemon_shared_directory(tmp_path):
+    tmp_path.chmod(0o777)
+    with pytest.raises(RuntimeError, match="not writable by others"):
+        runner.serve(tmp_path / "runner.sock")
+
+
+def test_runner_daemon_already_running(daemon):
+    with pytest.raises(RuntimeError, match="already listening"):
+        runner.serve(runner.default_socket_path())
+
+
+def test_runner_unknown_job(monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["fm_unknown"])
+    with pytest.raises(SystemExit, match="Unknown forward model step: fm_unknown"):
+        runner._entry_point("fm_unknown")
+
+
+def _step_seconds(job: str, *args: str) -> float:
+    start = time.perf_counter()
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            (
+                f"import sys; sys.argv[0] = {job!r}; "
+                "from everest_models.runner import main_entry_point; "
+                "sys.exit(main_entry_point())"
+            ),
+            *args,
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return time.perf_counter() - start
+
+
+@pytest.mark.slow
+def test_runner_daemon_step_overhead(monkeypatch, tmp_path):
+    monkeypatch.setenv(runner.SOCKET_ENV, str(tmp_path / "runner.sock"))
+    in_process = min(_step_seconds("fm_npv", "--help") for _ in range(3))
+    process = _start_daemon(["fm_npv"])
+    try:
+        daemon = min(_step_seconds("fm_npv", "--help") for _ in range(3))
+    finally:
+        process.terminate()
+        process.join()
+    print(f"in-process {1000 * in_process:.1f} ms, daemon {1000 * daemon:.1f} ms")  # noqa: T201
+    assert daemon < in_process / 2
@@ -0,0 +1,120 @@
+import json
+import subprocess
+import sys
+import tomllib
+from pathlib import Path
+
+import pytest
+
+PYPROJECT = Path(__file__).parents[3] / "pyproject.toml"
+SCRIPTS = tomllib.loads(PYPROJECT.read_text())["project"]["scripts"]
+# All steps are installed as the runner client, which runs the step cli
+CONSOLE_SCRIPTS = {
+    name: f"everest_models.jobs.{name}.cli"
+    for name in SCRIPTS
+    if name.startswith("fm_")
+}
+HEAVY_MODULES = ("ortools", "pandas", "resdata", "scipy", "stea")
+
+
+def _imported_modules(module: str) -> list[str]:
+    return json.loads(
+        subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                f"import json, sys, {module}; print(json.dumps(list(sys.modules)))",
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+    )
+
+
+def _import_time(module: str) -> float:
+    """Cumulative import time of a module in seconds, as reported by -X importtime."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stderr
+    return int(stderr.splitlines()[-1].split("|")[1]) / 1e6
+
+
+# The schedule pipeline runs other jobs
+@pytest.mark.parametrize(
+    "job", sorted(CONSOLE_SCRIPTS.keys() - {"fm_schedule_pipeline"})
+)
+def test_job_does_not_import_other_jobs(job):
+    other_jobs = [
+        module
+        for module in _imported_modules(CONSOLE_SCRIPTS[job])
+        if module.startswith("everest_models.jobs.fm_") and module.split(".")[2] != job
+    ]
+    assert not other_jobs
+
+
+@pytest.mark.parametrize("job", ["fm_interpret_well_drill", "fm_well_filter"])
+def test_short_jobs_skip_heavy_imports(job):
+    modules = _imported_modules(CONSOLE_SCRIPTS[job])
+    assert not [name for name in HEAVY_MODULES if name in modules]
+    assert "everest_models.everest_hooks" not in modules
+
+
+def test_runner_client_imports_no_jobs():
+    assert {entry_point.partition(":")[0] for entry_point in SCRIPTS.values()} == {
+        "everest_models.runner"
+    }
+    modules = _imported_modules("everest_models.runner")
+    assert not [name for name in modules if name.startswith("everest_models.jobs")]
+    assert not [name for name in (*HEAVY_MODULES, "pydantic") if name in modules]
+
+
+def _run_job_modules(job: str) -> list[str]:
+    """Modules imported when the console script runs the step in-process."""
+    return json.loads(
+        subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                (
+                    "import json, sys; from everest_models.runner import run_job; "
+                    f"run_job({job!r}, ['--help']); "
+                    "print(json.dumps(list(sys.modules)))"
+                ),
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.splitlines()[-1]
+    )
+
+
+@pytest.mark.parametrize("job", ["fm_interpret_well_drill", "fm_well_filter"])
+def test_runner_without_daemon_skips_plugin_imports(job):
+    modules = _run_job_modules(job)
+    assert f"everest_models.jobs.{job}.cli" in modules
+    assert not [
+        name
+        for name in ("ert", "everest_models.forward_models", *HEAVY_MODULES)
+        if name in modules
+    ]
+
+
+def test_interpret_well_drill_skips_pydantic():
+    assert "pydantic" not in _imported_modules(
+        CONSOLE_SCRIPTS["fm_interpret_well_drill"]
+    )
+
+
+@pytest.mark.slow
+def test_console_scripts_import_time():
+    times = {job: _import_time(module) for job, module in CONSOLE_SCRIPTS.items()}
+    times["runner"] = _import_time("everest_models.runner")
+    for job, seconds in sorted(times.items(), key=lambda item: item[1]):
+        print(f"{job:30s} {1000 * seconds:8.1f} ms")  # noqa: T201
+    assert times["fm_interpret_well_drill"] < 0.25
+    assert times["fm_well_filter"] < 0.5
+    assert times["runner"] < 0.1
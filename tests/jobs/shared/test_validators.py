@@ -1,5 +1,7 @@
 import argparse
 import datetime
+import json
+import time
 from pathlib import Path
 
 import pytest
@@ -7,6 +9,7 @@ from hypothesis import given
 from hypothesis import strategies as st
 from pydantic import FilePath
 
+from everest_models.jobs.shared.models import Wells
 from everest_models.jobs.shared.models.base_config import ModelConfig, RootModelConfig
 from everest_models.jobs.shared.validators import (
     _prettify_validation_error_message,
@@ -194,3 +197,35 @@ field_a -> child:
 field_b -> index 5 -> sub -> child:
 \tnested"""
     )
+
+
+def test_parse_file_json(switch_cwd_tmp_path):
+    write_file("test.json", '{"WELL": {"1": 0.0}}')()
+    write_file("test.yml", "WELL: {1: 0.0}")()
+
+    assert parse_file("test.json", Wells) == parse_file("test.yml", Wells)
+
+
+@pytest.mark.slow
+def test_parse_file_wells_benchmark(switch_cwd_tmp_path):
+    operation = {"date": "2020-01-01", "opname": "rate"}
+    wells = [
+        {
+            "name": f"WELL{idx}",
+            "ops": [
+                {**operation, "phase": "WATER", "rate": 1.0},
+                {**operation, "tokens": {"phase": "GAS", "rate": 2.0}},
+            ]
+            * 50,
+        }
+        for idx in range(100)
+    ]
+    Path("wells.json").write_text(json.dumps(wells))
+
+    start = time.perf_counter()
+    assert sum(len(well.operations) for well in parse_file("wells.json", Wells)) == (
+        10000
+    )
+    seconds = time.perf_counter() - start
+    print(f"parse_file: {1000 * seconds:.1f} ms")  # noqa: T201
+    assert seconds < 0.5
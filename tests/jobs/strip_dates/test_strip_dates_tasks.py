@@ -1,5 +1,7 @@
 import datetime
 import filecmp
+import os
+from pathlib import Path
 
 import pytest
 from resdata.summary import Summary
@@ -39,3 +41,34 @@ def test_strip_dates_preserves_last_report_date(
     # from the original summary file
     assert len(ecl_sum_result.report_dates) == 1
     assert ecl_sum_result.report_dates[0] == strip_dates_summary.report_dates[-1]
+
+
+def test_strip_dates_leaves_no_files(
+    string_dates, strip_dates_summary, copy_testdata_tmpdir, monkeypatch
+):
+    copy_testdata_tmpdir(TEST_DATA)
+    files = sorted(Path().iterdir())
+    # Copy through the memory map, where copies in the kernel are not supported
+    monkeypatch.delattr(os, "copy_file_range", raising=False)
+
+    strip_dates(
+        strip_dates_summary.dates,
+        [datetime.date.fromisoformat(date) for date in string_dates],
+        SUMMARY_CASE,
+    )
+
+    assert sorted(Path().iterdir()) == files
+    assert filecmp.cmp(SUMMARY_CASE, "EGG-OUT.UNSMRY", shallow=False)
+
+
+def test_strip_dates_corrupt_summary(strip_dates_summary, copy_testdata_tmpdir):
+    copy_testdata_tmpdir(TEST_DATA)
+    data = Path(SUMMARY_CASE).read_bytes()
+    Path(SUMMARY_CASE).write_bytes(data[:-1])
+    files = sorted(Path().iterdir())
+
+    with pytest.raises(RuntimeError, match="Corrupt record in summary file"):
+        strip_dates(strip_dates_summary.dates, [], SUMMARY_CASE)
+
+    assert sorted(Path().iterdir()) == files
+    assert Path(SUMMARY_CASE).read_bytes() == data[:-1]
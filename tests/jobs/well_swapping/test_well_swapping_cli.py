@@ -1,11 +1,12 @@
 import json
 from pathlib import Path
 
+import numpy as np
 import pytest
 from sub_testdata import WELL_SWAPPING as TEST_DATA
 
 from everest_models.jobs.fm_well_swapping.cli import main_entry_point
-from everest_models.jobs.shared.io_utils import load_json
+from everest_models.jobs.shared.io_utils import COMPACT_OUTPUT_ENV, load_json
 
 
 def test_well_swapping_main_entrypoint_run(copy_testdata_tmpdir) -> None:
@@ -28,6 +29,38 @@ def test_well_swapping_main_entrypoint_run(copy_testdata_tmpdir) -> None:
     assert Path("expected_output.json").read_bytes() == Path(output).read_bytes()
 
 
+def test_well_swapping_main_entrypoint_compact(copy_testdata_tmpdir, monkeypatch):
+    copy_testdata_tmpdir(TEST_DATA)
+    monkeypatch.setenv(COMPACT_OUTPUT_ENV, "1")
+    main_entry_point(
+        (
+            "--config",
+            "well_swap_config.yml",
+            "--priorities",
+            "priorities.json",
+            "--constraints",
+            "constraints.json",
+            "--output",
+            "output.json",
+            "--cases",
+            "wells.json",
+        )
+    )
+    expected = load_json("expected_output.json")
+    assert load_json("output.json") == expected
+    assert "\n" not in Path("output.json").read_text()
+
+    with np.load("output.npz") as sidecar:
+        history = dict(zip(sidecar["cases"].tolist(), sidecar["states"].T, strict=True))
+        assert {
+            well["name"]: [(op["date"], op["opname"]) for op in well["ops"]]
+            for well in expected
+        } == {
+            case: list(zip(sidecar["dates"].tolist(), states.tolist(), strict=True))
+            for case, states in history.items()
+        }
+
+
 def test_well_swapping_main_entrypoint_parse(copy_testdata_tmpdir) -> None:
     copy_testdata_tmpdir(TEST_DATA)
     files = tuple(Path().glob("*.*"))
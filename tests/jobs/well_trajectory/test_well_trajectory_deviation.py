@@ -0,0 +1,78 @@
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from sub_testdata import WELL_TRAJECTORY as TEST_DATA
+
+from everest_models.jobs.fm_well_trajectory.deviation import (
+    read_deviation_file,
+    read_well_length,
+)
+from everest_models.jobs.fm_well_trajectory.well_lengths import compute_well_lengths
+
+
+@pytest.mark.parametrize(
+    "well, points, length",
+    (
+        pytest.param("read_laterals/wellpaths/INJ.dev", 1687, 8425.0, id="resinsight"),
+        pytest.param("simple/expected/wellpaths/OP_4.dev", 51, 1702.1895, id="simple"),
+    ),
+)
+def test_read_deviation_file(well, points, length, path_test_data):
+    deviation = read_deviation_file(path_test_data / TEST_DATA / well)
+
+    assert all(len(values) == points for values in deviation)
+    assert deviation.mdmsl[-1] == length
+    assert deviation.tvdmsl[0] == 0.0
+    assert not deviation.x.flags.writeable
+
+
+def test_read_deviation_file_cached(copy_testdata_tmpdir):
+    copy_testdata_tmpdir(Path(TEST_DATA) / "simple" / "expected")
+    path = Path("wellpaths/OP_4.dev")
+
+    deviation = read_deviation_file(path)
+    assert read_deviation_file(path) is deviation
+    assert read_well_length("OP_4") == deviation.mdmsl[-1]
+
+    text = path.read_text(encoding="utf-8").replace("1702.1895", "1800.0000")
+    path.write_text(text, encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert read_deviation_file(path).mdmsl[-1] == 1800.0
+    assert read_well_length("MISSING") == 0.0
+
+
+@pytest.mark.parametrize(
+    "content",
+    (
+        pytest.param(
+            "WELLNAME OP_1\n"
+            "0.0 0.0 0.0 0.0\n"
+            "0.0 0.0 200.0 200.0\n"
+            "10.0 0.0 300.0 310.0\n"
+            "-999\n",
+            id="simple",
+        ),
+        pytest.param(
+            "WELLNAME: 'OP_1'\n"
+            "# X Y TVDMSL MDMSL\n"
+            "0.0 0.0 0.0 0.0\n"
+            "0.0 0.0 200.0 200.0\n"
+            "10.0 0.0 300.0 310.0\n"
+            "-999\n"
+            "\n",
+            id="with header",
+        ),
+    ),
+)
+def test_read_well_length_last_point(content, switch_cwd_tmp_path):
+    # Deviation files written in simple mode have no header and no trailing
+    # line, their last point was dropped before
+    Path("wellpaths").mkdir()
+    Path("wellpaths/OP_1.dev").write_text(content, encoding="utf-8")
+
+    assert read_well_length("OP_1") == 310.0
+    assert compute_well_lengths([SimpleNamespace(name="OP_1")]) == {"OP_1": 0.31}
@@ -0,0 +1,43 @@
+import math
+
+import numpy as np
+
+from everest_models.jobs.fm_well_trajectory.dogleg import compute_dogleg_severity
+from everest_models.jobs.fm_well_trajectory.geometry import (
+    compute_batch_geometry,
+    stack_trajectories,
+)
+from everest_models.jobs.fm_well_trajectory.models.data_structs import Trajectory
+
+
+def test_compute_batch_geometry():
+    vertical_then_east = Trajectory(
+        x=np.array([10.0, 10.0, 10.0, 40.0]),
+        y=np.array([20.0, 20.0, 20.0, 20.0]),
+        z=np.array([0.0, 30.0, 60.0, 60.0]),
+    )
+    south_west = Trajectory(
+        x=np.array([0.0, 0.0, -30.0, -30.0]),
+        y=np.array([0.0, -30.0, -30.0, -30.0]),
+        z=np.array([0.0, 0.0, 0.0, 40.0]),
+    )
+    points = stack_trajectories([vertical_then_east, south_west])
+    assert points.shape == (2, 4, 3)
+
+    first, second = compute_batch_geometry(points)
+    assert np.allclose(first.inclination, [0.0, 0.0, math.pi / 2, math.pi / 2])
+    assert np.allclose(first.azimuth, [0.0, 0.0, math.pi / 2, math.pi / 2])
+    assert np.allclose(first.length, [0.0, 30.0, 60.0, 90.0])
+    assert np.allclose(first.deviation[0], [0.0, 0.0, 0.0, 30.0])
+    assert np.allclose(second.azimuth, [math.pi, 3 * math.pi / 2, 0.0, 0.0])
+    assert np.allclose(second.deviation[1], [0.0, -30.0, -30.0, -30.0])
+
+    for trajectory, result in zip(
+        (vertical_then_east, south_west), (first, second), strict=True
+    ):
+        assert np.array_equal(result.dogleg, compute_dogleg_severity(trajectory))
+        assert all(
+            np.array_equal(coordinate, expected)
+            for coordinate, expected in zip(result.coordinates, trajectory, strict=True)
+        )
+        assert result.inclination.base is not None
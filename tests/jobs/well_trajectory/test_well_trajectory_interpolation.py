@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+from scipy.interpolate import PchipInterpolator
+
+from everest_models.jobs.fm_well_trajectory.interpolation import (
+    GuidePointInterpolator,
+    interpolate_points,
+)
+from everest_models.jobs.fm_well_trajectory.models.data_structs import Trajectory
+
+
+@pytest.mark.parametrize(
+    "guide_points",
+    (
+        pytest.param(
+            Trajectory(
+                x=np.array([461350.5, 461350.5, 461600.0, 461100.0, 462400.0]),
+                y=np.array([5931800.7, 5931800.7, 5931650.0, 5932400.0, 5932700.0]),
+                z=np.array([0.0, 200.0, 1000.0, 1600.0, 1900.0]),
+            ),
+            id="well",
+        ),
+        pytest.param(
+            Trajectory(
+                x=np.array([0.0, 0.0]), y=np.array([0.0, 0.0]), z=np.array([0.0, 300.0])
+            ),
+            id="kickoff only",
+        ),
+    ),
+)
+def test_guide_point_interpolator(guide_points):
+    interpolator = GuidePointInterpolator(guide_points)
+    s = interpolator.arc_length
+    assert s[0] == 0.0
+    assert np.all(np.diff(s) > 0)
+
+    stations = np.linspace(s[0], s[-1], 37)
+    for coordinate, values in zip(interpolator(stations), guide_points, strict=True):
+        assert np.array_equal(coordinate, PchipInterpolator(s, values)(stations))
+
+    resampled = interpolate_points(guide_points, 10)
+    assert all(len(coordinate) == 11 for coordinate in resampled)
+    assert resampled.z[0] == guide_points.z[0]
+    assert resampled.z[1] == guide_points.z[1]
+    assert np.isclose(resampled.z[-1], guide_points.z[-1])
+
+
+def test_guide_point_interpolator_duplicate_points():
+    guide_points = Trajectory(
+        x=np.array([0.0, 0.0, 250.0, 250.0]),
+        y=np.array([0.0, 0.0, -150.0, -150.0]),
+        z=np.array([0.0, 300.0, 1000.0, 1000.0]),
+    )
+    with pytest.raises(ValueError, match="strictly increasing"):
+        GuidePointInterpolator(guide_points)
@@ -0,0 +1,105 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from sub_testdata import WELL_TRAJECTORY as TEST_DATA
+
+from everest_models.jobs.fm_well_trajectory.models.config import PerforationConfig
+from everest_models.jobs.fm_well_trajectory.resinsight import (
+    _perforation_intervals,
+    _read_and_merge_las,
+    _read_las_file,
+    _select_perforations,
+)
+
+lasio = pytest.importorskip("lasio")
+
+
+def test_read_las_file_matches_lasio(path_test_data):
+    files = sorted(
+        (path_test_data / TEST_DATA / "resinsight" / "las_files").glob("*.las")
+    )
+    assert files
+    for path in files:
+        pd.testing.assert_frame_equal(
+            _read_las_file(path), lasio.read(path).df().reset_index(), check_dtype=False
+        )
+
+
+def test_read_las_file_curves(copy_testdata_tmpdir):
+    copy_testdata_tmpdir(Path(TEST_DATA) / "resinsight" / "las_files")
+    path = Path("PROD_SPE1CASE1-02_Jan_2015.las")
+    path.write_text(path.read_text().replace("0.879900 4780.948", "-999.25 4780.948"))
+
+    df = _read_las_file(path, {"SOIL", "PORO"})
+
+    assert df.columns.tolist() == ["DEPTH", "SOIL"]
+    assert np.isnan(df["SOIL"]).tolist() == [False, False, True, True, False, False]
+
+
+def test_read_wrapped_las_file(copy_testdata_tmpdir):
+    copy_testdata_tmpdir(Path(TEST_DATA) / "resinsight" / "las_files")
+    path = Path("PROD_SPE1CASE1-02_Jan_2015.las")
+    expected = _read_las_file(path)
+    text = path.read_text().replace("WRAP . NO :", "WRAP . YES :")
+    path.write_text(text.replace(" 0.879", "\n0.879"))
+
+    pd.testing.assert_frame_equal(_read_las_file(path), expected, check_dtype=False)
+
+
+def test_read_and_merge_las_curves(copy_testdata_tmpdir):
+    test_dir = copy_testdata_tmpdir(Path(TEST_DATA) / "resinsight" / "las_files")
+
+    df = _read_and_merge_las(test_dir, "PROD", {"DEPTH", "TVDMSL", "TVDRKB", "SOIL"})
+
+    assert df.columns.tolist() == ["DEPTH", "TVDMSL", "TVDRKB", "SOIL"]
+    assert len(df) == 6
+
+
+@pytest.mark.parametrize(
+    ("mask", "starts", "ends"),
+    (
+        ([1, 1, 1, 1, 1, 1, 1, 1], [0.0], [4.0]),
+        ([1, 1, 0, 0, 1, 1, 1, 1], [0.0, 2.0], [1.0, 4.0]),
+        ([0, 1, 1, 1, 1, 0, 0, 0], [1.0], [2.0]),
+        ([1, 0, 1, 0, 0, 0, 0, 1], [], []),
+        ([0, 0, 0, 0, 0, 0, 0, 0], [], []),
+    ),
+)
+def test_perforation_intervals(mask, starts, ends):
+    depths = np.array([0.0, 1.0, 1.0, 2.0, 2.0, 3.0, 3.0, 4.0])
+
+    result = _perforation_intervals(depths, np.array(mask, dtype=bool))
+
+    np.testing.assert_array_equal(result[0], starts)
+    np.testing.assert_array_equal(result[1], ends)
+
+
+def test_select_perforations():
+    df = pd.DataFrame(
+        {
+            "DEPTH": [10.0, 20.0, 20.0, 30.0, 30.0, 40.0, 40.0, 50.0],
+            "ACTIVE_FORMATION_NAMES": [0.0, 0.0, 1.0, 1.0, 1.0, 1.0, 2.0, 2.0],
+            "PORO": [0.3, 0.3, 0.2, 0.2, np.nan, np.nan, 0.3, 0.3],
+        }
+    )
+    perforation = PerforationConfig(
+        well="PROD",
+        formations=(1, 2),
+        static=({"key": "PORO", "min": 0.1, "max": 0.5},),
+    )
+
+    starts, ends, well_depth = _select_perforations(perforation, df)
+
+    assert starts.tolist() == [20.0, 40.0]
+    assert ends.tolist() == [30.0, 50.0]
+    assert well_depth == 50.0
+
+
+def test_select_perforations_empty_log():
+    starts, ends, well_depth = _select_perforations(
+        PerforationConfig(well="PROD"), pd.DataFrame(columns=["DEPTH"])
+    )
+    assert starts.size == ends.size == 0
+    assert well_depth is None
@@ -20,7 +20,7 @@ def test_interpolation_config():
         InterpolationConfig.model_validate({"type": "simple", "measured_depth_step": 1})
     with pytest.raises(
         ValidationError,
-        match=r"Interpolation type 'resinsight': fields not allowed: \['length', 'trial_number', 'trial_step'\]",
+        match=r"Interpolation type 'resinsight': fields not allowed: \['length', 'trial_number', 'trial_step', 'dogleg_repair', 'workers'\]",
     ):
         InterpolationConfig.model_validate(
             {"type": "resinsight", "length": 1, "trial_step": 0.1}
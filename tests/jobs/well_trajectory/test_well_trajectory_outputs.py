@@ -0,0 +1,127 @@
+import math
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from everest_models.jobs.fm_well_trajectory.geometry import compute_batch_geometry
+from everest_models.jobs.fm_well_trajectory.outputs import (
+    write_path_files,
+    write_resinsight,
+    write_wicalc,
+)
+
+
+def _results(wells: int, points: int):
+    rng = np.random.default_rng(123)
+    coordinates = np.cumsum(rng.normal(scale=30.0, size=(wells, points, 3)), axis=1)
+    coordinates += [461350.5, 5931800.7, 0.0]
+    return dict(
+        zip(
+            (f"W_{idx}" for idx in range(wells)),
+            compute_batch_geometry(coordinates),
+            strict=True,
+        )
+    )
+
+
+def _write_reference(wells, results) -> None:
+    # Point by point formatting, as the outputs used to be written
+    def join(*values):
+        return "\t".join(f"{value:f}" for value in values)
+
+    with Path("well_geometry.txt").open("w", encoding="utf-8") as file_obj:
+        for well, result in results.items():
+            file_obj.writelines(
+                f"{well}\t"
+                + join(
+                    *(coordinate[idx] for coordinate in result.coordinates),
+                    *(coordinate[idx + 1] for coordinate in result.coordinates),
+                    result.length[idx],
+                    result.length[idx + 1],
+                    wells[well].radius,
+                    wells[well].skin,
+                )
+                + "\n"
+                for idx in range(len(result.length) - 1)
+            )
+    Path("wellpaths").mkdir()
+    for well, result in results.items():
+        with Path(f"wellpaths/{well}.dev").open("w", encoding="utf-8") as file_obj:
+            file_obj.write(f"WELLNAME {well}\n")
+            file_obj.writelines(
+                "".join(f"{c[idx]:<24.4f}" for c in result.coordinates)
+                + f"{result.length[idx]:.4f}\n"
+                for idx in range(len(result.length))
+            )
+            file_obj.write("-999\n")
+        with Path(f"PATH_{well}.txt").open("w", encoding="utf-8") as file_obj:
+            for idx in range(len(result.length)):
+                azimuth = result.azimuth[idx] * 180 / math.pi
+                file_obj.write(
+                    join(
+                        result.length[idx],
+                        *(coordinate[idx] for coordinate in result.coordinates),
+                        *(deviation[idx] for deviation in result.deviation),
+                        azimuth if azimuth >= 0 else azimuth + 360,
+                        result.inclination[idx] * 180 / math.pi,
+                        result.dogleg[idx],
+                    )
+                    + "\n"
+                )
+
+
+def _write(wells, results) -> None:
+    write_wicalc(wells, results, Path("well_geometry.txt"))
+    write_resinsight(results)
+    write_path_files(
+        (Path(f"PATH_{well}.txt"), result) for well, result in results.items()
+    )
+
+
+def _written(directory: Path) -> dict[str, str]:
+    return {
+        str(path.relative_to(directory)): path.read_text(encoding="utf-8")
+        for path in sorted(directory.glob("**/*"))
+        if path.is_file()
+    }
+
+
+def _write_both(tmp_path, monkeypatch, wells, results):
+    elapsed = {}
+    for name, writer in (("reference", _write_reference), ("outputs", _write)):
+        (tmp_path / name).mkdir()
+        monkeypatch.chdir(tmp_path / name)
+        start = time.perf_counter()
+        writer(wells, results)
+        elapsed[name] = time.perf_counter() - start
+    return elapsed
+
+
+def test_write_outputs_byte_identical(tmp_path, monkeypatch):
+    results = _results(wells=3, points=25)
+    results["W_0"].coordinates.z[3] = np.nan
+    results["W_1"].azimuth[:] = -results["W_1"].azimuth
+    wells = {
+        well: SimpleNamespace(radius=0.15, skin=skin)
+        for well, skin in zip(results, (0.0, -1.5, 2), strict=True)
+    }
+
+    _write_both(tmp_path, monkeypatch, wells, results)
+
+    reference = _written(tmp_path / "reference")
+    assert len(reference) == 7
+    assert _written(tmp_path / "outputs") == reference
+
+
+@pytest.mark.slow
+def test_write_outputs_benchmark(tmp_path, monkeypatch):
+    results = _results(wells=20, points=5000)
+    wells = {well: SimpleNamespace(radius=0.15, skin=0.0) for well in results}
+
+    elapsed = _write_both(tmp_path, monkeypatch, wells, results)
+
+    assert _written(tmp_path / "outputs") == _written(tmp_path / "reference")
+    assert elapsed["outputs"] * 2 < elapsed["reference"], elapsed
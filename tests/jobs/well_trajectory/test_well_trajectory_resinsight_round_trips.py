@@ -0,0 +1,166 @@
+import collections
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from everest_models.jobs.fm_well_trajectory import resinsight
+from everest_models.jobs.fm_well_trajectory.models.data_structs import Trajectory
+
+
+class _FakeChannel:
+    """Channel answering every call locally, recording the called methods."""
+
+    def __init__(self) -> None:
+        self.calls = []
+
+    def unary_unary(self, method: str, **_):
+        return lambda *_, **__: self.calls.append(method)
+
+
+class _Remote:
+    def __init__(self, channel, **fields) -> None:
+        self._channel = channel
+        self.__dict__.update(fields)
+
+    def _call(self, method: str, result=None):
+        self._channel.unary_unary(f"/rips.Service/{method}")(None)
+        return result
+
+    def channel(self):
+        return self._channel
+
+    def update(self) -> None:
+        self._call("Update")
+
+
+class _Target(_Remote):
+    pass
+
+
+class _Geometry(_Remote):
+    def append_well_target(self, coordinate, absolute):
+        return self._call(
+            "AppendWellTarget", _Target(self._channel, dogleg1=3.0, dogleg2=3.0)
+        )
+
+    def well_path_targets(self):
+        return self._call("WellPathTargets", [])
+
+
+class _WellPath(_Remote):
+    def well_path_geometry(self):
+        return self._call(
+            "WellPathGeometry", _Geometry(self._channel, reference_point=[0, 0, 0])
+        )
+
+    def append_lateral(self, md):
+        return self._call("AppendLateral", _WellPath(self._channel))
+
+
+class _Collection(_Remote):
+    def add_new_object(self, kind):
+        return self._call("AddNewObject", kind(self._channel))
+
+
+class _View(_Remote):
+    def set_time_step(self, *_):
+        self._call("SetTimeStep")
+
+
+class _Case(_Remote):
+    def create_view(self):
+        return self._call("CreateView", _View(self._channel))
+
+
+class _Project(_Remote):
+    @staticmethod
+    def create(channel):
+        return _Project(channel)._call("GetPdmObject", _Project(channel))
+
+    def cases(self):
+        return self._call("Cases", [_Case(self._channel)])
+
+    def descendants(self, kind):
+        return self._call("Descendants", [_Collection(self._channel)])
+
+
+@pytest.fixture
+def fake_rips(monkeypatch):
+    rips = SimpleNamespace(
+        Project=_Project,
+        WellPathCollection="WellPathCollection",
+        IntersectionCollection="IntersectionCollection",
+        ModeledWellPath=_WellPath,
+        CurveIntersection=_Remote,
+    )
+    monkeypatch.setattr(resinsight, "rips", rips, raising=False)
+    monkeypatch.setattr(resinsight, "_HAVE_RIPS", True)
+    return rips
+
+
+def _guide_points(n: int) -> Trajectory:
+    values = np.arange(n, dtype=np.float64)
+    return Trajectory(values, values, values)
+
+
+_CONNECTION = SimpleNamespace(perforations=(), formations_file=Path("formations"))
+
+
+def test_round_trip_counter(fake_rips):
+    channel = _FakeChannel()
+    counter = resinsight.RoundTripCounter()
+    project = counter.instrument(_Project(channel))
+    with counter.stage("test"):
+        project.cases()
+        project.descendants("WellPathCollection")
+        project.descendants("IntersectionCollection")
+
+    assert counter.total == len(channel.calls) == 4
+    assert counter.counts == {
+        "/rips.Service/GetPdmObject": 1,
+        "/rips.Service/Cases": 1,
+        "/rips.Service/Descendants": 2,
+    }
+
+
+@pytest.mark.parametrize(
+    ("dogleg", "target_updates"), ((3.0, 0), (4.0, 5)), ids=("default", "custom")
+)
+def test_create_wells_round_trips(fake_rips, dogleg, target_updates):
+    counter = resinsight.RoundTripCounter()
+    project = counter.instrument(_Project(_FakeChannel()))
+    wells = [SimpleNamespace(name=f"W{idx}", dogleg=dogleg) for idx in range(4)]
+
+    well_paths = resinsight.create_wells(
+        _CONNECTION, wells, {well.name: _guide_points(6) for well in wells}, project
+    )
+
+    assert list(well_paths) == ["W0", "W1", "W2", "W3"]
+    # The case and collections are fetched once for all wells:
+    assert counter.counts["/rips.Service/Cases"] == 1
+    assert counter.counts["/rips.Service/Descendants"] == 2
+    assert counter.counts["/rips.Service/AppendWellTarget"] == 4 * 5
+    # Well path, two geometry updates and an intersection per well:
+    assert counter.counts["/rips.Service/Update"] == 4 * (4 + target_updates)
+
+
+def test_create_branches_round_trips(fake_rips):
+    counter = resinsight.RoundTripCounter()
+    project = counter.instrument(_Project(_FakeChannel()))
+    wells = [SimpleNamespace(name=f"W{idx}", dogleg=3.0) for idx in range(3)]
+    well_paths = {well.name: _WellPath(project.channel()) for well in wells}
+    branches = {
+        "W0": {"1": (100.0, _guide_points(4)), "2": (200.0, _guide_points(4))},
+        "W2": {"1": (100.0, _guide_points(4))},
+    }
+
+    before = collections.Counter(counter.counts)
+    resinsight.create_branches(wells, well_paths, branches, project)
+    counts = counter.counts - before
+
+    assert counts["/rips.Service/Descendants"] == 1
+    assert counts["/rips.Service/AppendLateral"] == 3
+    assert counts["/rips.Service/AppendWellTarget"] == 3 * 3
+    assert counts["/rips.Service/Update"] == 3 * 2
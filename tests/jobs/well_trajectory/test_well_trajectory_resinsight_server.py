@@ -0,0 +1,210 @@
+import argparse
+import fcntl
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from everest_models.jobs.fm_well_trajectory import resinsight
+from everest_models.jobs.fm_well_trajectory import well_trajectory_resinsight as wtr
+from everest_models.jobs.fm_well_trajectory.parser import parse_resinsight_port
+
+
+class _FakeRipsError(Exception):
+    pass
+
+
+class _FakeObject:
+    def __init__(self) -> None:
+        self.deleted = False
+
+    def delete(self) -> None:
+        self.deleted = True
+
+
+class _FakeCase:
+    def __init__(self, file_path: str) -> None:
+        self.file_path = file_path
+        self._views = [_FakeObject()]
+
+    def views(self):
+        return [view for view in self._views if not view.deleted]
+
+
+class _FakeProject:
+    def __init__(self) -> None:
+        self.loaded = []
+        self._cases = []
+        self._objects = {}
+
+    def load_case(self, path: str):
+        self.loaded.append(path)
+        self._cases.append(case := _FakeCase(path))
+        return case
+
+    def close(self) -> None:
+        self._cases = []
+        self._objects = {}
+
+    def cases(self):
+        return list(self._cases)
+
+    def add(self, kind) -> _FakeObject:
+        self._objects.setdefault(kind, []).append(obj := _FakeObject())
+        return obj
+
+    def descendants(self, kind):
+        return [obj for obj in self._objects.get(kind, []) if not obj.deleted]
+
+    def well_paths(self):
+        return self.descendants("WellPath")
+
+    def update(self) -> None:
+        pass
+
+
+class _FakeRips:
+    """Stand-in for the rips module, serving a single long-lived instance."""
+
+    WellLogPlot = "WellLogPlot"
+    CurveIntersection = "CurveIntersection"
+    RipsError = _FakeRipsError
+
+    def __init__(self, port: int) -> None:
+        self.launches = 0
+        self.exits = 0
+        server = SimpleNamespace(project=_FakeProject(), exit=self._exit)
+        self.project = server.project
+
+        def connect(port: int = 50051):
+            if port != server_port:
+                msg = f"Could not connect to ResInsight at localhost:{port}"
+                raise _FakeRipsError(msg)
+            return server
+
+        def launch(*_, **__):
+            self.launches += 1
+            return server
+
+        server_port = port
+        self.Instance = connect
+        self.Instance.launch = launch
+
+    def _exit(self) -> None:
+        self.exits += 1
+
+
+@pytest.fixture
+def fake_rips(monkeypatch, tmp_path):
+    monkeypatch.setattr(wtr.tempfile, "gettempdir", lambda: str(tmp_path))
+    rips = _FakeRips(port=50123)
+    for module in (wtr, resinsight):
+        monkeypatch.setattr(module, "rips", rips, raising=False)
+        monkeypatch.setattr(module, "_HAVE_RIPS", True)
+    monkeypatch.setattr(wtr, "_RIPS_LAUNCH_ERROR", _FakeRipsError)
+    return rips
+
+
+def test_resinsight_server_reused(fake_rips, tmp_path):
+    grid = tmp_path / "MODEL.EGRID"
+    for _ in range(3):
+        with wtr.ResInsight(port=50123) as instance:
+            resinsight.load_case(instance.project, grid)
+            well_path = instance.project.add("WellPath")
+            plot = instance.project.add("WellLogPlot")
+        assert well_path.deleted
+        assert plot.deleted
+
+    assert fake_rips.launches == 0
+    assert fake_rips.exits == 0
+    assert fake_rips.project.loaded == [str(grid)]
+    assert not fake_rips.project.cases()[0].views()
+
+
+def test_resinsight_server_other_grid(fake_rips, tmp_path):
+    with wtr.ResInsight(port=50123) as instance:
+        resinsight.load_case(instance.project, tmp_path / "A.EGRID")
+        resinsight.load_case(instance.project, tmp_path / "B.EGRID")
+
+    assert [Path(case.file_path).name for case in fake_rips.project.cases()] == [
+        "B.EGRID"
+    ]
+
+
+def _write_model(runpath: Path, restart: bytes) -> Path:
+    runpath.mkdir()
+    (runpath / "MODEL.EGRID").write_bytes(b"grid")
+    (runpath / "MODEL.INIT").write_bytes(b"init")
+    (runpath / "MODEL.UNRST").write_bytes(restart)
+    return runpath / "MODEL.EGRID"
+
+
+def test_resinsight_server_shared_model(fake_rips, tmp_path):
+    grids = [
+        _write_model(tmp_path / f"realization-{realization}", b"restart")
+        for realization in range(3)
+    ]
+    for grid in grids:
+        with wtr.ResInsight(port=50123) as instance:
+            resinsight.load_case(instance.project, grid)
+
+    assert fake_rips.project.loaded == [str(grids[0])]
+
+
+def test_resinsight_server_model_per_realization(fake_rips, tmp_path):
+    grids = [
+        _write_model(tmp_path / f"realization-{realization}", bytes([realization]))
+        for realization in range(3)
+    ]
+    for grid in grids:
+        with wtr.ResInsight(port=50123) as instance:
+            resinsight.load_case(instance.project, grid)
+
+    assert fake_rips.project.loaded == [str(grid) for grid in grids]
+    assert len(fake_rips.project.cases()) == 1
+
+
+def _locked(port: int) -> bool:
+    fd = os.open(wtr._lock_path(port), os.O_RDWR)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        return True
+    finally:
+        os.close(fd)
+    return False
+
+
+def test_resinsight_server_locked(fake_rips):
+    with wtr.ResInsight(port=50123):
+        assert _locked(50123)
+    assert not _locked(50123)
+
+
+def test_resinsight_server_not_running(fake_rips):
+    with (
+        pytest.raises(ConnectionError, match="on port 50124"),
+        wtr.ResInsight(port=50124),
+    ):
+        pass
+    assert not _locked(50124)
+
+
+def test_resinsight_launched_without_server(fake_rips):
+    with wtr.ResInsight():
+        pass
+    assert fake_rips.launches == fake_rips.exits == 1
+
+
+def test_parse_resinsight_port(tmp_path):
+    port_file = tmp_path / "port"
+    port_file.write_text("50123\n")
+    assert parse_resinsight_port("50123") == 50123
+    assert parse_resinsight_port(str(port_file)) == 50123
+
+    port_file.write_text("not a port")
+    with pytest.raises(argparse.ArgumentTypeError, match="Invalid ResInsight port"):
+        parse_resinsight_port(str(port_file))
+    with pytest.raises(argparse.ArgumentTypeError, match="Cannot read"):
+        parse_resinsight_port(str(tmp_path / "missing"))
@@ -1,10 +1,21 @@
 import filecmp
+from functools import partial
 from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 from sub_testdata import WELL_TRAJECTORY as TEST_DATA
 
+from everest_models.jobs.fm_well_trajectory import dogleg, resinsight
 from everest_models.jobs.fm_well_trajectory.cli import main_entry_point
+from everest_models.jobs.fm_well_trajectory.dogleg import (
+    compute_dogleg_severity,
+    repair_dog_leg,
+)
+from everest_models.jobs.fm_well_trajectory.interpolation import interpolate_points
+from everest_models.jobs.fm_well_trajectory.models.data_structs import Trajectory
 from everest_models.jobs.shared import io_utils
 
 
@@ -26,6 +37,25 @@ def test_well_trajectory_simple_main_entry_point(
             assert filecmp.cmp(expected, output, shallow=False)
 
 
+def test_well_trajectory_simple_main_entry_point_workers(
+    well_trajectory_arguments, copy_testdata_tmpdir
+):
+    copy_testdata_tmpdir(Path(TEST_DATA) / "simple")
+
+    config = io_utils.load_yaml("config.yml")
+    config["interpolation"]["workers"] = 2
+    with Path("config.yml").open("w") as fp:
+        io_utils.dump_yaml(config, fp)
+
+    main_entry_point(well_trajectory_arguments)
+
+    for expected in Path("expected").glob("**/*"):
+        if expected.is_file() and expected.name != "wells.json":
+            output = expected.relative_to("expected")
+            assert output.is_file()
+            assert filecmp.cmp(expected, output, shallow=False)
+
+
 def test_well_trajectory_with_simple_main_entry_point_wells_file(
     well_trajectory_arguments, copy_testdata_tmpdir
 ):
@@ -45,6 +75,33 @@ def test_well_trajectory_with_simple_main_entry_point_wells_file(
             assert filecmp.cmp(expected, output, shallow=False)
 
 
+def test_well_trajectory_simple_main_entry_point_compact(
+    well_trajectory_arguments, copy_testdata_tmpdir, monkeypatch
+):
+    copy_testdata_tmpdir(Path(TEST_DATA) / "simple")
+    monkeypatch.setenv(io_utils.COMPACT_OUTPUT_ENV, "1")
+    main_entry_point(well_trajectory_arguments)
+
+    guide_points = io_utils.load_json("guide_points.json")
+    assert guide_points == io_utils.load_json("expected/guide_points.json")
+    assert "\n" not in Path("guide_points.json").read_text()
+    with np.load("guide_points.npz") as sidecar:
+        for well, coordinates in guide_points.items():
+            for name, values in zip("xyz", coordinates, strict=True):
+                assert sidecar[f"{well}/{name}"].tolist() == values
+    with np.load("well_geometry.npz") as sidecar:
+        for path in Path("expected").glob("PATH_*.txt"):
+            well = path.stem.removeprefix("PATH_")
+            expected = np.loadtxt(path)
+            for column, name in enumerate(("md", "x", "y", "z")):
+                np.testing.assert_allclose(
+                    sidecar[f"{well}/{name}"], expected[:, column], atol=1e-6
+                )
+            np.testing.assert_allclose(
+                np.degrees(sidecar[f"{well}/inclination"]), expected[:, 7], atol=1e-6
+            )
+
+
 def test_well_trajectory_simple_main_entry_point_lint(
     well_trajectory_arguments, copy_testdata_tmpdir
 ):
@@ -57,3 +114,86 @@ def test_well_trajectory_simple_main_entry_point_lint(
         for path in Path("expected").glob("**/*")
         if path.name != "wells.json"
     )
+
+
+@pytest.fixture
+def line_search_guide_points():
+    return Trajectory(
+        x=np.array([0.0, 0.0, 250.0, -400.0, 1200.0]),
+        y=np.array([0.0, 0.0, -150.0, 600.0, 900.0]),
+        z=np.array([0.0, 300.0, 1000.0, 1600.0, 1900.0]),
+    )
+
+
+def test_well_trajectory_simple_line_search_repair(line_search_guide_points):
+    guide_points = line_search_guide_points
+    interpolate = partial(interpolate_points, n=50)
+    assert np.amax(compute_dogleg_severity(interpolate(guide_points))) > 3.0
+
+    coordinates = repair_dog_leg(
+        guide_points, interpolate, dogleg=3.0, iterations=20, tolerance=0.01
+    )
+    assert coordinates is not None
+    assert np.amax(compute_dogleg_severity(coordinates)) < 3.0
+    assert coordinates.x[0] == coordinates.y[0] == coordinates.z[0] == 0.0
+
+
+def test_well_trajectory_simple_line_search_fallback_is_lazy(
+    line_search_guide_points, monkeypatch
+):
+    def most_violating_point(*_):
+        pytest.fail("The most violating point is only needed as a fallback")
+
+    monkeypatch.setattr(dogleg, "_identify_most_violating_point", most_violating_point)
+    assert (
+        repair_dog_leg(
+            line_search_guide_points,
+            partial(interpolate_points, n=50),
+            dogleg=3.0,
+            iterations=20,
+            tolerance=0.01,
+        )
+        is not None
+    )
+
+
+def test_well_trajectory_simple_line_search_degenerate(
+    line_search_guide_points, monkeypatch, caplog
+):
+    monkeypatch.setattr(dogleg, "_identify_violating_points", lambda *_: np.array([10]))
+    assert (
+        repair_dog_leg(
+            line_search_guide_points,
+            partial(interpolate_points, n=50),
+            dogleg=3.0,
+            iterations=20,
+            tolerance=0.01,
+        )
+        is None
+    )
+    assert "out of bounds" in caplog.text
+
+
+def test_well_trajectory_simple_import_wells_in_memory(monkeypatch):
+    collection = MagicMock()
+    project = MagicMock()
+    project.descendants.return_value = [collection]
+    monkeypatch.setattr(resinsight, "_HAVE_RIPS", True)
+    monkeypatch.setattr(
+        resinsight, "rips", SimpleNamespace(WellPathCollection=object), raising=False
+    )
+    trajectory = Trajectory(
+        x=np.array([1.0, 1.0, 2.0]),
+        y=np.array([3.0, 3.0, 4.0]),
+        z=np.array([0.0, 5.0, 6.0]),
+    )
+
+    assert resinsight.can_import_wells(project)
+    resinsight.import_wells(project, {"OP_1": trajectory}, None)
+
+    # ResInsight takes elevations, negative below the platform at depth 0
+    collection.import_well_path_from_points.assert_called_once_with(
+        "OP_1", [[1.0, 3.0, 0.0], [1.0, 3.0, -5.0], [2.0, 4.0, -6.0]]
+    )
+    project.import_well_paths.assert_not_called()
+    project.update.assert_called_once()